@@ -28,7 +28,11 @@ from .const import (
     STARTUP_MESSAGE,
 )
 from .coordinator import ZeekrCoordinator
-from .request_stats import ZeekrRequestStats
+from .request_stats import get_stats_service
+from .services import async_setup_services
+from .session import ZeekrSessionStore
+from .snapshot import ZeekrSnapshotStore
+from .transport import create_transport
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
@@ -61,6 +65,7 @@ def get_zeekr_client_class(use_local: bool = False):
 
 async def async_setup(hass: HomeAssistant, config: ConfigType):
     """Set up this integration using YAML is not supported."""
+    async_setup_services(hass)
     return True
 
 
@@ -111,49 +116,88 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             vin_iv=vin_iv,
             logger=_LOGGER,
         )
-        try:
-            # Count the login request
-            stats = ZeekrRequestStats(hass)
-            await stats.async_load()
-            await stats.async_inc_request()
-            await hass.async_add_executor_job(client.login)
-        except Exception as ex:
-            _LOGGER.error("Could not log in to Zeekr API: %s", ex)
-            raise ConfigEntryNotReady from ex
-
-    coordinator = ZeekrCoordinator(hass, client=client, entry=entry)
+
+    transport = create_transport(hass, entry, client)
+    coordinator = ZeekrCoordinator(hass, client=client, entry=entry, transport=transport)
     await coordinator.async_init_stats()
-    await coordinator.async_config_entry_first_refresh()
 
-    if coordinator.vehicles:
+    # Reuse the tokens of the last run; the client logs in again by itself
+    # if the API rejects them
+    if await coordinator.async_restore_session(username, password):
+        _LOGGER.debug("Restored the Zeekr API session of %s", username)
+
+    # With data saved by the last run the platforms are set up from it right
+    # away, and the login and first poll happen in the background
+    warm_start = await coordinator.async_restore_snapshot()
+
+    if warm_start:
         _LOGGER.info(
-            "Found %d vehicle(s): %s",
-            len(coordinator.vehicles),
-            ", ".join(v.vin for v in coordinator.vehicles),
+            "Starting with the saved data of %d vehicle(s): %s",
+            len(coordinator.data),
+            ", ".join(coordinator.data),
         )
     else:
-        _LOGGER.warning("No vehicles found in account")
+        if not client.logged_in:
+            try:
+                # Count the login request
+                await coordinator.request_stats.async_inc_request()
+                await coordinator.async_call_api(client.login)
+                coordinator.async_save_session()
+            except Exception as ex:
+                _LOGGER.error("Could not log in to Zeekr API: %s", ex)
+                await transport.async_shutdown()
+                raise ConfigEntryNotReady from ex
+
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except ConfigEntryNotReady:
+            await transport.async_shutdown()
+            raise
+
+        if coordinator.vehicles:
+            _LOGGER.info(
+                "Found %d vehicle(s): %s",
+                len(coordinator.vehicles),
+                ", ".join(v.vin for v in coordinator.vehicles),
+            )
+        else:
+            _LOGGER.warning("No vehicles found in account")
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    if warm_start:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh"
+        )
+
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Handle removal of an entry."""
-    coordinator = hass.data[DOMAIN].get(entry.entry_id)
-    if coordinator:
-        await coordinator.request_stats.async_shutdown()
+    """Handle removal of an entry.
 
+    The coordinator's shutdown runs after this, once the entry is unloaded;
+    it sends pending writes before stopping the transport.
+    """
     if unloaded := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
     return unloaded
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the data and session saved for an entry when it is removed."""
+    await ZeekrSnapshotStore(hass, entry.entry_id).async_remove()
+    await ZeekrSessionStore(hass, entry.entry_id).async_remove()
+    await get_stats_service(hass).async_remove_entry(entry.entry_id)
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    """Apply changed settings, reloading the entry only if they need it."""
+    coordinator = hass.data[DOMAIN].get(entry.entry_id)
+    if coordinator is not None and coordinator.async_apply_options(entry.data):
+        return
+
+    await hass.config_entries.async_reload(entry.entry_id)
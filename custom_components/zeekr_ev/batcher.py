@@ -0,0 +1,116 @@
+"""Batching of climate commands for Zeekr EV API Integration."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from functools import partial
+import logging
+from typing import Any, Awaitable, Callable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+_LOGGER = logging.getLogger(__name__)
+
+# Climate commands for a vehicle within this many seconds share one invoke
+CLIMATE_BATCH_WINDOW = 0.5
+
+
+def merge_parameters(
+    parameters: list[dict[str, str]], changes: list[dict[str, str]]
+) -> list[dict[str, str]]:
+    """Return ZAF service parameters with later changes replacing earlier ones.
+
+    A change replaces every earlier parameter of the same function, so
+    "SH.11" dropped to "false" also drops the "SH.11.level" sent before it.
+    """
+    functions = {get_function(parameter["key"]) for parameter in changes}
+    return [
+        parameter for parameter in parameters
+        if get_function(parameter["key"]) not in functions
+    ] + list(changes)
+
+
+def get_function(key: str) -> str:
+    """Return the climate function a ZAF parameter key belongs to."""
+    for suffix in (".level", ".duration", ".temp"):
+        if key.endswith(suffix):
+            return key[: -len(suffix)]
+    return key
+
+
+@dataclass
+class ZeekrClimateBatch:
+    """Climate parameters waiting to be sent to one vehicle."""
+
+    future: asyncio.Future[None]
+    cancel: Callable[[], Any]
+    parameters: list[dict[str, str]] = field(default_factory=list)
+
+
+class ZeekrClimateBatcher:
+    """Merge the climate (ZAF) commands sent to a vehicle in quick succession.
+
+    Seat, steering wheel, defrost and air conditioning changes all go to the
+    same ZAF service, so a scene touching several of them is sent as one
+    invoke with all their service parameters. Every caller waits for that
+    invoke and sees its error, if any.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        send: Callable[[str, list[dict[str, str]]], Awaitable[None]],
+        window: float = CLIMATE_BATCH_WINDOW,
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._send = send
+        self.window = window
+        self._pending: dict[str, ZeekrClimateBatch] = {}
+        self.requests = 0
+        self.sends = 0
+
+    async def async_send(self, vin: str, parameters: list[dict[str, str]]) -> None:
+        """Send climate parameters to a vehicle along with any sent alongside."""
+        self.requests += 1
+        batch = self._pending.get(vin)
+        if batch is None:
+            batch = self._pending[vin] = ZeekrClimateBatch(
+                self._hass.loop.create_future(),
+                async_call_later(self._hass, self.window, partial(self._async_flush, vin)),
+            )
+        batch.parameters = merge_parameters(batch.parameters, parameters)
+        # One caller giving up doesn't cancel the invoke for the others
+        await asyncio.shield(batch.future)
+
+    async def _async_flush(self, vin: str, *args: Any) -> None:
+        """Send everything collected for a vehicle in one invoke."""
+        batch = self._pending.pop(vin, None)
+        if batch is None:
+            return
+        self.sends += 1
+        _LOGGER.debug(
+            "Sending %s climate parameters to %s", len(batch.parameters), vin
+        )
+        try:
+            await self._send(vin, batch.parameters)
+        except Exception as err:
+            batch.future.set_exception(err)
+        else:
+            batch.future.set_result(None)
+
+    async def async_flush(self) -> None:
+        """Send every pending batch now."""
+        for vin, batch in list(self._pending.items()):
+            batch.cancel()
+            await self._async_flush(vin)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop the commands not sent yet."""
+        for batch in self._pending.values():
+            batch.cancel()
+            batch.future.cancel()
+        self._pending.clear()
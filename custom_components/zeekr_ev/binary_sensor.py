@@ -11,11 +11,14 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, CONF_DRIVE_SIDE, DRIVE_SIDE_LHD
+from .const import DOMAIN
 from .coordinator import ZeekrCoordinator
+from .entity import ZeekrVehicleMixin
+from .fields import FIELDS, TIRE_POSITIONS, ZeekrField
+from .sensor import get_tire_position_label
 
 
-class ZeekrBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class ZeekrBinarySensor(ZeekrVehicleMixin, CoordinatorEntity, BinarySensorEntity):
     """Zeekr Binary Sensor class."""
 
     _attr_has_entity_name = True
@@ -29,8 +32,15 @@ class ZeekrBinarySensor(CoordinatorEntity, BinarySensorEntity):
         value_fn,
         device_class: BinarySensorDeviceClass | None = None,
     ) -> None:
-        """Initialize the binary sensor."""
-        super().__init__(coordinator)
+        """Initialize the binary sensor.
+
+        value_fn is either a field from the registry, read through the
+        coordinator's parsed-value cache, or a function of the snapshot.
+        """
+        super().__init__(
+            coordinator,
+            (vin, value_fn.section) if isinstance(value_fn, ZeekrField) else vin,
+        )
         self.vin = vin
         self.key = key
         self._attr_name = name
@@ -44,6 +54,8 @@ class ZeekrBinarySensor(CoordinatorEntity, BinarySensorEntity):
         data = self.coordinator.data.get(self.vin, {})
         if not data:
             return None
+        if isinstance(self._value_fn, ZeekrField):
+            return self.coordinator.get_field_value(self.vin, self._value_fn)
         return self._value_fn(data)
 
     @property
@@ -56,6 +68,30 @@ class ZeekrBinarySensor(CoordinatorEntity, BinarySensorEntity):
         }
 
 
+class ZeekrTireBinarySensor(ZeekrBinarySensor):
+    """Zeekr tire warning, named after the tire's position for the drive side."""
+
+    def __init__(
+        self,
+        coordinator: ZeekrCoordinator,
+        vin: str,
+        tire: str,
+        key: str,
+        label: str,
+        value_fn,
+        device_class: BinarySensorDeviceClass | None = None,
+    ) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator, vin, key, label, value_fn, device_class)
+        self.tire = tire
+        self._label = label
+
+    @property
+    def name(self) -> str:
+        """Return the name, which follows the configured drive side."""
+        return f"{self._label} {get_tire_position_label(self.tire, self.coordinator.drive_side)}"
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -73,11 +109,7 @@ async def async_setup_entry(
                 vin,
                 "charging_status",
                 "Charging Status",
-                lambda d: int(
-                    d.get("additionalVehicleStatus", {})
-                    .get("electricVehicleStatus", {})
-                    .get("chargerState", "0")
-                ) in [1, 2, 15],
+                FIELDS["charging_status"],
                 BinarySensorDeviceClass.BATTERY_CHARGING,
             )
         )
@@ -88,94 +120,56 @@ async def async_setup_entry(
                 vin,
                 "plugged_in",
                 "Plugged In",
-                lambda d: int(
-                    d.get("additionalVehicleStatus", {})
-                    .get("electricVehicleStatus", {})
-                    .get("statusOfChargerConnection")
-                ),
+                FIELDS["plugged_in"],
                 BinarySensorDeviceClass.PLUG,
             )
         )
 
         # Door open sensors from drivingSafetyStatus
         door_fields = {
-            "door_open_driver": ("doorOpenStatusDriver", "Driver door open"),
-            "door_open_passenger": ("doorOpenStatusPassenger", "Passenger door open"),
-            "door_open_driver_rear": (
-                "doorOpenStatusDriverRear",
-                "Driver rear door open",
-            ),
-            "door_open_passenger_rear": (
-                "doorOpenStatusPassengerRear",
-                "Passenger rear door open",
-            ),
-            "trunk_open": ("trunkOpenStatus", "Trunk open"),
-            "hood_open": ("engineHoodOpenStatus", "Hood open"),
+            "door_open_driver": "Driver door open",
+            "door_open_passenger": "Passenger door open",
+            "door_open_driver_rear": "Driver rear door open",
+            "door_open_passenger_rear": "Passenger rear door open",
+            "trunk_open": "Trunk open",
+            "hood_open": "Hood open",
         }
 
-        for key, (field_name, label) in door_fields.items():
+        for key, label in door_fields.items():
             entities.append(
                 ZeekrBinarySensor(
                     coordinator,
                     vin,
                     key,
                     label,
-                    lambda d, f=field_name: (
-                        None
-                        if (
-                            v := d.get("additionalVehicleStatus", {})
-                            .get("drivingSafetyStatus", {})
-                            .get(f)
-                        )
-                        is None
-                        else str(v) == "1"
-                    ),
+                    FIELDS[key],
                     BinarySensorDeviceClass.DOOR,
                 )
             )
 
         # Tire Pre-Warning & Temp Warning
-        from .sensor import get_tire_position_label
-        drive_side = entry.data.get(CONF_DRIVE_SIDE, DRIVE_SIDE_LHD)
-        for tire in ["Driver", "Passenger", "DriverRear", "PassengerRear"]:
-            display_label = get_tire_position_label(tire, drive_side)
+        for tire in TIRE_POSITIONS:
             # Pre-Warning
             entities.append(
-                ZeekrBinarySensor(
+                ZeekrTireBinarySensor(
                     coordinator,
                     vin,
+                    tire,
                     f"tire_pre_warning_{tire.lower()}",
-                    f"Tire Pre-Warning {display_label}",
-                    lambda d, t=tire: (
-                        None
-                        if (
-                            v := d.get("additionalVehicleStatus", {})
-                            .get("maintenanceStatus", {})
-                            .get(f"tyrePreWarning{t}")
-                        )
-                        is None
-                        else str(v) != "0"
-                    ),
+                    "Tire Pre-Warning",
+                    FIELDS[f"tire_pre_warning_{tire.lower()}"],
                     BinarySensorDeviceClass.PROBLEM,
                 )
             )
             # Temp Warning
             entities.append(
-                ZeekrBinarySensor(
+                ZeekrTireBinarySensor(
                     coordinator,
                     vin,
+                    tire,
                     f"tire_temp_warning_{tire.lower()}",
-                    f"Tire Temp Warning {display_label}",
-                    lambda d, t=tire: (
-                        None
-                        if (
-                            v := d.get("additionalVehicleStatus", {})
-                            .get("maintenanceStatus", {})
-                            .get(f"tyreTempWarning{t}")
-                        )
-                        is None
-                        else str(v) != "0"
-                    ),
+                    "Tire Temp Warning",
+                    FIELDS[f"tire_temp_warning_{tire.lower()}"],
                     BinarySensorDeviceClass.PROBLEM,
                 )
             )
@@ -0,0 +1,128 @@
+"""Retry backoff and circuit breakers for Zeekr EV API Integration.
+
+Each endpoint of each vehicle gets its own breaker. After a few failed
+fetches in a row it opens and the endpoint is left alone for a while; once
+that time is up a single probe is let through, which either closes the
+breaker again or keeps it open for twice as long.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import random
+from typing import Any
+
+# Tries per sub-fetch, including the first one
+RETRY_ATTEMPTS = 2
+# Upper bound of the jittered wait before the first retry, doubled per retry
+RETRY_DELAY = 1.0  # seconds
+MAX_RETRY_DELAY = 10.0  # seconds
+
+# Failed fetches in a row that open a breaker
+FAILURE_THRESHOLD = 3
+OPEN_DURATION = timedelta(minutes=2)
+MAX_OPEN_DURATION = timedelta(hours=1)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+def get_backoff_delay(
+    attempt: int, base: float = RETRY_DELAY, maximum: float = MAX_RETRY_DELAY
+) -> float:
+    """Return a random wait before retry number attempt (0 for the first)."""
+    return random.uniform(0, min(base * 2**attempt, maximum))
+
+
+@dataclass
+class ZeekrCircuitBreaker:
+    """Track the failures of one endpoint of one vehicle."""
+
+    failures: int = 0
+    # How many times in a row the breaker opened without a good probe
+    trips: int = 0
+    open_until: datetime | None = None
+    probing: bool = False
+    last_error: str | None = None
+
+    @property
+    def state(self) -> str:
+        """Return closed, open or half_open."""
+        if self.open_until is None:
+            return STATE_CLOSED
+        return STATE_HALF_OPEN if self.probing else STATE_OPEN
+
+    def allow_request(self, now: datetime) -> bool:
+        """Return True if the endpoint may be called now.
+
+        Once an open breaker's time is up, the next call is let through as a
+        probe and any others wait until it has finished.
+        """
+        if self.open_until is None:
+            return True
+        if self.probing or now < self.open_until:
+            return False
+        self.probing = True
+        return True
+
+    def record_success(self) -> bool:
+        """Record a good fetch; return True if this closed the breaker."""
+        was_open = self.open_until is not None
+        self.failures = 0
+        self.trips = 0
+        self.open_until = None
+        self.probing = False
+        self.last_error = None
+        return was_open
+
+    def record_failure(self, now: datetime, error: Exception) -> bool:
+        """Record a failed fetch; return True if this opened the breaker."""
+        self.failures += 1
+        self.last_error = str(error)
+        if not self.probing and (
+            self.open_until is not None or self.failures < FAILURE_THRESHOLD
+        ):
+            return False
+        self.probing = False
+        self.open_until = now + min(OPEN_DURATION * 2**self.trips, MAX_OPEN_DURATION)
+        self.trips += 1
+        return self.trips == 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the breaker state."""
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "open_until": self.open_until.isoformat() if self.open_until else None,
+            "last_error": self.last_error,
+        }
+
+
+class ZeekrCircuitBreakers:
+    """The circuit breakers of every vehicle endpoint, created on first use."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._breakers: dict[tuple[str, str], ZeekrCircuitBreaker] = {}
+
+    def get(self, vin: str, endpoint: str) -> ZeekrCircuitBreaker:
+        """Return the breaker of an endpoint of a vehicle."""
+        return self._breakers.setdefault((vin, endpoint), ZeekrCircuitBreaker())
+
+    def get_open(self) -> dict[str, list[str]]:
+        """Return the endpoints that are not being called, per VIN."""
+        open_endpoints: dict[str, list[str]] = {}
+        for (vin, endpoint), breaker in self._breakers.items():
+            if breaker.state != STATE_CLOSED:
+                open_endpoints.setdefault(vin, []).append(endpoint)
+        return open_endpoints
+
+    def as_dict(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Return the state of every breaker that has seen a failure."""
+        result: dict[str, dict[str, dict[str, Any]]] = {}
+        for (vin, endpoint), breaker in self._breakers.items():
+            if breaker.failures:
+                result.setdefault(vin, {})[endpoint] = breaker.as_dict()
+        return result
@@ -0,0 +1,121 @@
+"""Daily API request budget for Zeekr EV API Integration."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any, Iterable
+
+from homeassistant.util import dt as dt_util
+
+from .endpoints import SUB_ENDPOINTS
+from .request_stats import ZeekrRequestStats
+
+# Weight of the latest poll in the running average of requests per poll
+POLL_COST_SMOOTHING = 0.2
+
+
+def get_time_until_reset(now: datetime | None = None) -> timedelta:
+    """Return the time left until the daily counters reset at local midnight."""
+    now = now or dt_util.now()
+    midnight = dt_util.start_of_local_day(now) + timedelta(days=1)
+    return midnight - now
+
+
+class ZeekrBudgetGovernor:
+    """Pace automatic polls so the day's requests stay within a limit.
+
+    Requests and invokes counted by ZeekrRequestStats both use up the daily
+    limit. Part of it is held back for remote commands; polls share out what
+    is left over the rest of the day, so they slow down well before the
+    limit is reached rather than stopping commands from going through.
+    """
+
+    def __init__(
+        self,
+        stats: ZeekrRequestStats,
+        daily_limit: int = 0,
+        command_reserve: int = 0,
+    ) -> None:
+        """Initialize."""
+        self._stats = stats
+        self.daily_limit = daily_limit
+        self.command_reserve = command_reserve
+        # A status poll plus every sub-fetch until polls have been seen
+        self.poll_cost = float(1 + len(SUB_ENDPOINTS))
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if a daily limit is set."""
+        return self.daily_limit > 0
+
+    @property
+    def used_today(self) -> int:
+        """Return the requests and invokes made today."""
+        return self._stats.api_requests_today + self._stats.api_invokes_today
+
+    @property
+    def reserve_left(self) -> int:
+        """Return how much of the command reserve is still unused today."""
+        return max(self.command_reserve - self._stats.api_invokes_today, 0)
+
+    @property
+    def poll_budget_left(self) -> int:
+        """Return the requests polls may still make today."""
+        return max(self.daily_limit - self.used_today - self.reserve_left, 0)
+
+    def set_limits(self, daily_limit: int, command_reserve: int) -> None:
+        """Change the daily limit and the part reserved for commands."""
+        self.daily_limit = daily_limit
+        self.command_reserve = command_reserve
+
+    def allow_poll(self, requests: int) -> bool:
+        """Return True if the poll budget has room for a number of requests."""
+        return not self.enabled or self.poll_budget_left >= requests
+
+    def record_poll(self, requests: int) -> None:
+        """Record how many requests a poll of one vehicle took."""
+        self.poll_cost += POLL_COST_SMOOTHING * (requests - self.poll_cost)
+
+    def poll_interval(self, vehicles: int, now: datetime | None = None) -> timedelta:
+        """Return the shortest interval between polls of each vehicle.
+
+        Spreads the remaining poll budget evenly until the counters reset;
+        once it is spent, polls wait for the reset.
+        """
+        if not self.enabled:
+            return timedelta(0)
+        until_reset = get_time_until_reset(now)
+        polls_left = self.poll_budget_left / self.poll_cost
+        if polls_left < 1:
+            return until_reset
+        return until_reset * max(vehicles, 1) / polls_left
+
+    def projected_usage(
+        self, intervals: Iterable[timedelta], now: datetime | None = None
+    ) -> int:
+        """Return the requests expected by the end of the day.
+
+        Intervals are the current poll interval of each vehicle; commands are
+        assumed to keep coming at today's rate.
+        """
+        now = now or dt_util.now()
+        until_reset = get_time_until_reset(now).total_seconds()
+        elapsed = (now - dt_util.start_of_local_day(now)).total_seconds()
+        polls = sum(
+            until_reset / interval.total_seconds()
+            for interval in intervals
+            if interval.total_seconds() > 0
+        )
+        invokes = self._stats.api_invokes_today * until_reset / elapsed if elapsed else 0
+        return round(self.used_today + polls * self.poll_cost + invokes)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the budget figures."""
+        return {
+            "daily_limit": self.daily_limit,
+            "command_reserve": self.command_reserve,
+            "used_today": self.used_today,
+            "reserve_left": self.reserve_left,
+            "poll_budget_left": self.poll_budget_left,
+            "poll_cost": round(self.poll_cost, 2),
+        }
@@ -65,7 +65,7 @@ class ZeekrFlashBlinkersButton(ZeekrEntity, ButtonEntity):
         }
 
         await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
+        await self.coordinator.async_call_api(
             vehicle.do_remote_control, command, service_id, setting
         )
         _LOGGER.info("Flash blinkers requested for vehicle %s", self.vin)
@@ -100,7 +100,7 @@ class ZeekrHonkFlashButton(ZeekrEntity, ButtonEntity):
         }
 
         await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
+        await self.coordinator.async_call_api(
             vehicle.do_remote_control, command, service_id, setting
         )
         _LOGGER.info("Honk horn and flash blinkers requested for vehicle %s", self.vin)
@@ -135,7 +135,7 @@ class ZeekrParkingComfortDisableButton(ZeekrEntity, ButtonEntity):
         }
 
         await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
+        await self.coordinator.async_call_api(
             vehicle.do_remote_control, command, service_id, setting
         )
         _LOGGER.info("Parking comfort disabled for vehicle %s", self.vin)
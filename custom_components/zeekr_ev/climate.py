@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
-from datetime import datetime, timezone
 from typing import Any
 
 from homeassistant.components.climate import (
@@ -17,8 +15,11 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .confirm import expect_field
 from .const import DOMAIN
 from .coordinator import ZeekrCoordinator
+from .entity import ZeekrVehicleMixin
+from .fields import FIELDS
 
 
 async def async_setup_entry(
@@ -36,7 +37,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class ZeekrClimate(CoordinatorEntity, ClimateEntity):
+class ZeekrClimate(ZeekrVehicleMixin, CoordinatorEntity, ClimateEntity):
     """Zeekr Climate class."""
 
     _attr_has_entity_name = True
@@ -47,7 +48,7 @@ class ZeekrClimate(CoordinatorEntity, ClimateEntity):
 
     def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
         """Initialize the climate entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, (vin, "climateStatus"))
         self.vin = vin
         self._attr_unique_id = f"{vin}_climate"
         self._target_temperature = 20.0  # Default since vehicle doesn't report setpoint
@@ -55,16 +56,7 @@ class ZeekrClimate(CoordinatorEntity, ClimateEntity):
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        try:
-            val = (
-                self.coordinator.data.get(self.vin, {})
-                .get("additionalVehicleStatus", {})
-                .get("climateStatus", {})
-                .get("interiorTemp")
-            )
-            return float(val) if val is not None else None
-        except (ValueError, TypeError, AttributeError):
-            return None
+        return self.coordinator.get_field_value(self.vin, "interior_temp_value")
 
     @property
     def target_temperature(self) -> float | None:
@@ -74,19 +66,10 @@ class ZeekrClimate(CoordinatorEntity, ClimateEntity):
     @property
     def hvac_mode(self) -> HVACMode:
         """Return hvac operation ie. heat, cool mode."""
-        try:
-            status = (
-                self.coordinator.data.get(self.vin, {})
-                .get("additionalVehicleStatus", {})
-                .get("climateStatus", {})
-            )
-            # preClimateActive is likely a boolean or "true"/"false" string
-            active = status.get("preClimateActive")
-            if str(active).lower() in ("true", "1"):
-                return HVACMode.HEAT_COOL
-            return HVACMode.OFF
-        except (ValueError, TypeError, AttributeError):
-            return HVACMode.OFF
+        # preClimateActive is likely a boolean or "true"/"false" string
+        if self.coordinator.get_field_value(self.vin, "pre_climate_active"):
+            return HVACMode.HEAT_COOL
+        return HVACMode.OFF
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
@@ -94,8 +77,6 @@ class ZeekrClimate(CoordinatorEntity, ClimateEntity):
         if not vehicle:
             return
 
-        command = "start"
-        service_id = "ZAF"
         setting = None
 
         if hvac_mode == HVACMode.HEAT_COOL:
@@ -129,37 +110,34 @@ class ZeekrClimate(CoordinatorEntity, ClimateEntity):
             }
 
         if setting:
-            await self.coordinator.async_inc_invoke()
-            await self.hass.async_add_executor_job(
-                vehicle.do_remote_control, command, service_id, setting
+            # Sent together with other climate changes made at the same time
+            await self.coordinator.async_send_climate_command(
+                self.vin, setting["serviceParameters"]
             )
 
             # Optimistic update
             self._update_local_state_optimistically(hvac_mode)
-            self.async_write_ha_state()
 
-            # delayed refresh
-            async def delayed_refresh():
-                await asyncio.sleep(10)
-                await self.coordinator.async_request_refresh()
-            self.hass.async_create_task(delayed_refresh())
+            # Poll until the car reports the new mode
+            self.coordinator.async_request_vehicle_refresh(
+                self.vin,
+                delay=10,
+                expect=expect_field(
+                    FIELDS["pre_climate_active"], hvac_mode == HVACMode.HEAT_COOL
+                ),
+            )
 
     def _update_local_state_optimistically(self, hvac_mode: HVACMode) -> None:
-        """Update the coordinator data to reflect the change immediately."""
-        data = self.coordinator.data.get(self.vin)
-        if not data:
-            return
-
-        climate_status = (
-            data.setdefault("additionalVehicleStatus", {})
-            .setdefault("climateStatus", {})
+        """Show the new mode until the vehicle confirms it."""
+        self.coordinator.async_set_optimistic(
+            self.vin,
+            {
+                ("additionalVehicleStatus", "climateStatus", "preClimateActive"): (
+                    "1" if hvac_mode == HVACMode.HEAT_COOL else "0"
+                )
+            },
         )
 
-        if hvac_mode == HVACMode.HEAT_COOL:
-            climate_status["preClimateActive"] = "1"
-        else:
-            climate_status["preClimateActive"] = "0"
-
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         if (temp := kwargs.get("temperature")) is None:
@@ -174,20 +152,10 @@ class ZeekrClimate(CoordinatorEntity, ClimateEntity):
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
-        attrs = {}
-        try:
-            val = (
-                self.coordinator.data.get(self.vin, {})
-                .get("additionalVehicleStatus", {})
-                .get("climateStatus", {})
-                .get("updateTime")
-            )
-            if val is not None:
-                # Convert milliseconds to datetime
-                dt = datetime.fromtimestamp(int(val) / 1000, tz=timezone.utc)
-                attrs["last_updated"] = dt.isoformat()
-        except (ValueError, TypeError, AttributeError):
-            pass
+        attrs = dict(super().extra_state_attributes or {})
+        updated = self.coordinator.get_field_value(self.vin, "climate_updated")
+        if updated is not None:
+            attrs["last_updated"] = updated.isoformat()
         return attrs
 
     @property
@@ -16,6 +16,15 @@ from .const import (
     CONF_PASSWORD,
     CONF_PASSWORD_PUBLIC_KEY,
     CONF_POLLING_INTERVAL,
+    CONF_ACTIVE_POLLING_INTERVAL,
+    CONF_SLEEP_POLLING_INTERVAL,
+    CONF_SLOW_REFRESH_INTERVAL,
+    CONF_API_WORKERS,
+    CONF_TRANSPORT,
+    CONF_PER_VEHICLE_COORDINATORS,
+    CONF_DAILY_REQUEST_LIMIT,
+    CONF_COMMAND_RESERVE,
+    CONF_WRITE_DEBOUNCE,
     CONF_PROD_SECRET,
     CONF_USERNAME,
     CONF_VIN_IV,
@@ -25,7 +34,17 @@ from .const import (
     CONF_DRIVE_SIDE,
     DRIVE_SIDE_LHD,
     DRIVE_SIDE_RHD,
+    TRANSPORT_AIOHTTP,
+    TRANSPORT_THREADS,
     DEFAULT_POLLING_INTERVAL,
+    DEFAULT_ACTIVE_POLLING_INTERVAL,
+    DEFAULT_SLEEP_POLLING_INTERVAL,
+    DEFAULT_SLOW_REFRESH_INTERVAL,
+    DEFAULT_API_WORKERS,
+    DEFAULT_TRANSPORT,
+    DEFAULT_DAILY_REQUEST_LIMIT,
+    DEFAULT_COMMAND_RESERVE,
+    DEFAULT_WRITE_DEBOUNCE,
     DOMAIN,
     COUNTRY_CODE_MAPPING,
 )
@@ -355,18 +374,19 @@ class ZeekrEVAPIOptionsFlowHandler(config_entries.OptionsFlow):
                     if not valid:
                         errors["base"] = "auth"
                     else:
-                        # Update config entry data with new values
+                        # Update config entry data with new values; the
+                        # entry's update listener reloads it
                         self.hass.config_entries.async_update_entry(
                             self._config_entry, data=user_input
                         )
-                        await self.hass.config_entries.async_reload(self._config_entry.entry_id)
                         return self.async_abort(reason="reconfigure_successful")
                 else:
-                    # Update config entry data with new values
+                    # Update config entry data with new values; the entry's
+                    # update listener applies polling and display settings
+                    # in place and only reloads for the others
                     self.hass.config_entries.async_update_entry(
                         self._config_entry, data=user_input
                     )
-                    await self.hass.config_entries.async_reload(self._config_entry.entry_id)
                     return self.async_abort(reason="reconfigure_successful")
 
         # Merge existing data
@@ -394,6 +414,49 @@ class ZeekrEVAPIOptionsFlowHandler(config_entries.OptionsFlow):
                         CONF_POLLING_INTERVAL,
                         default=data.get(CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL),
                     ): int,
+                    vol.Optional(
+                        CONF_ACTIVE_POLLING_INTERVAL,
+                        default=data.get(CONF_ACTIVE_POLLING_INTERVAL, DEFAULT_ACTIVE_POLLING_INTERVAL),
+                    ): vol.All(int, vol.Range(min=1)),
+                    vol.Optional(
+                        CONF_SLEEP_POLLING_INTERVAL,
+                        default=data.get(CONF_SLEEP_POLLING_INTERVAL, DEFAULT_SLEEP_POLLING_INTERVAL),
+                    ): vol.All(int, vol.Range(min=1)),
+                    vol.Optional(
+                        CONF_SLOW_REFRESH_INTERVAL,
+                        default=data.get(CONF_SLOW_REFRESH_INTERVAL, DEFAULT_SLOW_REFRESH_INTERVAL),
+                    ): vol.All(int, vol.Range(min=1)),
+                    vol.Optional(
+                        CONF_API_WORKERS,
+                        default=data.get(CONF_API_WORKERS, DEFAULT_API_WORKERS),
+                    ): vol.All(int, vol.Range(min=0, max=16)),
+                    vol.Optional(
+                        CONF_TRANSPORT,
+                        default=data.get(CONF_TRANSPORT, DEFAULT_TRANSPORT),
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=[
+                                selector.SelectOptionDict(value=TRANSPORT_THREADS, label="Worker threads"),
+                                selector.SelectOptionDict(value=TRANSPORT_AIOHTTP, label="Async HTTP (aiohttp)"),
+                            ]
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_PER_VEHICLE_COORDINATORS,
+                        default=data.get(CONF_PER_VEHICLE_COORDINATORS, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_DAILY_REQUEST_LIMIT,
+                        default=data.get(CONF_DAILY_REQUEST_LIMIT, DEFAULT_DAILY_REQUEST_LIMIT),
+                    ): vol.All(int, vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_COMMAND_RESERVE,
+                        default=data.get(CONF_COMMAND_RESERVE, DEFAULT_COMMAND_RESERVE),
+                    ): vol.All(int, vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_WRITE_DEBOUNCE,
+                        default=data.get(CONF_WRITE_DEBOUNCE, DEFAULT_WRITE_DEBOUNCE),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=30)),
                     vol.Optional(
                         CONF_HMAC_ACCESS_KEY,
                         default=data.get(CONF_HMAC_ACCESS_KEY, ""),
@@ -0,0 +1,183 @@
+"""Confirmation of remote commands for Zeekr EV API Integration."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import logging
+from typing import Any, Awaitable, Callable, Mapping
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .fields import ZeekrField
+from .overlay import Path
+from .refresh import REFRESH_WINDOW
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds between polls of an unconfirmed command; the last one repeats
+CONFIRM_DELAYS = (2, 3, 5, 8, 12)
+# Seconds after its first poll that a command is given up on
+CONFIRM_TIMEOUT = 30
+
+Expectation = Callable[[dict[str, Any]], bool]
+
+
+def expect_field(field: ZeekrField, value: Any) -> Expectation:
+    """Return an expectation that a field of the vehicle data has a value."""
+    return lambda data: field.extract(data) == value
+
+
+@dataclass
+class ZeekrConfirmation:
+    """A command waiting for the vehicle data to show its effect."""
+
+    vin: str
+    endpoints: frozenset[str]
+    expect: Expectation
+    due: float
+    deadline: float
+    polls: int = 0
+    # The optimistic values the command set, dropped if it isn't confirmed
+    values: Mapping[Path, Any] = field(default_factory=dict)
+
+
+class ZeekrConfirmationEngine:
+    """Poll vehicles after commands until their expected state shows up.
+
+    A command registers what the vehicle data should look like once it has
+    taken effect and the cheapest endpoints that show it. All pending
+    commands share their polls: each poll refreshes every vehicle with a
+    command due within the refresh window, and checks every command of those
+    vehicles. Polls back off while a command is unconfirmed, and a command
+    that is still unconfirmed at its deadline is handed to on_timeout so its
+    optimistic state can be replaced by what the vehicle reports.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        flush: Callable[[dict[str, set[str]]], Awaitable[None]],
+        get_data: Callable[[str], dict[str, Any] | None],
+        on_timeout: Callable[[ZeekrConfirmation], None],
+        timeout: float = CONFIRM_TIMEOUT,
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._flush = flush
+        self._get_data = get_data
+        self._on_timeout = on_timeout
+        self.timeout = timeout
+        self._pending: list[ZeekrConfirmation] = []
+        self._due: float | None = None
+        self._cancel_poll: Callable[[], Any] | None = None
+        self._poll_lock = asyncio.Lock()
+        self.polls = 0
+        self.confirmed = 0
+        self.timed_out = 0
+
+    @property
+    def pending(self) -> list[ZeekrConfirmation]:
+        """Return the commands still waiting for confirmation."""
+        return self._pending
+
+    @callback
+    def async_confirm(
+        self,
+        vin: str,
+        expect: Expectation,
+        *endpoints: str,
+        delay: float = 0,
+        values: Mapping[Path, Any] | None = None,
+    ) -> None:
+        """Wait in the background for a command to show in the vehicle data.
+
+        Delay is how long the car needs before the new state can be read;
+        values are the optimistic values the command set.
+        """
+        first_poll = self._hass.loop.time() + max(delay, CONFIRM_DELAYS[0])
+        self._pending.append(
+            ZeekrConfirmation(
+                vin,
+                frozenset(endpoints),
+                expect,
+                first_poll,
+                first_poll + self.timeout,
+                values=dict(values or {}),
+            )
+        )
+        self._async_schedule()
+
+    @callback
+    def _async_schedule(self) -> None:
+        """Schedule the next poll for the earliest due command."""
+        if not self._pending:
+            return
+        due = min(confirmation.due for confirmation in self._pending)
+        if self._cancel_poll is not None and self._due is not None and self._due <= due:
+            return
+        if self._cancel_poll:
+            self._cancel_poll()
+        self._due = due
+        self._cancel_poll = async_call_later(
+            self._hass, max(due - self._hass.loop.time(), 0), self._async_poll
+        )
+
+    async def _async_poll(self, *args: Any) -> None:
+        """Refresh the vehicles with a command due and check their commands."""
+        self._cancel_poll = None
+        self._due = None
+        async with self._poll_lock:
+            window_end = self._hass.loop.time() + REFRESH_WINDOW
+            due = [c for c in self._pending if c.due <= window_end]
+            refresh: dict[str, set[str]] = {}
+            for confirmation in due:
+                refresh.setdefault(confirmation.vin, set()).update(confirmation.endpoints)
+            if refresh:
+                self.polls += 1
+                await self._flush(refresh)
+
+            now = self._hass.loop.time()
+            for confirmation in list(self._pending):
+                if confirmation.vin not in refresh:
+                    continue
+                if self._is_confirmed(confirmation):
+                    self._pending.remove(confirmation)
+                    self.confirmed += 1
+                    continue
+                if confirmation not in due:
+                    continue
+                confirmation.polls += 1
+                if now >= confirmation.deadline:
+                    self._pending.remove(confirmation)
+                    self.timed_out += 1
+                    _LOGGER.info(
+                        "Command for %s not confirmed after %s polls",
+                        confirmation.vin, confirmation.polls,
+                    )
+                    self._on_timeout(confirmation)
+                    continue
+                delay = CONFIRM_DELAYS[min(confirmation.polls, len(CONFIRM_DELAYS)) - 1]
+                confirmation.due = min(now + delay, confirmation.deadline)
+        self._async_schedule()
+
+    def _is_confirmed(self, confirmation: ZeekrConfirmation) -> bool:
+        """Return True if the vehicle data shows the command's effect."""
+        data = self._get_data(confirmation.vin)
+        if data is None:
+            return False
+        try:
+            return bool(confirmation.expect(data))
+        except Exception as err:
+            _LOGGER.debug("Error checking command for %s: %s", confirmation.vin, err)
+            return False
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop pending commands and cancel the scheduled poll."""
+        if self._cancel_poll:
+            self._cancel_poll()
+            self._cancel_poll = None
+        self._due = None
+        self._pending.clear()
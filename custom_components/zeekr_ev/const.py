@@ -61,14 +61,48 @@ CONF_PROD_SECRET = "prod_secret"
 CONF_VIN_KEY = "vin_key"
 CONF_VIN_IV = "vin_iv"
 CONF_POLLING_INTERVAL = "polling_interval"
+CONF_ACTIVE_POLLING_INTERVAL = "active_polling_interval"
+CONF_SLEEP_POLLING_INTERVAL = "sleep_polling_interval"
+CONF_SLOW_REFRESH_INTERVAL = "slow_refresh_interval"
+CONF_API_WORKERS = "api_workers"
+CONF_TRANSPORT = "transport"
+CONF_PER_VEHICLE_COORDINATORS = "per_vehicle_coordinators"
 CONF_USE_LOCAL_API = "use_local_api"
 CONF_DRIVE_SIDE = "drive_side"
+CONF_DAILY_REQUEST_LIMIT = "daily_request_limit"
+CONF_COMMAND_RESERVE = "command_reserve"
+CONF_WRITE_DEBOUNCE = "write_debounce"
 DRIVE_SIDE_LHD = "lhd"
 DRIVE_SIDE_RHD = "rhd"
+TRANSPORT_THREADS = "threads"
+TRANSPORT_AIOHTTP = "aiohttp"
+
+# Options applied to the running coordinator; changing any other setting
+# (credentials, region, API workers...) reloads the entry
+LIVE_OPTIONS = frozenset(
+    {
+        CONF_POLLING_INTERVAL,
+        CONF_ACTIVE_POLLING_INTERVAL,
+        CONF_SLEEP_POLLING_INTERVAL,
+        CONF_SLOW_REFRESH_INTERVAL,
+        CONF_DRIVE_SIDE,
+        CONF_DAILY_REQUEST_LIMIT,
+        CONF_COMMAND_RESERVE,
+        CONF_WRITE_DEBOUNCE,
+    }
+)
 
 # Defaults
 DEFAULT_NAME = DOMAIN
 DEFAULT_POLLING_INTERVAL = 5  # minutes
+DEFAULT_ACTIVE_POLLING_INTERVAL = 2  # minutes, while charging or driving
+DEFAULT_SLEEP_POLLING_INTERVAL = 30  # minutes, while in deep sleep
+DEFAULT_SLOW_REFRESH_INTERVAL = 60  # minutes, charge/travel plan and charging limit
+DEFAULT_API_WORKERS = 4  # threads dedicated to Zeekr API calls, 0 = shared executor
+DEFAULT_TRANSPORT = TRANSPORT_THREADS
+DEFAULT_DAILY_REQUEST_LIMIT = 0  # requests and invokes per day, 0 = no limit
+DEFAULT_COMMAND_RESERVE = 50  # part of the daily limit kept for remote commands
+DEFAULT_WRITE_DEBOUNCE = 2  # seconds a slider or plan time must settle before it is sent
 
 # Country code to (country_name, region) mapping
 COUNTRY_CODE_MAPPING = {
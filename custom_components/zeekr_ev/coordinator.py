@@ -3,19 +3,76 @@
 from __future__ import annotations
 
 import asyncio
+from copy import deepcopy
 from datetime import timedelta, datetime
+from functools import partial
 import logging
-from typing import TYPE_CHECKING, Optional
+import time
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping, Optional, TypeVar
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 import homeassistant.helpers.event as event
-
-
-from .const import CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL, DOMAIN
-from .request_stats import ZeekrRequestStats
+from homeassistant.util import dt as dt_util
+
+
+from .const import (
+    CONF_ACTIVE_POLLING_INTERVAL,
+    CONF_COMMAND_RESERVE,
+    CONF_DAILY_REQUEST_LIMIT,
+    CONF_DRIVE_SIDE,
+    CONF_PER_VEHICLE_COORDINATORS,
+    CONF_POLLING_INTERVAL,
+    CONF_SLEEP_POLLING_INTERVAL,
+    CONF_SLOW_REFRESH_INTERVAL,
+    CONF_WRITE_DEBOUNCE,
+    DEFAULT_ACTIVE_POLLING_INTERVAL,
+    DEFAULT_COMMAND_RESERVE,
+    DEFAULT_DAILY_REQUEST_LIMIT,
+    DEFAULT_POLLING_INTERVAL,
+    DEFAULT_SLEEP_POLLING_INTERVAL,
+    DEFAULT_SLOW_REFRESH_INTERVAL,
+    DEFAULT_WRITE_DEBOUNCE,
+    DOMAIN,
+    DRIVE_SIDE_LHD,
+    LIVE_OPTIONS,
+)
+from .breaker import RETRY_ATTEMPTS, ZeekrCircuitBreakers, get_backoff_delay
+from .batcher import ZeekrClimateBatcher
+from .budget import ZeekrBudgetGovernor
+from .confirm import Expectation, ZeekrConfirmation, ZeekrConfirmationEngine
+from .debounce import WriteCallback, ZeekrWriteDebouncer
+from .endpoints import (
+    ENDPOINT_STATUS,
+    SUB_ENDPOINTS,
+    SUB_ENDPOINTS_BY_KEY,
+    TIER_REALTIME,
+    TIER_SLOW,
+    ZeekrEndpoint,
+    get_call_endpoint,
+)
+from .fields import FIELDS, NESTED_SECTIONS, ZeekrField
+from .overlay import Path, ZeekrOptimisticOverlay
+from .plans import ZeekrPlanEditor
+from .profiling import (
+    PHASE_LOGIN,
+    PHASE_MERGE,
+    PHASE_STATUS,
+    PHASE_SUB_FETCH,
+    PHASE_VEHICLE_LIST,
+    PHASE_VEHICLES,
+    ZeekrPollProfiler,
+    profile_phase,
+    record_api_call,
+)
+from .refresh import ZeekrRefreshBroker
+from .request_stats import get_stats_service
+from .scheduler import MIN_TICK, VEHICLE_STATE_PARKED, ZeekrPollScheduler
+from .session import ZeekrSessionStore
+from .snapshot import ZeekrSnapshotStore
+from .transport import ZeekrCallTiming, ZeekrTransport, create_transport
 
 if TYPE_CHECKING:
     # Import for type checking only
@@ -26,6 +83,78 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+
+def get_changed_sections(old: dict | None, new: dict | None) -> set[str]:
+    """Return the sections of a vehicle snapshot that differ between two polls.
+
+    A section is a top-level key of the snapshot, or for the keys in
+    NESTED_SECTIONS, one of their children (e.g. climateStatus).
+    """
+    old = old or {}
+    new = new or {}
+    changed: set[str] = set()
+    for key in old.keys() | new.keys():
+        old_value = old.get(key)
+        new_value = new.get(key)
+        if old_value == new_value:
+            continue
+        if key in NESTED_SECTIONS and (
+            isinstance(old_value, dict) or isinstance(new_value, dict)
+        ):
+            changed.update(
+                get_changed_sections(
+                    old_value if isinstance(old_value, dict) else None,
+                    new_value if isinstance(new_value, dict) else None,
+                )
+            )
+        else:
+            changed.add(key)
+    return changed
+
+
+def listener_wants_update(context: Any, changed: dict[str, set[str]]) -> bool:
+    """Return True if a listener's context covers one of the changed sections.
+
+    Account-wide listeners have no context and see every update; vehicle
+    listeners use the VIN, or a (VIN, section) tuple to only see one section.
+    """
+    if context is None:
+        return True
+    if isinstance(context, tuple):
+        vin, section = context
+        return section in changed.get(vin, ())
+    return bool(changed.get(context))
+
+
+def get_poll_intervals(options: Mapping[str, Any]) -> tuple[timedelta, timedelta, timedelta]:
+    """Return the base, active and sleep poll intervals set in the options."""
+    return (
+        timedelta(minutes=options.get(CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL)),
+        timedelta(
+            minutes=options.get(CONF_ACTIVE_POLLING_INTERVAL, DEFAULT_ACTIVE_POLLING_INTERVAL)
+        ),
+        timedelta(
+            minutes=options.get(CONF_SLEEP_POLLING_INTERVAL, DEFAULT_SLEEP_POLLING_INTERVAL)
+        ),
+    )
+
+
+def get_slow_refresh_interval(options: Mapping[str, Any]) -> timedelta:
+    """Return how long slow-tier endpoint results are reused."""
+    return timedelta(
+        minutes=options.get(CONF_SLOW_REFRESH_INTERVAL, DEFAULT_SLOW_REFRESH_INTERVAL)
+    )
+
+
+def get_budget_limits(options: Mapping[str, Any]) -> tuple[int, int]:
+    """Return the daily request limit and the part reserved for commands."""
+    return (
+        int(options.get(CONF_DAILY_REQUEST_LIMIT, DEFAULT_DAILY_REQUEST_LIMIT)),
+        int(options.get(CONF_COMMAND_RESERVE, DEFAULT_COMMAND_RESERVE)),
+    )
+
 
 class ZeekrCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Zeekr data."""
@@ -35,25 +164,96 @@ class ZeekrCoordinator(DataUpdateCoordinator):
         hass: HomeAssistant,
         client: ZeekrClient,
         entry: ConfigEntry,
+        transport: ZeekrTransport | None = None,
     ) -> None:
         """Initialize."""
         self.client = client
         self.entry = entry
+        self.transport = transport or create_transport(hass, entry)
         self.vehicles: list[Vehicle] = []
         # Shared settings for command durations
         self.seat_duration = 15
         self.ac_duration = 15
         self.steering_wheel_duration = 15
-        self.request_stats = ZeekrRequestStats(hass)
+        # Kept by the stats service across reloads of the entry
+        self.request_stats = get_stats_service(hass).get_stats(entry.entry_id)
+        # Slows automatic polls down to stay within the daily request limit
+        self.budget = ZeekrBudgetGovernor(
+            self.request_stats, *get_budget_limits(entry.data)
+        )
         self.latest_poll_time: Optional[str] = None  # Track latest poll time
-        polling_interval = entry.data.get(CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL)
+        # Phase timings of the last poll cycles
+        self.poll_profiler = ZeekrPollProfiler()
+        # Each vehicle gets its own next poll time based on its last state;
+        # the coordinator only ticks when the earliest vehicle is due.
+        self.scheduler = ZeekrPollScheduler(*get_poll_intervals(entry.data))
+        self.drive_side: str = entry.data.get(CONF_DRIVE_SIDE, DRIVE_SIDE_LHD)
+        # Settings the coordinator currently runs with
+        self._options: dict[str, Any] = dict(entry.data)
+        # Last good result of each sub-endpoint per VIN, and the endpoints a
+        # write has invalidated since then
+        self._endpoint_cache: dict[str, dict[str, tuple[datetime, dict]]] = {}
+        self._dirty_endpoints: dict[str, set[str]] = {}
+        # Endpoints whose section in the current snapshot was carried forward
+        # from an earlier poll rather than fetched on the latest one
+        self.stale_endpoints: dict[str, set[str]] = {}
+        self.endpoint_max_age: dict[str, timedelta] = {
+            TIER_REALTIME: timedelta(0),
+            TIER_SLOW: get_slow_refresh_interval(entry.data),
+        }
+        # Endpoints that keep failing are left alone for a while
+        self.breakers = ZeekrCircuitBreakers()
+        # Optionally one child coordinator per vehicle, each with its own
+        # schedule and error state, so one slow car can't hold up the others
+        self.per_vehicle: bool = entry.data.get(CONF_PER_VEHICLE_COORDINATORS, False)
+        self.vehicle_coordinators: dict[str, ZeekrVehicleCoordinator] = {}
+        self._unsub_vehicle_coordinators: list[Callable[[], None]] = []
+        # Refreshes requested by entities after a command are merged into one
+        self.refresh_broker = ZeekrRefreshBroker(hass, self._async_refresh_vehicles)
+        # Climate commands sent together go out as one invoke per vehicle
+        self.climate_batcher = ZeekrClimateBatcher(
+            hass, self._async_send_climate_parameters
+        )
+        # Settings writes only send their final value once it has settled
+        self.write_debouncer = ZeekrWriteDebouncer(
+            hass, entry.data.get(CONF_WRITE_DEBOUNCE, DEFAULT_WRITE_DEBOUNCE)
+        )
+        # What commands and writes should have changed, shown until confirmed
+        self.overlay = ZeekrOptimisticOverlay(hass, self.async_update_vehicle_listeners)
+        # Edits to the charge and travel plans, merged into whole-plan writes
+        self.plans = ZeekrPlanEditor(self)
+        # Commands that say what to expect are polled until it shows up
+        self.confirmations = ZeekrConfirmationEngine(
+            hass,
+            self._async_poll_confirmations,
+            lambda vin: (self.data or {}).get(vin),
+            self._async_handle_unconfirmed,
+        )
+        # Last good data, kept on disk so a restart doesn't wait for the cloud
+        self.snapshot = ZeekrSnapshotStore(hass, entry.entry_id)
+        # Vehicle info from the snapshot until the vehicle list is fetched
+        self.restored_vehicles: dict[str, dict] = {}
+        # Login tokens, reused on the next start instead of logging in again
+        self.session_store = ZeekrSessionStore(hass, entry.entry_id)
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(minutes=polling_interval),
+            update_interval=self.scheduler.base_interval,
         )
 
+        # Snapshot of each vehicle as last seen by the listeners
+        self._notified_data: dict[str, dict] = {}
+        # Parsed field values per VIN, valid until the snapshot changes
+        self._field_cache: dict[str, dict[str, Any]] = {}
+        # The data of each VIN the overlay was last applied to, and the result
+        self._vehicle_views: dict[str, tuple[dict | None, dict | None]] = {}
+        # Optimistic values set since the last command of each VIN
+        self._command_values: dict[str, dict[Path, Any]] = {}
+        self._last_notified_success = True
+        # Whether each vehicle coordinator's last poll succeeded, as last notified
+        self._vehicle_available: dict[str, bool] = {}
+
         # Schedule daily reset at midnight
         self._unsub_reset = None
         self._setup_daily_reset()
@@ -72,6 +272,25 @@ class ZeekrCoordinator(DataUpdateCoordinator):
     async def _handle_daily_reset(self, now):
         await self.request_stats.async_reset_today()
 
+    async def async_call_api(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a blocking zeekr_ev_api call through the entry's transport.
+
+        The call is recorded against its endpoint with the run time the
+        transport measured, so a busy transport doesn't count as a slow
+        endpoint. The wait for a worker is counted against the poll cycle.
+        """
+        endpoint = get_call_endpoint(func, args)
+        timing = ZeekrCallTiming()
+        try:
+            result = await self.transport.async_call(func, *args, timing=timing)
+        except Exception as err:
+            self.request_stats.record_call(endpoint, timing.duration, err)
+            record_api_call(timing.wait, timing.duration, True)
+            raise
+        self.request_stats.record_call(endpoint, timing.duration, size=timing.size)
+        record_api_call(timing.wait, timing.duration, False)
+        return result
+
     def get_vehicle_by_vin(self, vin: str) -> Vehicle | None:
         """Get a vehicle by VIN."""
         for vehicle in self.vehicles:
@@ -79,122 +298,314 @@ class ZeekrCoordinator(DataUpdateCoordinator):
                 return vehicle
         return None
 
-    async def _async_update_vehicle(self, vehicle: Vehicle) -> tuple[str, dict] | None:
-        """Fetch data for a single vehicle."""
-        try:
-            await self.request_stats.async_inc_request()
-            vehicle_data = await self.hass.async_add_executor_job(
-                vehicle.get_status
-            )
-        except Exception as charge_err:
-            _LOGGER.error("Error fetching status for %s: %s", vehicle.vin, charge_err)
-            return None
+    def is_restored(self, vin: str) -> bool:
+        """Return True if a vehicle's data is from the snapshot, not a poll."""
+        return ENDPOINT_STATUS in self.stale_endpoints.get(vin, ())
+
+    def is_vehicle_available(self, vin: str) -> bool:
+        """Return False if the last poll of a vehicle's own coordinator failed."""
+        vehicle_coordinator = self.vehicle_coordinators.get(vin)
+        return vehicle_coordinator is None or vehicle_coordinator.last_update_success
+
+    async def async_restore_snapshot(self) -> bool:
+        """Load the data saved before the last restart.
+
+        Every section of the restored vehicles counts as stale until the
+        vehicle is polled again. Returns False if there was nothing to load.
+        """
+        restored = await self.snapshot.async_load()
+        if restored is None:
+            return False
+        vehicles, data = restored
+        self.restored_vehicles = vehicles
+        self.data = {
+            vin: vehicle_data
+            for vin, vehicle_data in data.items()
+            if isinstance(vehicle_data, dict)
+        }
+        for vin in self.data:
+            self.stale_endpoints[vin] = {ENDPOINT_STATUS, *SUB_ENDPOINTS_BY_KEY}
+        _LOGGER.debug("Restored data of %s from the last run", ", ".join(self.data))
+        return bool(self.data)
+
+    @callback
+    def _async_save_snapshot(self) -> None:
+        """Schedule a save of the current vehicle list and data."""
+        vehicles = {
+            vehicle.vin: dict(getattr(vehicle, "data", None) or {})
+            for vehicle in self.vehicles
+        }
+        self.snapshot.async_schedule_save(
+            vehicles or self.restored_vehicles, dict(self.data or {})
+        )
 
-        # Define parallel tasks
-        async def fetch_remote_control_state():
-            try:
-                await self.request_stats.async_inc_request()
-                return await self.hass.async_add_executor_job(
-                    vehicle.get_remote_control_state
-                )
-            except Exception as e:
-                _LOGGER.debug("Error fetching remote control status for %s: %s", vehicle.vin, e)
-                return None
+    async def async_restore_session(self, username: str, password: str) -> bool:
+        """Load the saved login session into the client if it isn't logged in."""
+        if self.client.logged_in or not hasattr(self.client, "load_session"):
+            return False
+        session = await self.session_store.async_load(username)
+        if session is None:
+            return False
+        self.client.load_session({**session, "username": username, "password": password})
+        return bool(self.client.logged_in)
+
+    @callback
+    def async_save_session(self) -> None:
+        """Keep the client's current tokens for the next start."""
+        if export_session := getattr(self.client, "export_session", None):
+            self.session_store.async_schedule_save(export_session())
+
+    @callback
+    def async_apply_options(self, options: Mapping[str, Any]) -> bool:
+        """Apply changed settings to the running coordinator.
+
+        Returns False, changing nothing, if a setting outside LIVE_OPTIONS
+        changed and the entry has to be reloaded instead.
+        """
+        changed = {
+            key for key in options.keys() | self._options.keys()
+            if options.get(key) != self._options.get(key)
+        }
+        if not changed <= LIVE_OPTIONS:
+            return False
+        self._options = dict(options)
+        if not changed:
+            return True
+
+        _LOGGER.debug("Applying changed options: %s", ", ".join(sorted(changed)))
+        self.scheduler.set_intervals(*get_poll_intervals(options))
+        self.endpoint_max_age[TIER_SLOW] = get_slow_refresh_interval(options)
+        self.budget.set_limits(*get_budget_limits(options))
+        self.write_debouncer.delay = options.get(CONF_WRITE_DEBOUNCE, DEFAULT_WRITE_DEBOUNCE)
+        self.drive_side = options.get(CONF_DRIVE_SIDE, DRIVE_SIDE_LHD)
+
+        # Move the scheduled polls to the new intervals
+        if self.vehicle_coordinators:
+            for vin, vehicle_coordinator in self.vehicle_coordinators.items():
+                vehicle_coordinator.update_interval = self.get_vehicle_interval(vin)
+                if vehicle_coordinator._listeners:
+                    vehicle_coordinator._schedule_refresh()
+        else:
+            self.update_interval = self.scheduler.time_until_next_poll()
+            if self._listeners:
+                self._schedule_refresh()
+
+        if CONF_DRIVE_SIDE in changed:
+            # Tire entities are named after the drive side
+            for update_callback, _ in list(self._listeners.values()):
+                update_callback()
+        return True
+
+    def get_vehicle_interval(self, vin: str) -> timedelta:
+        """Return how long a vehicle coordinator waits between polls.
+
+        Floored at the scheduler's tick, so a zero interval can't make a
+        vehicle poll back to back.
+        """
+        state = self.scheduler.states.get(vin)
+        interval = (
+            self.scheduler.interval_for_state(state) if state else self.scheduler.base_interval
+        )
+        return max(interval, MIN_TICK)
+
+    def schedule_vehicle(
+        self, vin: str, vehicle_data: dict | None, now: datetime | None = None
+    ) -> datetime:
+        """Schedule the next poll of a vehicle, paced by the request budget."""
+        self.scheduler.min_interval = self.budget.poll_interval(len(self.vehicles))
+        return self.scheduler.schedule(vin, vehicle_data, now)
+
+    def get_projected_requests(self) -> int:
+        """Return the requests and invokes expected by the end of the day."""
+        return self.budget.projected_usage(
+            self.scheduler.interval_for_state(
+                self.scheduler.states.get(vehicle.vin, VEHICLE_STATE_PARKED)
+            )
+            for vehicle in self.vehicles
+        )
 
-        async def fetch_charging_status():
-            try:
-                await self.request_stats.async_inc_request()
-                return await self.hass.async_add_executor_job(
-                    vehicle.get_charging_status
-                )
-            except Exception as e:
-                _LOGGER.debug("Error fetching charging status for %s: %s", vehicle.vin, e)
-                return None
+    def mark_endpoint_dirty(self, vin: str, *endpoints: str) -> None:
+        """Force the given endpoints to be re-fetched on the next poll of a vehicle."""
+        self._dirty_endpoints.setdefault(vin, set()).update(endpoints)
 
-        async def fetch_charging_limit():
-            try:
-                await self.request_stats.async_inc_request()
-                return await self.hass.async_add_executor_job(
-                    vehicle.get_charging_limit
-                )
-            except Exception as e:
-                _LOGGER.debug("Error fetching charging limit for %s: %s", vehicle.vin, e)
-                return None
+    def get_endpoint_fetched_at(self, vin: str, endpoint: str) -> datetime | None:
+        """Return when the value of an endpoint in the snapshot was fetched."""
+        cached = self._endpoint_cache.get(vin, {}).get(endpoint)
+        return cached[0] if cached else None
 
-        async def fetch_charge_plan():
-            try:
-                await self.request_stats.async_inc_request()
-                return await self.hass.async_add_executor_job(
-                    vehicle.get_charge_plan
-                )
-            except Exception as e:
-                _LOGGER.debug("Error fetching charge plan for %s: %s", vehicle.vin, e)
-                return None
+    def _endpoint_needs_fetch(
+        self,
+        vin: str,
+        endpoint: ZeekrEndpoint,
+        status: dict,
+        now: datetime,
+    ) -> bool:
+        """Return True if an endpoint's cached result can't be reused."""
+        if endpoint.key in self._dirty_endpoints.get(vin, ()):
+            return True
+        cached = self._endpoint_cache.get(vin, {}).get(endpoint.key)
+        if cached is None:
+            return True
+        if endpoint.should_skip(status):
+            return False
+        fetched_at, _ = cached
+        return now - fetched_at >= self.endpoint_max_age[endpoint.tier]
+
+    def _record_endpoint_success(self, vin: str, endpoint: str) -> None:
+        """Close the breaker of an endpoint after a good fetch."""
+        if self.breakers.get(vin, endpoint).record_success():
+            _LOGGER.info("Fetching %s for %s works again", endpoint, vin)
+
+    def _record_endpoint_failure(self, vin: str, endpoint: str, err: Exception) -> None:
+        """Count a failed fetch against the breaker of an endpoint."""
+        breaker = self.breakers.get(vin, endpoint)
+        if breaker.record_failure(dt_util.utcnow(), err):
+            _LOGGER.warning(
+                "Fetching %s for %s failed %s times in a row, pausing it until %s: %s",
+                endpoint, vin, breaker.failures, breaker.open_until, err,
+            )
 
-        async def fetch_travel_plan():
+    async def _async_fetch_endpoint(
+        self, vehicle: Vehicle, endpoint: ZeekrEndpoint
+    ) -> dict | None:
+        """Fetch a single sub-endpoint of a vehicle, retrying after a failure."""
+        breaker = self.breakers.get(vehicle.vin, endpoint.key)
+        # A probe of an open breaker gets a single try
+        attempts = 1 if breaker.probing else RETRY_ATTEMPTS
+        for attempt in range(attempts):
+            if attempt:
+                await asyncio.sleep(get_backoff_delay(attempt - 1))
             try:
                 await self.request_stats.async_inc_request()
-                return await self.hass.async_add_executor_job(
-                    vehicle.get_travel_plan
+                result = await self.async_call_api(
+                    getattr(vehicle, endpoint.method)
                 )
             except Exception as e:
-                _LOGGER.debug("Error fetching travel plan for %s: %s", vehicle.vin, e)
-                return None
+                _LOGGER.debug("Error fetching %s for %s: %s", endpoint.label, vehicle.vin, e)
+                error = e
+            else:
+                self._record_endpoint_success(vehicle.vin, endpoint.key)
+                return result
+        self._record_endpoint_failure(vehicle.vin, endpoint.key, error)
+        return None
 
-        # Execute parallel tasks
+    async def _async_fetch_endpoints(
+        self, vehicle: Vehicle, endpoints: list[ZeekrEndpoint], now: datetime
+    ) -> None:
+        """Fetch sub-endpoints in parallel and cache the good results."""
         results = await asyncio.gather(
-            fetch_remote_control_state(),
-            fetch_charging_status(),
-            fetch_charging_limit(),
-            fetch_charge_plan(),
-            fetch_travel_plan(),
+            *(self._async_fetch_endpoint(vehicle, endpoint) for endpoint in endpoints),
             return_exceptions=True
         )
 
-        remote_state, charging_status, charging_limit, charge_plan, travel_plan = results
-
-        # Process results
-        if isinstance(remote_state, dict) and remote_state:
-            vehicle_data.setdefault("additionalVehicleStatus", {})[
-                "remoteControlState"
-            ] = remote_state
-
-        if isinstance(charging_status, dict) and charging_status:
-            vehicle_data.setdefault("chargingStatus", {}).update(charging_status)
-
-        if isinstance(charging_limit, dict) and charging_limit:
-            vehicle_data["chargingLimit"] = charging_limit
-
-        if isinstance(charge_plan, dict) and charge_plan:
-            vehicle_data["chargePlan"] = charge_plan
+        cache = self._endpoint_cache.setdefault(vehicle.vin, {})
+        dirty = self._dirty_endpoints.setdefault(vehicle.vin, set())
+        for endpoint, result in zip(endpoints, results):
+            if isinstance(result, dict) and result:
+                cache[endpoint.key] = (now, result)
+                dirty.discard(endpoint.key)
 
-        if isinstance(travel_plan, dict) and travel_plan:
-            vehicle_data["travelPlan"] = travel_plan
+    async def _async_update_vehicle(self, vehicle: Vehicle) -> tuple[str, dict] | None:
+        """Fetch data for a single vehicle."""
+        # Status isn't retried within a poll; the next poll is the retry
+        if not self.breakers.get(vehicle.vin, ENDPOINT_STATUS).allow_request(dt_util.utcnow()):
+            _LOGGER.debug("Skipping status of %s while its breaker is open", vehicle.vin)
+            return None
+        try:
+            await self.request_stats.async_inc_request()
+            with profile_phase(PHASE_STATUS, vehicle.vin):
+                vehicle_data = await self.async_call_api(
+                    vehicle.get_status
+                )
+        except Exception as charge_err:
+            _LOGGER.error("Error fetching status for %s: %s", vehicle.vin, charge_err)
+            self._record_endpoint_failure(vehicle.vin, ENDPOINT_STATUS, charge_err)
+            return None
+        self._record_endpoint_success(vehicle.vin, ENDPOINT_STATUS)
+
+        # Slow-tier endpoints are only fetched once stale or dirty, and
+        # endpoints the fresh status makes pointless are skipped, as are
+        # endpoints whose breaker is open
+        now = dt_util.utcnow()
+        to_fetch = [
+            endpoint for endpoint in SUB_ENDPOINTS
+            if self._endpoint_needs_fetch(vehicle.vin, endpoint, vehicle_data, now)
+            and self.breakers.get(vehicle.vin, endpoint.key).allow_request(now)
+        ]
+
+        with profile_phase(PHASE_SUB_FETCH, vehicle.vin):
+            await self._async_fetch_endpoints(vehicle, to_fetch, now)
+        self.budget.record_poll(1 + len(to_fetch))
+
+        # Process results, falling back to the last good value of each endpoint
+        with profile_phase(PHASE_MERGE, vehicle.vin):
+            cache = self._endpoint_cache.setdefault(vehicle.vin, {})
+            stale = self.stale_endpoints.setdefault(vehicle.vin, set())
+            stale.clear()
+            for endpoint in SUB_ENDPOINTS:
+                cached = cache.get(endpoint.key)
+                if cached is None:
+                    continue
+                if cached[0] != now:
+                    stale.add(endpoint.key)
+                endpoint.merge(vehicle_data, cached[1])
 
         return vehicle.vin, vehicle_data
 
     async def _async_update_data(self) -> dict[str, dict]:
         """Fetch data from API endpoint."""
+        with self.poll_profiler.cycle():
+            return await self._async_poll()
+
+    async def _async_poll(self) -> dict[str, dict]:
+        """Poll the due vehicles, or set up their own coordinators."""
         try:
+            # After a warm start the first poll also does the login
+            if not self.client.logged_in:
+                await self.request_stats.async_inc_request()
+                with profile_phase(PHASE_LOGIN):
+                    await self.async_call_api(self.client.login)
+                self.async_save_session()
+
             # Refresh vehicle list if empty (first run)
             if not self.vehicles:
                 await self.request_stats.async_inc_request()
-                self.vehicles = await self.hass.async_add_executor_job(
-                    self.client.get_vehicle_list
-                )
-
-            # Update all vehicles in parallel
-            tasks = [self._async_update_vehicle(vehicle) for vehicle in self.vehicles]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            data = {}
-            for result in results:
+                with profile_phase(PHASE_VEHICLE_LIST):
+                    self.vehicles = await self.async_call_api(
+                        self.client.get_vehicle_list
+                    )
+
+            if self.per_vehicle:
+                return await self._async_setup_vehicle_coordinators()
+
+            # Only poll vehicles whose scheduled time has come; the others
+            # keep the snapshot from their previous poll.
+            now = dt_util.utcnow()
+            due_vehicles = [
+                vehicle for vehicle in self.vehicles
+                if self.scheduler.is_due(vehicle.vin, now)
+            ]
+
+            # Update due vehicles in parallel
+            tasks = [self._async_update_vehicle(vehicle) for vehicle in due_vehicles]
+            with profile_phase(PHASE_VEHICLES):
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+
+            data = {
+                vehicle.vin: self.data[vehicle.vin]
+                for vehicle in self.vehicles
+                if self.data and vehicle.vin in self.data
+            }
+            for vehicle, result in zip(due_vehicles, results):
                 if isinstance(result, BaseException):
                     _LOGGER.error("Error updating vehicle: %s", result)
-                    continue
+                    result = None
                 if result:
                     vin, vehicle_data = result
                     data[vin] = vehicle_data
+                self.schedule_vehicle(vehicle.vin, data.get(vehicle.vin), now)
+
+            self.update_interval = self.scheduler.time_until_next_poll()
 
             # Update latest poll time on every automatic poll
             self.latest_poll_time = datetime.now().isoformat()
@@ -204,5 +615,349 @@ class ZeekrCoordinator(DataUpdateCoordinator):
         else:
             return data
 
+    async def _async_setup_vehicle_coordinators(self) -> dict[str, dict]:
+        """Give each new vehicle its own coordinator and run its first poll.
+
+        From then on every vehicle polls on its own schedule, so the parent
+        only has to hold the vehicle list and doesn't poll by itself.
+        """
+        new_vehicles = [
+            vehicle for vehicle in self.vehicles
+            if vehicle.vin not in self.vehicle_coordinators
+        ]
+        for vehicle in new_vehicles:
+            self.vehicle_coordinators[vehicle.vin] = ZeekrVehicleCoordinator(
+                self.hass, self, vehicle
+            )
+        await asyncio.gather(
+            *(self.vehicle_coordinators[vehicle.vin].async_refresh() for vehicle in new_vehicles)
+        )
+        for vehicle in new_vehicles:
+            self._vehicle_available[vehicle.vin] = (
+                self.vehicle_coordinators[vehicle.vin].last_update_success
+            )
+            self._unsub_vehicle_coordinators.append(
+                self.vehicle_coordinators[vehicle.vin].async_add_listener(
+                    partial(self._async_handle_vehicle_update, vehicle.vin)
+                )
+            )
+
+        self.update_interval = None
+        self.latest_poll_time = datetime.now().isoformat()
+        # A vehicle whose first poll failed keeps its restored data, if any
+        data = {
+            vin: vehicle_data
+            for vin, vehicle_data in (self.data or {}).items()
+            if vin in self.vehicle_coordinators
+        }
+        data.update(
+            (vin, vehicle_coordinator.data)
+            for vin, vehicle_coordinator in self.vehicle_coordinators.items()
+            if vehicle_coordinator.data is not None
+        )
+        return data
+
+    @callback
+    def _async_handle_vehicle_update(self, vin: str) -> None:
+        """Merge a vehicle coordinator's latest poll and notify its entities."""
+        vehicle_coordinator = self.vehicle_coordinators[vin]
+        available = vehicle_coordinator.last_update_success
+        if available and vehicle_coordinator.data is not None:
+            self.data = {**(self.data or {}), vin: vehicle_coordinator.data}
+            self.latest_poll_time = datetime.now().isoformat()
+            self.async_update_vehicle_listeners(vin)
+
+        # The vehicle's entities go unavailable or recover with its coordinator,
+        # so a change in its update result reaches all of them
+        if available == self._vehicle_available.get(vin, True):
+            return
+        self._vehicle_available[vin] = available
+        for update_callback, context in list(self._listeners.values()):
+            if context == vin or (isinstance(context, tuple) and context[0] == vin):
+                update_callback()
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh of every vehicle, regardless of its schedule."""
+        self.scheduler.force()
+        if self.vehicle_coordinators:
+            await asyncio.gather(
+                *(
+                    vehicle_coordinator.async_request_refresh()
+                    for vehicle_coordinator in self.vehicle_coordinators.values()
+                )
+            )
+            return
+        await super().async_request_refresh()
+
+    @callback
+    def async_request_vehicle_refresh(
+        self,
+        vin: str,
+        *endpoints: str,
+        delay: float = 0,
+        expect: Expectation | None = None,
+    ) -> None:
+        """Queue a refresh of one vehicle after a command.
+
+        Endpoints name the sub-fetches the command changed (the whole vehicle
+        if none are given); delay is how long the car needs before the new
+        state can be read back. With expect, the endpoints are polled in the
+        background until the vehicle data satisfies it; the optimistic values
+        set since the previous command belong to this one.
+        """
+        endpoints = endpoints or (ENDPOINT_STATUS,)
+        values = self._command_values.pop(vin, {})
+        self.mark_endpoint_dirty(
+            vin, *(endpoint for endpoint in endpoints if endpoint != ENDPOINT_STATUS)
+        )
+        if expect is not None:
+            self.confirmations.async_confirm(
+                vin, expect, *endpoints, delay=delay, values=values
+            )
+            return
+        self.refresh_broker.async_request(vin, *endpoints, delay=delay)
+
+    @callback
+    def _async_handle_unconfirmed(self, confirmation: ZeekrConfirmation) -> None:
+        """Show what the vehicle reports instead of an unconfirmed command.
+
+        The optimistic values the command set are dropped, and unless the
+        command was polled through the status, the whole vehicle is refreshed.
+        """
+        if self.overlay.async_discard(confirmation.vin, confirmation.values):
+            self._vehicle_views.pop(confirmation.vin, None)
+            self.async_update_vehicle_listeners(confirmation.vin)
+        if ENDPOINT_STATUS not in confirmation.endpoints:
+            self.refresh_broker.async_request(confirmation.vin, ENDPOINT_STATUS)
+
+    async def _async_poll_confirmations(self, pending: dict[str, set[str]]) -> None:
+        """Refresh vehicles to confirm their commands, if the budget allows.
+
+        Like regular polls, these are skipped once the day's poll budget is
+        spent; their commands then time out and show the reported state.
+        """
+        requests = sum(len(endpoints) for endpoints in pending.values())
+        if not self.budget.allow_poll(requests):
+            _LOGGER.debug("Poll budget spent, not confirming commands of %s", list(pending))
+            return
+        await self._async_refresh_vehicles(pending)
+
+    async def _async_refresh_vehicles(self, pending: dict[str, set[str]]) -> None:
+        """Refresh only the given vehicles and endpoints."""
+        await asyncio.gather(
+            *(self.async_refresh_vehicle(vin, endpoints) for vin, endpoints in pending.items())
+        )
+
+    async def async_refresh_vehicle(
+        self, vin: str, endpoints: Iterable[str] | None = None
+    ) -> None:
+        """Refresh one vehicle, or only some of its sub-endpoints.
+
+        The result is merged into the current data and only the entities of
+        that vehicle (and the account-wide ones) are notified. Other vehicles
+        keep their schedule.
+        """
+        vehicle = self.get_vehicle_by_vin(vin)
+        if vehicle is None:
+            return
+        endpoints = set(endpoints) if endpoints is not None else {ENDPOINT_STATUS}
+        current = (self.data or {}).get(vin)
+
+        if ENDPOINT_STATUS in endpoints or current is None:
+            self.mark_endpoint_dirty(vin, *(endpoints - {ENDPOINT_STATUS}))
+            if vin in self.vehicle_coordinators:
+                # Its listener merges the result and notifies the entities
+                await self.vehicle_coordinators[vin].async_refresh()
+                return
+            try:
+                result = await self._async_update_vehicle(vehicle)
+            except Exception as err:
+                _LOGGER.error("Error refreshing %s: %s", vin, err)
+                result = None
+            if result is None:
+                return
+            vehicle_data = result[1]
+            self.schedule_vehicle(vin, vehicle_data)
+        else:
+            now = dt_util.utcnow()
+            to_fetch = [
+                SUB_ENDPOINTS_BY_KEY[key] for key in endpoints
+                if key in SUB_ENDPOINTS_BY_KEY
+                and self.breakers.get(vin, key).allow_request(now)
+            ]
+            await self._async_fetch_endpoints(vehicle, to_fetch, now)
+
+            # Copy so listeners of the previous snapshot never see it change
+            vehicle_data = deepcopy(current)
+            cache = self._endpoint_cache.get(vin, {})
+            stale = self.stale_endpoints.setdefault(vin, set())
+            for endpoint in to_fetch:
+                cached = cache.get(endpoint.key)
+                if cached is None or cached[0] != now:
+                    continue
+                stale.discard(endpoint.key)
+                endpoint.merge(vehicle_data, cached[1])
+
+        self.data = {**(self.data or {}), vin: vehicle_data}
+        self.async_update_vehicle_listeners(vin)
+
+    def get_vehicle_data(self, vin: str) -> dict | None:
+        """Return a vehicle's snapshot with its optimistic values laid over it."""
+        data = (self.data or {}).get(vin)
+        cached = self._vehicle_views.get(vin)
+        if cached is not None and cached[0] is data:
+            return cached[1]
+        view = self.overlay.apply(vin, data)
+        self._vehicle_views[vin] = (data, view)
+        return view
+
+    @callback
+    def async_set_optimistic(self, vin: str, values: Mapping[Path, Any]) -> None:
+        """Show values of a vehicle before it reports them.
+
+        Values are keyed by their path in the snapshot and shown until the
+        vehicle's data holds them or they expire.
+        """
+        self.overlay.async_set(vin, values)
+        self._command_values.setdefault(vin, {}).update(values)
+        self._vehicle_views.pop(vin, None)
+        self.async_update_vehicle_listeners(vin)
+
+    def get_field_value(self, vin: str, field: ZeekrField | str) -> Any:
+        """Return the parsed value of a field from a vehicle's snapshot."""
+        if isinstance(field, str):
+            field = FIELDS[field]
+        cache = self._field_cache.setdefault(vin, {})
+        try:
+            return cache[field.key]
+        except KeyError:
+            value = cache[field.key] = field.extract(self.get_vehicle_data(vin))
+            return value
+
+    @callback
+    def async_invalidate_fields(self, vin: str) -> None:
+        """Drop the parsed values of a vehicle after its snapshot was edited."""
+        self._field_cache.pop(vin, None)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only the listeners whose part of the data changed."""
+        self._async_notify_changes(self._notified_data.keys() | (self.data or {}).keys())
+
+    @callback
+    def async_update_vehicle_listeners(self, vin: str) -> None:
+        """Notify the entities of one vehicle and the account-wide entities."""
+        self._async_notify_changes((vin,))
+
+    @callback
+    def _async_notify_changes(self, vins: Iterable[str]) -> None:
+        """Diff the given vehicles against what listeners last saw and notify."""
+        started = time.monotonic()
+        changed: dict[str, set[str]] = {}
+        for vin in vins:
+            # Applied again, so values the data now confirms or that expired go
+            self._vehicle_views.pop(vin, None)
+            new = self.get_vehicle_data(vin)
+            if new is not self._notified_data.get(vin):
+                self.async_invalidate_fields(vin)
+            sections = get_changed_sections(self._notified_data.get(vin), new)
+            if sections:
+                changed[vin] = sections
+            if new is None:
+                self._notified_data.pop(vin, None)
+            else:
+                self._notified_data[vin] = new
+
+        # Entities go unavailable or recover with the coordinator, so a change
+        # in the update result reaches everyone
+        notify_all = self.last_update_success != self._last_notified_success
+        self._last_notified_success = self.last_update_success
+        if changed and self.last_update_success:
+            self._async_save_snapshot()
+            # The client logs in again by itself when a token is rejected
+            self.async_save_session()
+
+        for update_callback, context in list(self._listeners.values()):
+            if notify_all or listener_wants_update(context, changed):
+                update_callback()
+        self.poll_profiler.record_notify(time.monotonic() - started)
+
+    async def async_shutdown(self) -> None:
+        """Send pending writes, cancel scheduled refreshes and stop the transport."""
+        # Settings and climate commands from just before an unload still get sent
+        await self.write_debouncer.async_flush()
+        await self.climate_batcher.async_flush()
+        self.refresh_broker.async_shutdown()
+        self.confirmations.async_shutdown()
+        self.climate_batcher.async_shutdown()
+        self.overlay.async_shutdown()
+        if self._unsub_reset:
+            self._unsub_reset()
+            self._unsub_reset = None
+        while self._unsub_vehicle_coordinators:
+            self._unsub_vehicle_coordinators.pop()()
+        for vehicle_coordinator in self.vehicle_coordinators.values():
+            await vehicle_coordinator.async_shutdown()
+        await super().async_shutdown()
+        await self.request_stats.async_shutdown()
+        await self.transport.async_shutdown()
+
     async def async_inc_invoke(self):
         await self.request_stats.async_inc_invoke()
+
+    @callback
+    def async_debounce_write(
+        self, vin: str, target: str, changes: dict[str, Any], write: WriteCallback
+    ) -> None:
+        """Write settings of a vehicle once they stop changing.
+
+        Changes to the same target are merged, and write is called with all
+        of them after the write delay has passed without another change.
+        """
+        self.write_debouncer.async_schedule(vin, target, changes, write)
+
+    async def async_send_climate_command(
+        self, vin: str, parameters: list[dict[str, str]]
+    ) -> None:
+        """Send ZAF climate parameters, merged with any sent at the same time."""
+        await self.climate_batcher.async_send(vin, parameters)
+
+    async def _async_send_climate_parameters(
+        self, vin: str, parameters: list[dict[str, str]]
+    ) -> None:
+        """Send merged climate parameters to a vehicle in one invoke."""
+        vehicle = self.get_vehicle_by_vin(vin)
+        if vehicle is None:
+            return
+        await self.async_inc_invoke()
+        await self.async_call_api(
+            vehicle.do_remote_control, "start", "ZAF", {"serviceParameters": parameters}
+        )
+
+
+class ZeekrVehicleCoordinator(DataUpdateCoordinator):
+    """Poll a single vehicle on its own schedule for a ZeekrCoordinator."""
+
+    def __init__(
+        self, hass: HomeAssistant, parent: ZeekrCoordinator, vehicle: Vehicle
+    ) -> None:
+        """Initialize."""
+        self.parent = parent
+        self.vehicle = vehicle
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_{vehicle.vin}",
+            update_interval=parent.scheduler.base_interval,
+        )
+
+    async def _async_update_data(self) -> dict:
+        """Fetch data for the vehicle and pick the interval until the next poll."""
+        with self.parent.poll_profiler.cycle():
+            result = await self.parent._async_update_vehicle(self.vehicle)
+        if result is None:
+            raise UpdateFailed(f"Error fetching status for {self.vehicle.vin}")
+        _, vehicle_data = result
+        self.parent.schedule_vehicle(self.vehicle.vin, vehicle_data)
+        self.update_interval = self.parent.get_vehicle_interval(self.vehicle.vin)
+        return vehicle_data
@@ -14,8 +14,14 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .confirm import expect_field
 from .const import DOMAIN
 from .coordinator import ZeekrCoordinator
+from .entity import ZeekrVehicleMixin
+from .fields import FIELDS, WINDOW_POSITIONS
+
+# Where the sunshade and window states live in a vehicle snapshot
+CLIMATE_STATUS = ("additionalVehicleStatus", "climateStatus")
 
 
 async def async_setup_entry(
@@ -32,13 +38,20 @@ async def async_setup_entry(
         entities.append(ZeekrWindows(coordinator, vin))
 
         # Add individual read-only windows
-        for win in ["Driver", "Passenger", "DriverRear", "PassengerRear"]:
+        for win in WINDOW_POSITIONS:
             entities.append(ZeekrWindow(coordinator, vin, win, f"Window {win}"))
 
     async_add_entities(entities)
 
 
-class ZeekrSunshade(CoordinatorEntity, CoverEntity):
+def _are_windows_closed(data: dict[str, Any]) -> bool:
+    """Return True if a vehicle snapshot reports every window closed."""
+    return all(
+        FIELDS[f"window_closed_{win.lower()}"].extract(data) for win in WINDOW_POSITIONS
+    )
+
+
+class ZeekrSunshade(ZeekrVehicleMixin, CoordinatorEntity, CoverEntity):
     """Zeekr Sunshade class."""
 
     _attr_has_entity_name = True
@@ -47,7 +60,7 @@ class ZeekrSunshade(CoordinatorEntity, CoverEntity):
 
     def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
         """Initialize the cover entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, (vin, "climateStatus"))
         self.vin = vin
         self._attr_name = "Sunshade"
         self._attr_unique_id = f"{vin}_sunshade"
@@ -55,20 +68,8 @@ class ZeekrSunshade(CoordinatorEntity, CoverEntity):
     @property
     def is_closed(self) -> bool | None:
         """Return if the cover is closed or not."""
-        try:
-            val = (
-                self.coordinator.data.get(self.vin, {})
-                .get("additionalVehicleStatus", {})
-                .get("climateStatus", {})
-                .get("curtainOpenStatus")
-            )
-            if val is None:
-                return None
-            # User: "2" (open), "1" (closed)
-            # is_closed expects True if closed
-            return str(val) == "1"
-        except (ValueError, TypeError, AttributeError):
-            return None
+        # "2" (open), "1" (closed)
+        return self.coordinator.get_field_value(self.vin, "sunshade_closed")
 
     @property
     def current_cover_position(self) -> int | None:
@@ -76,16 +77,7 @@ class ZeekrSunshade(CoordinatorEntity, CoverEntity):
 
         0 is closed, 100 is open.
         """
-        try:
-            val = (
-                self.coordinator.data.get(self.vin, {})
-                .get("additionalVehicleStatus", {})
-                .get("climateStatus", {})
-                .get("curtainPos")
-            )
-            return int(val) if val is not None else None
-        except (ValueError, TypeError, AttributeError):
-            return None
+        return self.coordinator.get_field_value(self.vin, "sunshade_position")
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open the cover."""
@@ -105,12 +97,13 @@ class ZeekrSunshade(CoordinatorEntity, CoverEntity):
         }
 
         await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
+        await self.coordinator.async_call_api(
             vehicle.do_remote_control, command, service_id, setting
         )
         self._update_local_state_optimistically(is_open=True)
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_request_vehicle_refresh(
+            self.vin, expect=expect_field(FIELDS["sunshade_closed"], False)
+        )
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close cover."""
@@ -130,31 +123,24 @@ class ZeekrSunshade(CoordinatorEntity, CoverEntity):
         }
 
         await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
+        await self.coordinator.async_call_api(
             vehicle.do_remote_control, command, service_id, setting
         )
         self._update_local_state_optimistically(is_open=False)
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_request_vehicle_refresh(
+            self.vin, expect=expect_field(FIELDS["sunshade_closed"], True)
+        )
 
     def _update_local_state_optimistically(self, is_open: bool) -> None:
-        """Update the coordinator data to reflect the change immediately."""
-        data = self.coordinator.data.get(self.vin)
-        if not data:
-            return
-
-        climate_status = (
-            data.setdefault("additionalVehicleStatus", {})
-            .setdefault("climateStatus", {})
+        """Show the new state until the vehicle confirms it."""
+        self.coordinator.async_set_optimistic(
+            self.vin,
+            {
+                CLIMATE_STATUS + ("curtainOpenStatus",): "2" if is_open else "1",
+                CLIMATE_STATUS + ("curtainPos",): 100 if is_open else 0,
+            },
         )
 
-        if is_open:
-            climate_status["curtainOpenStatus"] = "2"
-            climate_status["curtainPos"] = 100
-        else:
-            climate_status["curtainOpenStatus"] = "1"
-            climate_status["curtainPos"] = 0
-
     @property
     def device_info(self):
         """Return device info."""
@@ -165,7 +151,7 @@ class ZeekrSunshade(CoordinatorEntity, CoverEntity):
         }
 
 
-class ZeekrWindows(CoordinatorEntity, CoverEntity):
+class ZeekrWindows(ZeekrVehicleMixin, CoordinatorEntity, CoverEntity):
     """Zeekr Windows class (controls all windows)."""
 
     _attr_has_entity_name = True
@@ -174,7 +160,7 @@ class ZeekrWindows(CoordinatorEntity, CoverEntity):
 
     def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
         """Initialize the cover entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, (vin, "climateStatus"))
         self.vin = vin
         self._attr_name = "All Windows"
         self._attr_unique_id = f"{vin}_all_windows"
@@ -182,20 +168,14 @@ class ZeekrWindows(CoordinatorEntity, CoverEntity):
     @property
     def is_closed(self) -> bool | None:
         """Return if the windows are closed (all closed)."""
-        data = self.coordinator.data.get(self.vin, {})
-        climate_status = data.get("additionalVehicleStatus", {}).get("climateStatus", {})
-
-        # Check all 4 windows
         # Status code mapping based on API observations:
         # "1" = Open (or partially open)
         # "2" = Closed
         # "0" = Fully Closed (Position 0%)
-
-        for win in ["Driver", "Passenger", "DriverRear", "PassengerRear"]:
-            status = climate_status.get(f"winStatus{win}")
-            if str(status) != "2":
-                return False
-        return True
+        return all(
+            self.coordinator.get_field_value(self.vin, f"window_closed_{win.lower()}")
+            for win in WINDOW_POSITIONS
+        )
 
     @property
     def current_cover_position(self) -> int | None:
@@ -203,24 +183,17 @@ class ZeekrWindows(CoordinatorEntity, CoverEntity):
 
         0 is closed, 100 is open.
         """
-        data = self.coordinator.data.get(self.vin, {})
-        climate_status = data.get("additionalVehicleStatus", {}).get("climateStatus", {})
-
-        total_pos = 0
-        count = 0
-
-        for win in ["Driver", "Passenger", "DriverRear", "PassengerRear"]:
-            pos = climate_status.get(f"winPos{win}")
+        positions = []
+        for win in WINDOW_POSITIONS:
+            pos = self.coordinator.get_field_value(
+                self.vin, f"window_position_{win.lower()}"
+            )
             if pos is not None:
-                try:
-                    total_pos += int(pos)
-                    count += 1
-                except (ValueError, TypeError):
-                    pass
+                positions.append(pos)
 
-        if count == 0:
+        if not positions:
             return None
-        return int(total_pos / count)
+        return int(sum(positions) / len(positions))
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open all windows."""
@@ -240,12 +213,13 @@ class ZeekrWindows(CoordinatorEntity, CoverEntity):
         }
 
         await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
+        await self.coordinator.async_call_api(
             vehicle.do_remote_control, command, service_id, setting
         )
         self._update_local_state_optimistically(is_open=True)
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_request_vehicle_refresh(
+            self.vin, expect=lambda data: not _are_windows_closed(data)
+        )
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close all windows."""
@@ -265,31 +239,24 @@ class ZeekrWindows(CoordinatorEntity, CoverEntity):
         }
 
         await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
+        await self.coordinator.async_call_api(
             vehicle.do_remote_control, command, service_id, setting
         )
         self._update_local_state_optimistically(is_open=False)
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
-
-    def _update_local_state_optimistically(self, is_open: bool) -> None:
-        """Update the coordinator data to reflect the change immediately."""
-        data = self.coordinator.data.get(self.vin)
-        if not data:
-            return
-
-        climate_status = (
-            data.setdefault("additionalVehicleStatus", {})
-            .setdefault("climateStatus", {})
+        self.coordinator.async_request_vehicle_refresh(
+            self.vin, expect=_are_windows_closed
         )
 
-        # Update all 4 windows
+    def _update_local_state_optimistically(self, is_open: bool) -> None:
+        """Show the new state of all 4 windows until the vehicle confirms it."""
         status_val = "1" if is_open else "2"
         pos_val = 100 if is_open else 0
 
-        for win in ["Driver", "Passenger", "DriverRear", "PassengerRear"]:
-            climate_status[f"winStatus{win}"] = status_val
-            climate_status[f"winPos{win}"] = pos_val
+        values: dict[tuple[str, ...], Any] = {}
+        for win in WINDOW_POSITIONS:
+            values[CLIMATE_STATUS + (f"winStatus{win}",)] = status_val
+            values[CLIMATE_STATUS + (f"winPos{win}",)] = pos_val
+        self.coordinator.async_set_optimistic(self.vin, values)
 
     @property
     def device_info(self):
@@ -301,7 +268,7 @@ class ZeekrWindows(CoordinatorEntity, CoverEntity):
         }
 
 
-class ZeekrWindow(CoordinatorEntity, CoverEntity):
+class ZeekrWindow(ZeekrVehicleMixin, CoordinatorEntity, CoverEntity):
     """Zeekr Window (Read-Only) class."""
 
     _attr_has_entity_name = True
@@ -310,7 +277,7 @@ class ZeekrWindow(CoordinatorEntity, CoverEntity):
 
     def __init__(self, coordinator: ZeekrCoordinator, vin: str, win_key: str, win_name: str) -> None:
         """Initialize the cover entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, (vin, "climateStatus"))
         self.vin = vin
         self.win_key = win_key
         self._attr_name = win_name
@@ -319,33 +286,17 @@ class ZeekrWindow(CoordinatorEntity, CoverEntity):
     @property
     def is_closed(self) -> bool | None:
         """Return if the window is closed."""
-        try:
-            val = (
-                self.coordinator.data.get(self.vin, {})
-                .get("additionalVehicleStatus", {})
-                .get("climateStatus", {})
-                .get(f"winStatus{self.win_key}")
-            )
-            if val is None:
-                return None
-            # "2" is Closed, "1" is Open
-            return str(val) == "2"
-        except (ValueError, TypeError, AttributeError):
-            return None
+        # "2" is Closed, "1" is Open
+        return self.coordinator.get_field_value(
+            self.vin, f"window_closed_{self.win_key.lower()}"
+        )
 
     @property
     def current_cover_position(self) -> int | None:
         """Return current position of cover."""
-        try:
-            val = (
-                self.coordinator.data.get(self.vin, {})
-                .get("additionalVehicleStatus", {})
-                .get("climateStatus", {})
-                .get(f"winPos{self.win_key}")
-            )
-            return int(val) if val is not None else None
-        except (ValueError, TypeError, AttributeError):
-            return None
+        return self.coordinator.get_field_value(
+            self.vin, f"window_position_{self.win_key.lower()}"
+        )
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open the cover (Not supported)."""
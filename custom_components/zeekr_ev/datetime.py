@@ -13,6 +13,7 @@ from homeassistant.helpers.restore_state import RestoreEntity
 
 from .const import DOMAIN
 from .coordinator import ZeekrCoordinator
+from .endpoints import ENDPOINT_TRAVEL_PLAN
 from .entity import ZeekrEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -46,7 +47,7 @@ class ZeekrDepartureTime(ZeekrEntity, DateTimeEntity, RestoreEntity):
 
     def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
         """Initialize the datetime entity."""
-        super().__init__(coordinator, vin)
+        super().__init__(coordinator, vin, "travelPlan")
         self._attr_unique_id = f"{vin}_departure_time"
         self._fallback_value: datetime | None = None
 
@@ -54,7 +55,7 @@ class ZeekrDepartureTime(ZeekrEntity, DateTimeEntity, RestoreEntity):
     def native_value(self) -> datetime | None:
         """Return the departure time from the travel plan."""
         try:
-            travel_plan = self.coordinator.data.get(self.vin, {}).get("travelPlan", {})
+            travel_plan = self.coordinator.plans.get_plan(self.vin, ENDPOINT_TRAVEL_PLAN)
             scheduled_time = travel_plan.get("scheduledTime")
             if scheduled_time:
                 epoch_ms = int(scheduled_time)
@@ -74,34 +75,17 @@ class ZeekrDepartureTime(ZeekrEntity, DateTimeEntity, RestoreEntity):
                 pass
 
     async def async_set_value(self, value: datetime) -> None:
-        """Set a new departure time and push the travel plan to the API."""
-        vehicle = self.coordinator.get_vehicle_by_vin(self.vin)
-        if not vehicle:
+        """Set a new departure time in the travel plan.
+
+        The plan is written once edits stop coming in.
+        """
+        if not self.coordinator.get_vehicle_by_vin(self.vin):
             return
 
         # Convert datetime to epoch milliseconds
         epoch_ms = str(int(value.timestamp() * 1000))
 
-        # Get current travel plan values
-        current_plan = self.coordinator.data.get(self.vin, {}).get("travelPlan", {})
-        ac = current_plan.get("ac", "true")
-        ac_preconditioning = str(ac).lower() == "true"
-        bw = current_plan.get("bw", "0")
-        steering_wheel_heating = bw not in ("0", "", None)
-        current_command = current_plan.get("command", "start")
-
-        await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
-            vehicle.set_travel_plan,
-            current_command,
-            "",  # start_time not used for departure
-            epoch_ms,
-            ac_preconditioning,
-            steering_wheel_heating,
-        )
-
-        # Optimistic update
         self._fallback_value = value
-        plan_data = self.coordinator.data.setdefault(self.vin, {}).setdefault("travelPlan", {})
-        plan_data["scheduledTime"] = epoch_ms
-        self.async_write_ha_state()
+        self.coordinator.plans.async_edit(
+            self.vin, ENDPOINT_TRAVEL_PLAN, {"scheduledTime": epoch_ms}
+        )
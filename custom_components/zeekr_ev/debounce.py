@@ -0,0 +1,97 @@
+"""Debouncing of settings writes for Zeekr EV API Integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import partial
+import logging
+from typing import Any, Awaitable, Callable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+_LOGGER = logging.getLogger(__name__)
+
+WriteCallback = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+@dataclass
+class ZeekrPendingWrite:
+    """Changes to one write target of a vehicle that have not been sent yet."""
+
+    changes: dict[str, Any]
+    write: WriteCallback
+    cancel: Callable[[], Any]
+
+
+class ZeekrWriteDebouncer:
+    """Send only the final value of settings that change in quick succession.
+
+    Writes are keyed by vehicle and target (the endpoint the write changes).
+    Each change restarts the delay of its target and is merged into the
+    changes already pending, so dragging a slider, or editing both times of
+    the charge plan, costs one write once the value has settled.
+    """
+
+    def __init__(self, hass: HomeAssistant, delay: float) -> None:
+        """Initialize."""
+        self._hass = hass
+        self.delay = delay
+        self._pending: dict[tuple[str, str], ZeekrPendingWrite] = {}
+        self.requests = 0
+        self.writes = 0
+
+    def get_pending(self, vin: str, target: str) -> dict[str, Any]:
+        """Return the changes to a target that are waiting to be written."""
+        pending = self._pending.get((vin, target))
+        return pending.changes if pending else {}
+
+    @callback
+    def async_schedule(
+        self, vin: str, target: str, changes: dict[str, Any], write: WriteCallback
+    ) -> None:
+        """Write changes to a target once no more arrive within the delay."""
+        self.requests += 1
+        key = (vin, target)
+        pending = self._pending.pop(key, None)
+        if pending is not None:
+            pending.cancel()
+            changes = {**pending.changes, **changes}
+        self._pending[key] = ZeekrPendingWrite(
+            changes,
+            write,
+            async_call_later(self._hass, self.delay, partial(self._async_write, key)),
+        )
+
+    async def async_write_now(
+        self, vin: str, target: str, changes: dict[str, Any], write: WriteCallback
+    ) -> None:
+        """Write changes to a target, with any still pending for it, right away.
+
+        Unlike a delayed write, errors are raised to the caller.
+        """
+        self.requests += 1
+        pending = self._pending.pop((vin, target), None)
+        if pending is not None:
+            pending.cancel()
+            changes = {**pending.changes, **changes}
+        self.writes += 1
+        await write(changes)
+
+    async def _async_write(self, key: tuple[str, str], *args: Any) -> None:
+        """Send the changes pending for a target."""
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+        self.writes += 1
+        vin, target = key
+        try:
+            await pending.write(pending.changes)
+        except Exception as err:
+            _LOGGER.error("Error writing %s for %s: %s", target, vin, err)
+
+    async def async_flush(self) -> None:
+        """Send every pending write now."""
+        for key, pending in list(self._pending.items()):
+            pending.cancel()
+            await self._async_write(key)
@@ -11,6 +11,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import ZeekrCoordinator
+from .entity import ZeekrVehicleMixin
 
 
 async def async_setup_entry(
@@ -28,14 +29,14 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class ZeekrDeviceTracker(CoordinatorEntity, TrackerEntity):
+class ZeekrDeviceTracker(ZeekrVehicleMixin, CoordinatorEntity, TrackerEntity):
     """Zeekr Device Tracker."""
 
     _attr_has_entity_name = True
 
     def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
         """Initialize the tracker."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, (vin, "basicVehicleStatus"))
         self.vin = vin
         self._attr_name = "Location"
         self._attr_unique_id = f"{vin}_location"
@@ -48,24 +49,12 @@ class ZeekrDeviceTracker(CoordinatorEntity, TrackerEntity):
     @property
     def latitude(self) -> float | None:
         """Return latitude value of the device."""
-        data = self.coordinator.data.get(self.vin, {})
-        try:
-            val = data.get("basicVehicleStatus", {}).get("position", {}).get("latitude")
-            return float(val) if val else None
-        except (ValueError, TypeError):
-            return None
+        return self.coordinator.get_field_value(self.vin, "latitude")
 
     @property
     def longitude(self) -> float | None:
         """Return longitude value of the device."""
-        data = self.coordinator.data.get(self.vin, {})
-        try:
-            val = (
-                data.get("basicVehicleStatus", {}).get("position", {}).get("longitude")
-            )
-            return float(val) if val else None
-        except (ValueError, TypeError):
-            return None
+        return self.coordinator.get_field_value(self.vin, "longitude")
 
     @property
     def device_info(self):
@@ -0,0 +1,151 @@
+"""Diagnostics support for Zeekr EV API Integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from .const import (
+    CONF_HMAC_ACCESS_KEY,
+    CONF_HMAC_SECRET_KEY,
+    CONF_PASSWORD,
+    CONF_PASSWORD_PUBLIC_KEY,
+    CONF_PROD_SECRET,
+    CONF_USERNAME,
+    CONF_VIN_IV,
+    CONF_VIN_KEY,
+    DOMAIN,
+)
+from .coordinator import ZeekrCoordinator
+from .endpoints import SUB_ENDPOINTS
+from .request_stats import get_response_size
+
+# Credentials of the config entry, and the tokens shown by the API status sensor
+TO_REDACT = {
+    CONF_USERNAME,
+    CONF_PASSWORD,
+    CONF_HMAC_ACCESS_KEY,
+    CONF_HMAC_SECRET_KEY,
+    CONF_PASSWORD_PUBLIC_KEY,
+    CONF_PROD_SECRET,
+    CONF_VIN_KEY,
+    CONF_VIN_IV,
+    "auth_token",
+    "bearer_token",
+    "access_token",
+    "x_vins",
+    "vin",
+}
+
+
+def get_shape(data: Any) -> Any:
+    """Return the structure of data with every value replaced by its type.
+
+    Lists are shown by their first item.
+    """
+    if isinstance(data, dict):
+        return {key: get_shape(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [get_shape(data[0])] if data else []
+    return type(data).__name__
+
+
+def get_payload_sizes(data: dict[str, Any] | None) -> dict[str, Any]:
+    """Return the JSON size of vehicle data and of each section, largest first."""
+    sections = {
+        section: get_response_size(value) for section, value in (data or {}).items()
+    }
+    return {
+        "bytes": get_response_size(data),
+        "sections": dict(sorted(sections.items(), key=lambda item: -item[1])),
+    }
+
+
+def get_vehicle_label(labels: dict[str, str], vin: str) -> str:
+    """Return the label standing in for a VIN, numbering new VINs in turn."""
+    return labels.setdefault(vin, f"vehicle_{len(labels) + 1}")
+
+
+def get_fetched_at(coordinator: ZeekrCoordinator, vin: str) -> dict[str, str | None]:
+    """Return when each sub-endpoint in a vehicle's data was fetched."""
+    fetched_at = {}
+    for endpoint in SUB_ENDPOINTS:
+        fetched = coordinator.get_endpoint_fetched_at(vin, endpoint.key)
+        fetched_at[endpoint.key] = fetched.isoformat() if fetched else None
+    return fetched_at
+
+
+def get_entity_counts(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, int]:
+    """Return the number of entities of a config entry per platform."""
+    counts: dict[str, int] = {}
+    for entity in er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id):
+        counts[entity.domain] = counts.get(entity.domain, 0) + 1
+    return dict(sorted(counts.items()))
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: ZeekrCoordinator = hass.data[DOMAIN][entry.entry_id]
+    data = coordinator.data or {}
+    # Vehicles are numbered in the order of the data, then as they turn up
+    labels: dict[str, str] = {}
+    for vin in data:
+        get_vehicle_label(labels, vin)
+
+    poll_cycles = coordinator.poll_profiler.as_list()
+    for cycle in poll_cycles:
+        cycle["vehicles"] = [
+            {"vehicle": get_vehicle_label(labels, vehicle.pop("vin")), **vehicle}
+            for vehicle in cycle["vehicles"]
+        ]
+
+    stats = coordinator.request_stats
+    return async_redact_data(
+        {
+            "entry": {"data": dict(entry.data)},
+            "vehicles": {
+                get_vehicle_label(labels, vin): {
+                    "shape": get_shape(vehicle_data),
+                    "payload": get_payload_sizes(vehicle_data),
+                    "restored": coordinator.is_restored(vin),
+                    "stale_endpoints": sorted(coordinator.stale_endpoints.get(vin, ())),
+                    "fetched_at": get_fetched_at(coordinator, vin),
+                }
+                for vin, vehicle_data in data.items()
+            },
+            "total_bytes": sum(get_response_size(vehicle_data) for vehicle_data in data.values()),
+            "entities": get_entity_counts(hass, entry),
+            "poll_cycles": poll_cycles,
+            "request_stats": {
+                **stats.as_dict(),
+                "last_24_hours": stats.history.get_totals(24),
+                "last_30_days": stats.history.get_totals(),
+                "hourly": stats.history.get_hourly_requests(24),
+                "endpoints": stats.endpoints_as_dict(),
+            },
+            "budget": coordinator.budget.as_dict(),
+            "transport": coordinator.transport.as_dict(),
+            "circuit_breakers": {
+                get_vehicle_label(labels, vin): breakers
+                for vin, breakers in coordinator.breakers.as_dict().items()
+            },
+            "commands": {
+                "pending_confirmations": len(coordinator.confirmations.pending),
+                "confirmed": coordinator.confirmations.confirmed,
+                "timed_out": coordinator.confirmations.timed_out,
+                "optimistic_confirmed": coordinator.overlay.confirmed,
+                "optimistic_expired": coordinator.overlay.expired,
+                "write_requests": coordinator.write_debouncer.requests,
+                "writes": coordinator.write_debouncer.writes,
+                "climate_requests": coordinator.climate_batcher.requests,
+                "climate_sends": coordinator.climate_batcher.sends,
+            },
+        },
+        TO_REDACT,
+    )
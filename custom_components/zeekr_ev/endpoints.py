@@ -0,0 +1,130 @@
+"""Vehicle API endpoints polled by the Zeekr EV API Integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from .scheduler import VEHICLE_STATE_ASLEEP, get_vehicle_state
+
+ENDPOINT_STATUS = "status"
+ENDPOINT_REMOTE_CONTROL_STATE = "remote_control_state"
+ENDPOINT_CHARGING_STATUS = "charging_status"
+ENDPOINT_CHARGING_LIMIT = "charging_limit"
+ENDPOINT_CHARGE_PLAN = "charge_plan"
+ENDPOINT_TRAVEL_PLAN = "travel_plan"
+ENDPOINT_LOGIN = "login"
+ENDPOINT_VEHICLE_LIST = "vehicle_list"
+# Remote commands are named after their service id, e.g. invoke_RDL
+ENDPOINT_INVOKE_PREFIX = "invoke_"
+
+# Fetched on every poll of the vehicle
+TIER_REALTIME = "realtime"
+# Served from the last result until it is too old or marked dirty by a write
+TIER_SLOW = "slow"
+
+
+def is_charger_unplugged(status: dict[str, Any]) -> bool:
+    """Return True if the status snapshot reports no charger connected."""
+    value = (
+        (status.get("additionalVehicleStatus", {}) or {})
+        .get("electricVehicleStatus", {})
+        or {}
+    ).get("statusOfChargerConnection")
+    return value is not None and str(value).strip() == "0"
+
+
+def is_deep_sleep(status: dict[str, Any]) -> bool:
+    """Return True if the status snapshot reports the vehicle in deep sleep."""
+    return get_vehicle_state(status) == VEHICLE_STATE_ASLEEP
+
+
+@dataclass(frozen=True)
+class ZeekrEndpoint:
+    """Describe a sub-fetch made after the vehicle status."""
+
+    key: str
+    method: str
+    label: str
+    tier: str
+    path: tuple[str, ...]
+    update_existing: bool = False
+    # Rule evaluated against the fresh status: when it holds, the endpoint is
+    # not worth a request and its last value is carried forward instead.
+    skip_when: Callable[[dict[str, Any]], bool] | None = None
+
+    def should_skip(self, status: dict[str, Any]) -> bool:
+        """Return True if the status snapshot makes this sub-fetch pointless."""
+        return self.skip_when is not None and self.skip_when(status)
+
+    def merge(self, vehicle_data: dict[str, Any], result: dict[str, Any]) -> None:
+        """Merge an endpoint result into the vehicle status snapshot."""
+        target = vehicle_data
+        for key in self.path[:-1]:
+            target = target.setdefault(key, {})
+        if self.update_existing:
+            target.setdefault(self.path[-1], {}).update(result)
+        else:
+            target[self.path[-1]] = dict(result)
+
+
+SUB_ENDPOINTS: tuple[ZeekrEndpoint, ...] = (
+    ZeekrEndpoint(
+        ENDPOINT_REMOTE_CONTROL_STATE,
+        "get_remote_control_state",
+        "remote control status",
+        TIER_REALTIME,
+        ("additionalVehicleStatus", "remoteControlState"),
+        skip_when=is_deep_sleep,
+    ),
+    ZeekrEndpoint(
+        ENDPOINT_CHARGING_STATUS,
+        "get_charging_status",
+        "charging status",
+        TIER_REALTIME,
+        ("chargingStatus",),
+        update_existing=True,
+        skip_when=is_charger_unplugged,
+    ),
+    ZeekrEndpoint(
+        ENDPOINT_CHARGING_LIMIT,
+        "get_charging_limit",
+        "charging limit",
+        TIER_SLOW,
+        ("chargingLimit",),
+    ),
+    ZeekrEndpoint(
+        ENDPOINT_CHARGE_PLAN,
+        "get_charge_plan",
+        "charge plan",
+        TIER_SLOW,
+        ("chargePlan",),
+    ),
+    ZeekrEndpoint(
+        ENDPOINT_TRAVEL_PLAN,
+        "get_travel_plan",
+        "travel plan",
+        TIER_SLOW,
+        ("travelPlan",),
+    ),
+)
+
+SUB_ENDPOINTS_BY_KEY: dict[str, ZeekrEndpoint] = {
+    endpoint.key: endpoint for endpoint in SUB_ENDPOINTS
+}
+
+# Client and vehicle methods by the endpoint they call
+CALL_ENDPOINTS: dict[str, str] = {
+    "get_status": ENDPOINT_STATUS,
+    "login": ENDPOINT_LOGIN,
+    "get_vehicle_list": ENDPOINT_VEHICLE_LIST,
+    **{endpoint.method: endpoint.key for endpoint in SUB_ENDPOINTS},
+}
+
+
+def get_call_endpoint(func: Callable[..., Any], args: tuple[Any, ...]) -> str:
+    """Return the endpoint a client or vehicle method call goes to."""
+    name = getattr(func, "__name__", None) or "unknown"
+    if name == "do_remote_control" and len(args) > 1:
+        return f"{ENDPOINT_INVOKE_PREFIX}{args[1]}"
+    return CALL_ENDPOINTS.get(name, name)
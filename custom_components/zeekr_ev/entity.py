@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -12,25 +14,62 @@ import logging
 _LOGGER = logging.getLogger(__name__)
 
 
-class ZeekrEntity(CoordinatorEntity[ZeekrCoordinator]):
+class ZeekrVehicleMixin:
+    """State shared by every entity of a vehicle.
+
+    Mixed into a CoordinatorEntity of a ZeekrCoordinator that sets self.vin.
+    Until the first poll after a restart, the entity's values come from the
+    warm-start snapshot and are marked as restored. With per-vehicle
+    coordinators, the entity is unavailable while its vehicle's polls fail.
+    """
+
+    vin: str
+    coordinator: ZeekrCoordinator
+
+    @property
+    def available(self) -> bool:
+        """Return True if both the account's and the vehicle's last poll succeeded."""
+        return super().available and self.coordinator.is_vehicle_available(self.vin)  # type: ignore[misc]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the state attributes, marking values not polled yet."""
+        attributes = super().extra_state_attributes  # type: ignore[misc]
+        if self.coordinator.is_restored(self.vin):
+            return {**(attributes or {}), "restored": True}
+        return attributes
+
+
+class ZeekrEntity(ZeekrVehicleMixin, CoordinatorEntity[ZeekrCoordinator]):
     """Base entity for Zeekr."""
 
     _attr_has_entity_name = True
 
-    def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
-        """Initialize."""
-        super().__init__(coordinator)
+    def __init__(
+        self, coordinator: ZeekrCoordinator, vin: str, section: str | None = None
+    ) -> None:
+        """Initialize.
+
+        With a section (e.g. chargePlan) the entity is only updated when that
+        part of the vehicle's data changes.
+        """
+        super().__init__(coordinator, (vin, section) if section else vin)
 
         # Set device info
         self.vin = vin
         vehicle = coordinator.get_vehicle_by_vin(vin)
         if vehicle:
-            plate_no = getattr(vehicle, "data", {}).get("plateNo")
-            display_os_version = getattr(vehicle, "data", {}).get("displayOSVersion")
+            vehicle_info = getattr(vehicle, "data", {})
+        else:
+            # Set up from the warm-start snapshot before the vehicle list is in
+            vehicle_info = coordinator.restored_vehicles.get(vin)
+        if vehicle_info is not None:
+            plate_no = vehicle_info.get("plateNo")
+            display_os_version = vehicle_info.get("displayOSVersion")
 
             self._attr_device_info = DeviceInfo(
                 identifiers={(DOMAIN, vin)},
-                name=vehicle.vin,
+                name=vin,
                 manufacturer="Zeekr",
                 model=f"{plate_no} (OS Version {display_os_version})" if display_os_version else plate_no or "Zeekr EV",
             )
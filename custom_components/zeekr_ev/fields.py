@@ -0,0 +1,255 @@
+"""Vehicle status fields read by the Zeekr EV API Integration entities.
+
+Every value an entity shows is listed once in FIELDS, with the path to it in
+the vehicle snapshot and how to parse it. The coordinator caches the parsed
+values per poll, so entity properties are a dictionary lookup.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+# Top-level snapshot keys whose children are tracked as separate sections
+NESTED_SECTIONS = ("additionalVehicleStatus",)
+
+TIRE_POSITIONS = ("Driver", "Passenger", "DriverRear", "PassengerRear")
+WINDOW_POSITIONS = ("Driver", "Passenger", "DriverRear", "PassengerRear")
+
+# chargerState values reported while energy is flowing
+CHARGING_CHARGER_STATES = (1, 2, 15)
+
+
+@dataclass(frozen=True)
+class ZeekrField:
+    """Describe where a value lives in a vehicle snapshot and how to parse it."""
+
+    key: str
+    path: tuple[str, ...]
+    parser: Callable[[Any], Any] | None = None
+    # Used in place of a missing value before parsing
+    default: Any = None
+
+    @property
+    def section(self) -> str:
+        """Return the snapshot section the field belongs to."""
+        if len(self.path) > 2 and self.path[0] in NESTED_SECTIONS:
+            return self.path[1]
+        return self.path[0]
+
+    def extract(self, vehicle_data: dict[str, Any] | None) -> Any:
+        """Return the parsed value from a vehicle snapshot, or None."""
+        value: Any = vehicle_data
+        for key in self.path:
+            if not isinstance(value, dict):
+                value = None
+                break
+            value = value.get(key)
+        if value is None:
+            value = self.default
+        if value is None or self.parser is None:
+            return value
+        try:
+            return self.parser(value)
+        except (ValueError, TypeError):
+            return None
+
+    # A field can be used wherever entities take a value_fn
+    __call__ = extract
+
+
+def _is_one(value: Any) -> bool:
+    return str(value) == "1"
+
+
+def _is_two(value: Any) -> bool:
+    return str(value) == "2"
+
+
+def _is_not_zero(value: Any) -> bool:
+    return str(value) != "0"
+
+
+def _is_not_one(value: Any) -> bool:
+    return str(value) != "1"
+
+
+def _is_true(value: Any) -> bool:
+    return str(value).lower() in ("true", "1")
+
+
+def _is_charging(value: Any) -> bool:
+    return int(value) in CHARGING_CHARGER_STATES
+
+
+def _is_charging_switch_on(value: Any) -> bool:
+    # "2" (AC charging?), "1" (DC charging?), "25"/"26" stopped
+    return str(value) in ("1", "2")
+
+
+def _is_charge_lid_locked(value: Any) -> bool | None:
+    # "1" is open (unlocked), "2" is closed (locked)
+    return {"1": False, "2": True}.get(str(value))
+
+
+def _coordinate(value: Any) -> float | None:
+    return float(value) if value else None
+
+
+def _tenths(value: Any) -> float:
+    # e.g. a charging limit of 800 is 80.0 %
+    return float(value) / 10.0
+
+
+def _timestamp_ms(value: Any) -> datetime:
+    return datetime.fromtimestamp(int(value) / 1000, tz=timezone.utc)
+
+
+def _status(
+    key: str,
+    group: str,
+    name: str,
+    parser: Callable[[Any], Any] | None = None,
+    default: Any = None,
+) -> ZeekrField:
+    """Return a field under additionalVehicleStatus."""
+    return ZeekrField(key, ("additionalVehicleStatus", group, name), parser, default)
+
+
+def lock_field(name: str, group: str = "drivingSafetyStatus") -> ZeekrField:
+    """Return the field holding whether a latch or lock is locked."""
+    if name == "chargeLidDcAcStatus":
+        parser = _is_charge_lid_locked
+    elif name.endswith("OpenStatus"):
+        # Closed counts as locked
+        parser = _is_not_one
+    else:
+        parser = _is_one
+    return _status(f"lock_{name}", group, name, parser)
+
+
+FIELDS: dict[str, ZeekrField] = {
+    field.key: field
+    for field in (
+        # Battery and range
+        _status("battery_level", "electricVehicleStatus", "chargeLevel"),
+        _status("range", "electricVehicleStatus", "distanceToEmptyOnBatteryOnly"),
+        _status(
+            "distance_to_empty_on_battery_20_soc",
+            "electricVehicleStatus",
+            "distanceToEmptyOnBattery20Soc",
+        ),
+        _status(
+            "distance_to_empty_on_battery_100_soc",
+            "electricVehicleStatus",
+            "distanceToEmptyOnBattery100Soc",
+        ),
+        _status("time_to_fully_charged", "electricVehicleStatus", "timeToFullyCharged"),
+        # Charging
+        _status(
+            "charging_status", "electricVehicleStatus", "chargerState", _is_charging, "0"
+        ),
+        _status("charging", "electricVehicleStatus", "chargerState", _is_charging_switch_on),
+        _status("plugged_in", "electricVehicleStatus", "statusOfChargerConnection", int),
+        # As reported by the charging status endpoint rather than the status
+        ZeekrField("charge_voltage", ("chargingStatus", "chargeVoltage")),
+        ZeekrField("charge_current", ("chargingStatus", "chargeCurrent")),
+        ZeekrField("charge_power", ("chargingStatus", "chargePower")),
+        ZeekrField("charge_speed", ("chargingStatus", "chargeSpeed")),
+        ZeekrField("charging_limit", ("chargingLimit", "soc"), _tenths),
+        # Driving
+        _status("odometer", "maintenanceStatus", "odometer"),
+        _status("trip_2_distance", "runningStatus", "tripMeter2", float),
+        _status("trip_2_avg_speed", "runningStatus", "avgSpeed"),
+        _status("trip_2_avg_consumption", "electricVehicleStatus", "averPowerConsumption"),
+        ZeekrField("usage_mode", ("basicVehicleStatus", "usageMode")),
+        ZeekrField("engine_status", ("basicVehicleStatus", "engineStatus")),
+        ZeekrField("latitude", ("basicVehicleStatus", "position", "latitude"), _coordinate),
+        ZeekrField("longitude", ("basicVehicleStatus", "position", "longitude"), _coordinate),
+        # Tires
+        *(
+            _status(f"tire_pressure_{tire.lower()}", "maintenanceStatus", f"tyreStatus{tire}")
+            for tire in TIRE_POSITIONS
+        ),
+        *(
+            _status(f"tire_temperature_{tire.lower()}", "maintenanceStatus", f"tyreTemp{tire}")
+            for tire in TIRE_POSITIONS
+        ),
+        *(
+            _status(
+                f"tire_pre_warning_{tire.lower()}",
+                "maintenanceStatus",
+                f"tyrePreWarning{tire}",
+                _is_not_zero,
+            )
+            for tire in TIRE_POSITIONS
+        ),
+        *(
+            _status(
+                f"tire_temp_warning_{tire.lower()}",
+                "maintenanceStatus",
+                f"tyreTempWarning{tire}",
+                _is_not_zero,
+            )
+            for tire in TIRE_POSITIONS
+        ),
+        # Doors
+        _status("door_open_driver", "drivingSafetyStatus", "doorOpenStatusDriver", _is_one),
+        _status("door_open_passenger", "drivingSafetyStatus", "doorOpenStatusPassenger", _is_one),
+        _status(
+            "door_open_driver_rear", "drivingSafetyStatus", "doorOpenStatusDriverRear", _is_one
+        ),
+        _status(
+            "door_open_passenger_rear",
+            "drivingSafetyStatus",
+            "doorOpenStatusPassengerRear",
+            _is_one,
+        ),
+        _status("trunk_open", "drivingSafetyStatus", "trunkOpenStatus", _is_one),
+        _status("hood_open", "drivingSafetyStatus", "engineHoodOpenStatus", _is_one),
+        # Locks
+        lock_field("centralLockingStatus"),
+        lock_field("doorLockStatusDriver"),
+        lock_field("doorLockStatusPassenger"),
+        lock_field("doorLockStatusDriverRear"),
+        lock_field("doorLockStatusPassengerRear"),
+        lock_field("trunkLockStatus"),
+        lock_field("engineHoodOpenStatus"),
+        lock_field("electricParkBrakeStatus"),
+        lock_field("chargeLidDcAcStatus", "electricVehicleStatus"),
+        # Climate
+        _status("interior_temp", "climateStatus", "interiorTemp"),
+        _status("interior_temp_value", "climateStatus", "interiorTemp", float),
+        _status("climate_updated", "climateStatus", "updateTime", _timestamp_ms),
+        _status("pre_climate_active", "climateStatus", "preClimateActive", _is_true),
+        _status("defrost", "climateStatus", "defrost", _is_one),
+        _status("steering_wheel_heat", "climateStatus", "steerWhlHeatingSts", _is_one),
+        _status("sentry_mode", "remoteControlState", "vstdModeState", _is_true),
+        # Seats (keyed by the status name the select entities are given)
+        *(
+            _status(name, "climateStatus", name, int)
+            for name in (
+                "drvHeatSts",
+                "passHeatingSts",
+                "rrHeatingSts",
+                "rlHeatingSts",
+                "drvVentSts",
+                "drvVentDetail",
+                "passVentSts",
+                "passVentDetail",
+            )
+        ),
+        # Sunshade and windows
+        _status("sunshade_closed", "climateStatus", "curtainOpenStatus", _is_one),
+        _status("sunshade_position", "climateStatus", "curtainPos", int),
+        *(
+            _status(f"window_closed_{win.lower()}", "climateStatus", f"winStatus{win}", _is_two)
+            for win in WINDOW_POSITIONS
+        ),
+        *(
+            _status(f"window_position_{win.lower()}", "climateStatus", f"winPos{win}", int)
+            for win in WINDOW_POSITIONS
+        ),
+    )
+}
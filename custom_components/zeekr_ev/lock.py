@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from typing import Any
 
 from homeassistant.components.lock import LockEntity
@@ -11,8 +10,11 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .confirm import expect_field
 from .const import DOMAIN
 from .coordinator import ZeekrCoordinator
+from .entity import ZeekrVehicleMixin
+from .fields import lock_field
 
 # Delay before polling after a remote command (seconds)
 COMMAND_POLL_DELAY = 15
@@ -48,7 +50,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class ZeekrLock(CoordinatorEntity, LockEntity):
+class ZeekrLock(ZeekrVehicleMixin, CoordinatorEntity, LockEntity):
     """Zeekr Lock class representing various latch/lock states."""
 
     _attr_has_entity_name = True
@@ -62,49 +64,19 @@ class ZeekrLock(CoordinatorEntity, LockEntity):
         category: str,
     ) -> None:
         """Initialize the lock entity for a specific field."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, (vin, category))
         self.vin = vin
         self.field = field
         self.category = category
+        self._field = lock_field(field, category)
         self._attr_name = label
         self._attr_unique_id = f"{vin}_{field}"
 
     @property
     def is_locked(self) -> bool | None:
         """Return true if lock is locked."""
-        data = self.coordinator.data.get(self.vin, {})
-        try:
-            # category is either "drivingSafetyStatus" or "electricVehicleStatus"
-            # both are under "additionalVehicleStatus"
-            status = data.get("additionalVehicleStatus", {}).get(self.category, {})
-
-            val = status.get(self.field)
-            # None means unknown
-            if val is None:
-                return None
-
-            # Interpret values:
-            if self.field == "chargeLidDcAcStatus":
-                # "1" is open (unlocked), "2" is closed (locked)
-                # If it's not "1", we can assume locked or unknown, but based on "2" is closed:
-                if str(val) == "1":
-                    return False
-                if str(val) == "2":
-                    return True
-                # If unknown value, default to None or handle?
-                # Let's assume strict mapping or fallback. If val is neither, maybe None?
-                # User said "1" is open, "2" is closed.
-                return None
-
-            # Interpret values: many fields use "1" for active/locked, "0" for inactive/open
-            # For *OpenStatus fields, treat "0" (closed) as locked True
-            if self.field.endswith("OpenStatus"):
-                return str(val) != "1"
-
-            # For lock status fields and others, "1" -> locked
-            return str(val) == "1"
-        except (ValueError, TypeError, AttributeError):
-            return None
+        # None means unknown
+        return self.coordinator.get_field_value(self.vin, self._field)
 
     async def async_lock(self, **kwargs: Any) -> None:
         """Lock the car."""
@@ -144,18 +116,18 @@ class ZeekrLock(CoordinatorEntity, LockEntity):
 
         if command and service_id and setting:
             await self.coordinator.async_inc_invoke()
-            await self.hass.async_add_executor_job(
+            await self.coordinator.async_call_api(
                 vehicle.do_remote_control, command, service_id, setting
             )
 
             self._update_local_state_optimistically(locked=True)
-            self.async_write_ha_state()
 
-            # Schedule a delayed refresh to get updated state after car processes command
-            async def delayed_refresh():
-                await asyncio.sleep(COMMAND_POLL_DELAY)
-                await self.coordinator.async_request_refresh()
-            self.hass.async_create_task(delayed_refresh())
+            # Poll until the car reports it locked, once it had time to act
+            self.coordinator.async_request_vehicle_refresh(
+                self.vin,
+                delay=COMMAND_POLL_DELAY,
+                expect=expect_field(self._field, True),
+            )
 
     async def async_unlock(self, **kwargs: Any) -> None:
         """Unlock the car."""
@@ -197,36 +169,32 @@ class ZeekrLock(CoordinatorEntity, LockEntity):
 
         if command and service_id and setting:
             await self.coordinator.async_inc_invoke()
-            await self.hass.async_add_executor_job(
+            await self.coordinator.async_call_api(
                 vehicle.do_remote_control, command, service_id, setting
             )
 
             self._update_local_state_optimistically(locked=False)
-            self.async_write_ha_state()
 
-            # Schedule a delayed refresh to get updated state after car processes command
-            async def delayed_refresh():
-                await asyncio.sleep(COMMAND_POLL_DELAY)
-                await self.coordinator.async_request_refresh()
-            self.hass.async_create_task(delayed_refresh())
+            # Poll until the car reports it unlocked, once it had time to act
+            self.coordinator.async_request_vehicle_refresh(
+                self.vin,
+                delay=COMMAND_POLL_DELAY,
+                expect=expect_field(self._field, False),
+            )
 
     def _update_local_state_optimistically(self, locked: bool) -> None:
-        """Update the coordinator data to reflect the change immediately."""
-        data = self.coordinator.data.get(self.vin)
-        if not data:
-            return
-
-        status = (
-            data.setdefault("additionalVehicleStatus", {})
-            .setdefault(self.category, {})
-        )
-
+        """Show the new state until the vehicle confirms it."""
         if self.field == "centralLockingStatus":
             # Locked="1", Unlocked="0"
-            status[self.field] = "1" if locked else "0"
+            value = "1" if locked else "0"
         elif self.field == "chargeLidDcAcStatus":
             # Locked (Closed)="2", Unlocked (Open)="1"
-            status[self.field] = "2" if locked else "1"
+            value = "2" if locked else "1"
+        else:
+            return
+        self.coordinator.async_set_optimistic(
+            self.vin, {("additionalVehicleStatus", self.category, self.field): value}
+        )
 
     @property
     def device_info(self):
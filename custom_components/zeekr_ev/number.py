@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from homeassistant.components.number import NumberEntity, RestoreNumber
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, UnitOfTime
@@ -11,6 +13,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import ZeekrCoordinator
+from .endpoints import ENDPOINT_CHARGING_LIMIT
 from .entity import ZeekrEntity
 
 
@@ -107,7 +110,7 @@ class ZeekrChargingLimitNumber(ZeekrEntity, RestoreNumber):
 
     def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
         """Initialize the charging limit number."""
-        super().__init__(coordinator, vin)
+        super().__init__(coordinator, vin, "chargingLimit")
         self._attr_name = "Charging Limit"
         self._attr_unique_id = f"{vin}_charging_limit"
         self._attr_native_value: float | None = None
@@ -115,18 +118,8 @@ class ZeekrChargingLimitNumber(ZeekrEntity, RestoreNumber):
     @property
     def native_value(self) -> float | None:
         """Return the value reported by the coordinator."""
-        try:
-            val = (
-                self.coordinator.data.get(self.vin, {})
-                .get("chargingLimit", {})
-                .get("soc")
-            )
-            if val is not None:
-                # API returns value * 10 (e.g. 800 -> 80.0)
-                return float(val) / 10.0
-        except (ValueError, TypeError, AttributeError):
-            pass
-        return self._attr_native_value
+        value = self.coordinator.get_field_value(self.vin, "charging_limit")
+        return self._attr_native_value if value is None else value
 
     async def async_added_to_hass(self) -> None:
         """Handle entity which will be added."""
@@ -136,16 +129,38 @@ class ZeekrChargingLimitNumber(ZeekrEntity, RestoreNumber):
             self._attr_native_value = last_state.native_value
 
     async def async_set_native_value(self, value: float) -> None:
-        """Set new value."""
+        """Set new value.
+
+        The limit is shown straight away but only sent once the slider has
+        settled, so dragging it costs a single invoke.
+        """
+        if not self.coordinator.get_vehicle_by_vin(self.vin):
+            return
+
+        # API expects value * 10 (e.g. 80.2% -> 802)
+        # We handle full integers, so 80% -> 800
+        soc_value = int(value * 10)
+
+        # Optimistic update
+        self._attr_native_value = value
+        self.coordinator.async_set_optimistic(
+            self.vin, {("chargingLimit", "soc"): str(soc_value)}
+        )
+        self.async_write_ha_state()
+
+        self.coordinator.async_debounce_write(
+            self.vin, ENDPOINT_CHARGING_LIMIT, {"soc": soc_value}, self._async_write_limit
+        )
+
+    async def _async_write_limit(self, changes: dict[str, Any]) -> None:
+        """Send the settled charging limit to the vehicle."""
         vehicle = self.coordinator.get_vehicle_by_vin(self.vin)
         if not vehicle:
             return
 
         command = "start"
         service_id = "RCS"
-        # API expects value * 10 (e.g. 80.2% -> 802)
-        # We handle full integers, so 80% -> 800
-        soc_value = int(value * 10)
+        soc_value = changes["soc"]
 
         setting = {
             "serviceParameters": [
@@ -165,8 +180,7 @@ class ZeekrChargingLimitNumber(ZeekrEntity, RestoreNumber):
         }
 
         await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
+        await self.coordinator.async_call_api(
             vehicle.do_remote_control, command, service_id, setting
         )
-        self._attr_native_value = value
-        self.async_write_ha_state()
+        self.coordinator.async_request_vehicle_refresh(self.vin, ENDPOINT_CHARGING_LIMIT)
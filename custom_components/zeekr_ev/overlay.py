@@ -0,0 +1,172 @@
+"""Optimistic state for Zeekr EV API Integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Mapping
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+# Seconds an optimistic value is shown without the vehicle confirming it;
+# outlasts the confirmation of a command (see confirm.CONFIRM_TIMEOUT)
+OPTIMISTIC_TTL = 60
+
+Path = tuple[str, ...]
+
+
+def get_path(data: Any, path: Path) -> Any:
+    """Return the value at a path of nested dicts, or None."""
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def set_path(data: dict[str, Any], path: Path, value: Any) -> dict[str, Any]:
+    """Return a copy of data with the value at a path replaced.
+
+    Only the dicts along the path are copied, so every other section keeps
+    its identity.
+    """
+    key, *rest = path
+    if not rest:
+        return {**data, key: value}
+    child = data.get(key)
+    return {**data, key: set_path(child if isinstance(child, dict) else {}, tuple(rest), value)}
+
+
+def _matches(current: Any, value: Any) -> bool:
+    """Return True if confirmed data holds an optimistic value."""
+    # The API is not consistent about numbers and strings
+    return current == value or (current is not None and str(current) == str(value))
+
+
+@dataclass
+class ZeekrOptimisticValue:
+    """A value shown before the vehicle has reported it."""
+
+    value: Any
+    expires: float
+
+
+class ZeekrOptimisticOverlay:
+    """Optimistic values per vehicle, laid over the data the vehicle reported.
+
+    Commands and settings writes show their effect straight away by setting
+    values here rather than editing the coordinator data, so a poll that
+    still has the old state doesn't flip the entity back. A value is dropped
+    once the reported data holds it, or when it expires; expiry notifies the
+    vehicle's listeners so they show the reported state again.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        on_expire: Callable[[str], None],
+        ttl: float = OPTIMISTIC_TTL,
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._on_expire = on_expire
+        self.ttl = ttl
+        self._values: dict[str, dict[Path, ZeekrOptimisticValue]] = {}
+        self._cancel_expire: dict[str, Callable[[], Any]] = {}
+        self.confirmed = 0
+        self.expired = 0
+
+    def get_values(self, vin: str) -> dict[Path, Any]:
+        """Return the optimistic values of a vehicle."""
+        return {path: entry.value for path, entry in self._values.get(vin, {}).items()}
+
+    @callback
+    def async_set(self, vin: str, values: Mapping[Path, Any]) -> None:
+        """Show values of a vehicle until its data confirms them or they expire."""
+        expires = self._hass.loop.time() + self.ttl
+        self._values.setdefault(vin, {}).update(
+            (path, ZeekrOptimisticValue(value, expires)) for path, value in values.items()
+        )
+        self._async_schedule(vin)
+
+    def apply(self, vin: str, data: dict[str, Any] | None) -> dict[str, Any] | None:
+        """Return a vehicle's data with its optimistic values laid over it.
+
+        Values the data already holds, and expired ones, are dropped.
+        """
+        values = self._values.get(vin)
+        if not values or data is None:
+            return data
+        now = self._hass.loop.time()
+        for path, entry in list(values.items()):
+            if now >= entry.expires:
+                del values[path]
+                self.expired += 1
+            elif _matches(get_path(data, path), entry.value):
+                del values[path]
+                self.confirmed += 1
+            else:
+                data = set_path(data, path, entry.value)
+        if not values:
+            self.async_discard(vin)
+        return data
+
+    @callback
+    def async_discard(self, vin: str, values: Mapping[Path, Any] | None = None) -> bool:
+        """Drop optimistic values of a vehicle; return True if any were dropped.
+
+        With values, only those still shown are dropped; a path set again
+        since keeps its newer value. Without, every value of the vehicle is.
+        """
+        current = self._values.get(vin)
+        dropped = False
+        if values is not None and current:
+            for path, value in values.items():
+                entry = current.get(path)
+                if entry is not None and entry.value == value:
+                    del current[path]
+                    dropped = True
+            if current:
+                return dropped
+        if cancel := self._cancel_expire.pop(vin, None):
+            cancel()
+        return bool(self._values.pop(vin, None)) or dropped
+
+    @callback
+    def _async_schedule(self, vin: str) -> None:
+        """Wake up when the first value of a vehicle expires."""
+        if cancel := self._cancel_expire.pop(vin, None):
+            cancel()
+        values = self._values.get(vin)
+        if not values:
+            return
+        expires = min(entry.expires for entry in values.values())
+        self._cancel_expire[vin] = async_call_later(
+            self._hass,
+            max(expires - self._hass.loop.time(), 0),
+            partial(self._async_expire, vin),
+        )
+
+    @callback
+    def _async_expire(self, vin: str, *args: Any) -> None:
+        """Drop the expired values of a vehicle and notify its listeners."""
+        self._cancel_expire.pop(vin, None)
+        values = self._values.get(vin, {})
+        now = self._hass.loop.time()
+        for path, entry in list(values.items()):
+            if now >= entry.expires:
+                del values[path]
+                self.expired += 1
+        if not values:
+            self._values.pop(vin, None)
+        self._on_expire(vin)
+        self._async_schedule(vin)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop every optimistic value."""
+        for cancel in self._cancel_expire.values():
+            cancel()
+        self._cancel_expire.clear()
+        self._values.clear()
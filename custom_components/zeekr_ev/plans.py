@@ -0,0 +1,120 @@
+"""Charge and travel plan editing for Zeekr EV API Integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable
+
+from homeassistant.core import callback
+
+from .endpoints import ENDPOINT_CHARGE_PLAN, ENDPOINT_TRAVEL_PLAN
+
+if TYPE_CHECKING:
+    from .coordinator import ZeekrCoordinator
+
+
+def _charge_plan_args(plan: dict[str, Any]) -> tuple[Any, ...]:
+    """Return the set_charge_plan arguments for a charge plan."""
+    return (
+        plan.get("startTime", "00:00"),
+        plan.get("endTime", "06:00"),
+        plan.get("command", "start"),
+        plan.get("bcCycleActive", False),
+        plan.get("bcTempActive", False),
+    )
+
+
+def _travel_plan_args(plan: dict[str, Any]) -> tuple[Any, ...]:
+    """Return the set_travel_plan arguments for a travel plan."""
+    return (
+        plan.get("command", "start"),
+        "",  # start_time not used for departure
+        plan.get("scheduledTime", ""),
+        str(plan.get("ac", "true")).lower() == "true",
+        plan.get("bw", "0") not in ("0", "", None),
+    )
+
+
+@dataclass(frozen=True)
+class ZeekrPlanType:
+    """Describe a plan that is read from an endpoint and written as a whole."""
+
+    endpoint: str
+    section: str
+    method: str
+    build_args: Callable[[dict[str, Any]], tuple[Any, ...]]
+
+
+PLAN_TYPES: dict[str, ZeekrPlanType] = {
+    plan_type.endpoint: plan_type
+    for plan_type in (
+        ZeekrPlanType(ENDPOINT_CHARGE_PLAN, "chargePlan", "set_charge_plan", _charge_plan_args),
+        ZeekrPlanType(ENDPOINT_TRAVEL_PLAN, "travelPlan", "set_travel_plan", _travel_plan_args),
+    )
+}
+
+
+class ZeekrPlanEditor:
+    """Collect edits to the plans of each vehicle and write them together.
+
+    The API only takes a whole plan, so every write is built from the plan
+    last read from the vehicle with all pending edits laid over it. Edits
+    made close together, by entities or automations, are merged into one
+    write instead of each rebuilding the plan and overwriting the others.
+    """
+
+    def __init__(self, coordinator: ZeekrCoordinator) -> None:
+        """Initialize."""
+        self._coordinator = coordinator
+
+    def get_plan(self, vin: str, endpoint: str) -> dict[str, Any]:
+        """Return a plan of a vehicle with the pending edits applied."""
+        plan_type = PLAN_TYPES[endpoint]
+        return {
+            **(self._coordinator.get_vehicle_data(vin) or {}).get(plan_type.section, {}),
+            **self._coordinator.write_debouncer.get_pending(vin, endpoint),
+        }
+
+    @callback
+    def async_edit(self, vin: str, endpoint: str, changes: dict[str, Any]) -> None:
+        """Change plan fields now and write the plan once edits settle."""
+        self._apply(vin, endpoint, changes)
+        self._coordinator.async_debounce_write(
+            vin, endpoint, changes, partial(self._async_write, vin, endpoint)
+        )
+
+    async def async_apply(self, vin: str, endpoint: str, changes: dict[str, Any]) -> None:
+        """Change plan fields and write the plan, with any pending edits, now."""
+        self._apply(vin, endpoint, changes)
+        await self._coordinator.write_debouncer.async_write_now(
+            vin, endpoint, changes, partial(self._async_write, vin, endpoint)
+        )
+
+    def _apply(self, vin: str, endpoint: str, changes: dict[str, Any]) -> None:
+        """Show the edits on every entity of the plan before they are written."""
+        section = PLAN_TYPES[endpoint].section
+        self._coordinator.async_set_optimistic(
+            vin, {(section, key): value for key, value in changes.items()}
+        )
+
+    async def _async_write(self, vin: str, endpoint: str, changes: dict[str, Any]) -> None:
+        """Write a plan built from the shown plan and the edits.
+
+        The shown plan still holds earlier edits the vehicle hasn't reported
+        back yet, so writing this one doesn't undo them.
+        """
+        vehicle = self._coordinator.get_vehicle_by_vin(vin)
+        if not vehicle:
+            return
+        plan_type = PLAN_TYPES[endpoint]
+        plan = {
+            **(self._coordinator.get_vehicle_data(vin) or {}).get(plan_type.section, {}),
+            **changes,
+        }
+
+        await self._coordinator.async_inc_invoke()
+        await self._coordinator.async_call_api(
+            getattr(vehicle, plan_type.method), *plan_type.build_args(plan)
+        )
+        self._coordinator.async_request_vehicle_refresh(vin, endpoint)
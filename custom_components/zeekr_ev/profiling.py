@@ -0,0 +1,143 @@
+"""Poll cycle profiling for Zeekr EV API Integration."""
+
+from __future__ import annotations
+
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+import time
+from typing import Any, Iterator
+
+from homeassistant.util import dt as dt_util
+
+# Poll cycles kept in memory
+POLL_PROFILES = 20
+
+# Phases of a poll cycle
+PHASE_LOGIN = "login"
+PHASE_VEHICLE_LIST = "vehicle_list"
+PHASE_VEHICLES = "vehicles"  # all due vehicles, fetched in parallel
+PHASE_NOTIFY = "notify"
+# Phases of each vehicle within a cycle
+PHASE_STATUS = "status"
+PHASE_SUB_FETCH = "sub_fetch"
+PHASE_MERGE = "merge"
+
+# The cycle the running task (and the tasks it started) belongs to
+_current_profile: ContextVar[ZeekrPollProfile | None] = ContextVar(
+    "zeekr_ev_poll_profile", default=None
+)
+
+
+def _ms(seconds: float) -> float:
+    """Return seconds as rounded milliseconds."""
+    return round(seconds * 1000, 1)
+
+
+@dataclass
+class ZeekrPollProfile:
+    """Timings of one poll cycle, in seconds.
+
+    API call time is split into the wait for a worker thread and the time
+    the call ran on it, summed over every call of the cycle.
+    """
+
+    started: datetime
+    phases: dict[str, float] = field(default_factory=dict)
+    vehicles: dict[str, dict[str, float]] = field(default_factory=dict)
+    calls: int = 0
+    errors: int = 0
+    queue_wait: float = 0.0
+    network: float = 0.0
+    duration: float | None = None
+
+    def add_phase(self, phase: str, seconds: float, vin: str | None = None) -> None:
+        """Add time spent in a phase of the cycle or of one of its vehicles."""
+        phases = self.phases if vin is None else self.vehicles.setdefault(vin, {})
+        phases[phase] = phases.get(phase, 0.0) + seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the timings in milliseconds."""
+        return {
+            "started": self.started.isoformat(),
+            "duration_ms": None if self.duration is None else _ms(self.duration),
+            "phases_ms": {phase: _ms(seconds) for phase, seconds in self.phases.items()},
+            "vehicles": [
+                {"vin": vin, **{f"{phase}_ms": _ms(seconds) for phase, seconds in phases.items()}}
+                for vin, phases in self.vehicles.items()
+            ],
+            "calls": self.calls,
+            "errors": self.errors,
+            "queue_wait_ms": _ms(self.queue_wait),
+            "network_ms": _ms(self.network),
+        }
+
+
+@contextmanager
+def profile_phase(phase: str, vin: str | None = None) -> Iterator[None]:
+    """Time a phase of the running poll cycle, if there is one."""
+    profile = _current_profile.get()
+    if profile is None or profile.duration is not None:
+        yield
+        return
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        profile.add_phase(phase, time.monotonic() - started, vin)
+
+
+def record_api_call(queue_wait: float | None, network: float | None, error: bool) -> None:
+    """Count an API call against the running poll cycle, if there is one."""
+    profile = _current_profile.get()
+    if profile is None or profile.duration is not None:
+        return
+    profile.calls += 1
+    profile.errors += error
+    profile.queue_wait += queue_wait or 0.0
+    profile.network += network or 0.0
+
+
+class ZeekrPollProfiler:
+    """Keep the timings of the last poll cycles of a config entry.
+
+    A cycle is timed from the start of a poll until its data is returned.
+    Listener notification happens after that, in the coordinator, and is
+    added to the cycle it follows.
+    """
+
+    def __init__(self, size: int = POLL_PROFILES) -> None:
+        """Initialize."""
+        self.profiles: deque[ZeekrPollProfile] = deque(maxlen=size)
+        self._awaiting_notify: ZeekrPollProfile | None = None
+
+    @property
+    def last(self) -> ZeekrPollProfile | None:
+        """Return the last finished cycle."""
+        return self.profiles[-1] if self.profiles else None
+
+    @contextmanager
+    def cycle(self) -> Iterator[ZeekrPollProfile]:
+        """Time a poll cycle; phases and API calls within it are added to it."""
+        profile = ZeekrPollProfile(dt_util.utcnow())
+        token = _current_profile.set(profile)
+        started = time.monotonic()
+        try:
+            yield profile
+        finally:
+            profile.duration = time.monotonic() - started
+            _current_profile.reset(token)
+            self.profiles.append(profile)
+            self._awaiting_notify = profile
+
+    def record_notify(self, seconds: float) -> None:
+        """Add the notification of listeners to the cycle that caused it."""
+        profile, self._awaiting_notify = self._awaiting_notify, None
+        if profile is not None:
+            profile.add_phase(PHASE_NOTIFY, seconds)
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return the kept cycles, oldest first."""
+        return [profile.as_dict() for profile in self.profiles]
@@ -0,0 +1,88 @@
+"""Coalescing of post-command refreshes for Zeekr EV API Integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+_LOGGER = logging.getLogger(__name__)
+
+# Requests arriving within this many seconds share a single refresh
+REFRESH_WINDOW = 2
+
+
+class ZeekrRefreshBroker:
+    """Merge refresh requests from entities into one refresh per window.
+
+    Each request names a vehicle, optionally the endpoints a command touched,
+    and how long the car needs before its new state can be read back. All
+    requests pending when the latest of those delays has passed are handed to
+    the flush callback in one go, so a scene that fires several commands only
+    costs one refresh of the vehicles it touched.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        flush: Callable[[dict[str, set[str]]], Awaitable[None]],
+        window: float = REFRESH_WINDOW,
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._flush = flush
+        self.window = window
+        self._pending: dict[str, set[str]] = {}
+        self._due: float | None = None
+        self._cancel_flush: Callable[[], Any] | None = None
+        self._flush_lock = asyncio.Lock()
+        self.requests = 0
+        self.flushes = 0
+
+    @property
+    def pending(self) -> dict[str, set[str]]:
+        """Return the vehicles and endpoints waiting for the next refresh."""
+        return self._pending
+
+    @callback
+    def async_request(self, vin: str, *endpoints: str, delay: float = 0) -> None:
+        """Ask for a vehicle to be refreshed once the car has had time to act."""
+        self.requests += 1
+        self._pending.setdefault(vin, set()).update(endpoints)
+
+        wait = max(delay, self.window)
+        due = self._hass.loop.time() + wait
+        if self._cancel_flush is not None and self._due is not None:
+            if delay <= self.window or due <= self._due:
+                # Already covered by the scheduled refresh
+                return
+
+        if self._cancel_flush:
+            self._cancel_flush()
+        self._due = due
+        self._cancel_flush = async_call_later(self._hass, wait, self._async_flush)
+
+    async def _async_flush(self, *args: Any) -> None:
+        """Run one refresh for everything requested so far."""
+        self._cancel_flush = None
+        self._due = None
+        # A refresh that is still running finishes before the next one starts
+        async with self._flush_lock:
+            pending, self._pending = self._pending, {}
+            if not pending:
+                return
+            self.flushes += 1
+            _LOGGER.debug("Refreshing %s after commands", ", ".join(pending))
+            await self._flush(pending)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop pending requests and cancel the scheduled refresh."""
+        if self._cancel_flush:
+            self._cancel_flush()
+            self._cancel_flush = None
+        self._due = None
+        self._pending.clear()
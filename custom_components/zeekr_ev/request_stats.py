@@ -2,43 +2,231 @@
 # This will be imported and used in the main coordinator and entity files
 
 import asyncio
-from datetime import datetime
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import json
+import math
+import time
 from typing import Any, Callable
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.storage import Store
 
+from .const import DOMAIN
+
 STORAGE_KEY = "zeekr_ev_stats"
-STORAGE_VERSION = 1
+# 2: counters kept per config entry
+STORAGE_VERSION = 2
 SAVE_DELAY = 5  # seconds
+# Where the one stats service lives in hass.data
+DATA_STATS = f"{DOMAIN}_stats"
+# Counters added up over the entries for the aggregated view
+COUNTERS = (
+    "api_requests_today",
+    "api_invokes_today",
+    "api_requests_total",
+    "api_invokes_total",
+)
+
+# Upper bounds of the latency histogram buckets, in seconds; slower calls
+# land in a last, open-ended bucket
+LATENCY_BUCKETS = (0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0)
+# Percentiles are taken over this many of the most recent calls
+LATENCY_SAMPLES = 200
+PERCENTILES = (50, 95, 99)
+
+# Hours of usage kept in the hourly history
+HISTORY_HOURS = 30 * 24
+
+
+def get_response_size(result: Any) -> int:
+    """Return the size of an API response as JSON, in bytes.
+
+    The client only hands back decoded responses, so this stands in for
+    the bytes on the wire.
+    """
+    if result is None:
+        return 0
+    try:
+        return len(json.dumps(result, default=str).encode())
+    except (TypeError, ValueError):
+        return 0
+
+
+@dataclass
+class ZeekrEndpointStats:
+    """Calls, errors and latencies of one API endpoint since the last start."""
+
+    calls: int = 0
+    errors: int = 0
+    last_error: str | None = None
+    histogram: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    samples: deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLES))
+
+    def record(self, duration: float | None, error: Exception | None = None) -> None:
+        """Record a call; duration is None if the call never ran."""
+        self.calls += 1
+        if error is not None:
+            self.errors += 1
+            self.last_error = str(error)
+        if duration is None:
+            return
+        self.samples.append(duration)
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if duration <= bound:
+                self.histogram[index] += 1
+                break
+        else:
+            self.histogram[-1] += 1
+
+    def percentile(self, percent: float) -> float | None:
+        """Return a latency percentile of the recent calls in seconds."""
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        # Nearest rank
+        return ordered[max(math.ceil(percent / 100 * len(ordered)) - 1, 0)]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters, the latency percentiles in ms and the histogram."""
+        result: dict[str, Any] = {
+            "calls": self.calls,
+            "errors": self.errors,
+            "last_error": self.last_error,
+        }
+        for percent in PERCENTILES:
+            value = self.percentile(percent)
+            result[f"p{percent}_ms"] = None if value is None else round(value * 1000, 1)
+        labels = [f"<={bound:g}s" for bound in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]:g}s"]
+        result["histogram"] = dict(zip(labels, self.histogram))
+        return result
+
+
+class ZeekrUsageHistory:
+    """API usage per hour over the last 30 days.
+
+    Each hour holds its request and invoke counts and, per endpoint, a
+    [calls, errors, bytes] list. Only hours with traffic are kept, and
+    hours older than HISTORY_HOURS are dropped as new ones start.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        # Keyed by hours since the epoch (UTC)
+        self._hours: dict[int, dict[str, Any]] = {}
+
+    @staticmethod
+    def current_hour() -> int:
+        """Return the hours since the epoch."""
+        return int(time.time() // 3600)
+
+    def _get_bucket(self) -> dict[str, Any]:
+        """Return the bucket of the current hour, starting it if needed."""
+        hour = self.current_hour()
+        bucket = self._hours.get(hour)
+        if bucket is None:
+            bucket = self._hours[hour] = {"requests": 0, "invokes": 0, "endpoints": {}}
+            for old in [old for old in self._hours if old <= hour - HISTORY_HOURS]:
+                del self._hours[old]
+        return bucket
+
+    def inc_requests(self) -> None:
+        """Count a request in the current hour."""
+        self._get_bucket()["requests"] += 1
+
+    def inc_invokes(self) -> None:
+        """Count an invoke in the current hour."""
+        self._get_bucket()["invokes"] += 1
+
+    def record_call(self, endpoint: str, error: bool, size: int) -> None:
+        """Count a call to an endpoint in the current hour."""
+        counts = self._get_bucket()["endpoints"].setdefault(endpoint, [0, 0, 0])
+        counts[0] += 1
+        counts[1] += int(error)
+        counts[2] += size
+
+    def get_totals(self, hours: int = HISTORY_HOURS) -> dict[str, Any]:
+        """Return the usage summed over the last number of hours."""
+        since = self.current_hour() - hours
+        totals: dict[str, Any] = {"requests": 0, "invokes": 0, "endpoints": {}}
+        for hour, bucket in self._hours.items():
+            if hour <= since:
+                continue
+            totals["requests"] += bucket["requests"]
+            totals["invokes"] += bucket["invokes"]
+            for endpoint, counts in bucket["endpoints"].items():
+                endpoint_totals = totals["endpoints"].setdefault(
+                    endpoint, {"calls": 0, "errors": 0, "bytes": 0}
+                )
+                endpoint_totals["calls"] += counts[0]
+                endpoint_totals["errors"] += counts[1]
+                endpoint_totals["bytes"] += counts[2]
+        return totals
+
+    def get_hourly_requests(self, hours: int = 24) -> dict[str, int]:
+        """Return the requests and invokes of each of the last hours, by start time."""
+        now = self.current_hour()
+        return {
+            datetime.fromtimestamp(hour * 3600, timezone.utc).isoformat(): (
+                self._hours[hour]["requests"] + self._hours[hour]["invokes"]
+                if hour in self._hours else 0
+            )
+            for hour in range(now - hours + 1, now + 1)
+        }
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return every hour kept, for storage."""
+        return {str(hour): bucket for hour, bucket in sorted(self._hours.items())}
+
+    def load(self, data: dict[str, Any]) -> None:
+        """Restore the hours saved by as_dict."""
+        since = self.current_hour() - HISTORY_HOURS
+        self._hours = {}
+        for hour, bucket in data.items():
+            try:
+                hour = int(hour)
+            except (ValueError, TypeError):
+                continue
+            if hour > since and isinstance(bucket, dict):
+                self._hours[hour] = {
+                    "requests": bucket.get("requests", 0),
+                    "invokes": bucket.get("invokes", 0),
+                    "endpoints": dict(bucket.get("endpoints", {})),
+                }
 
 
 class ZeekrRequestStats:
-    def __init__(self, hass: HomeAssistant):
-        self._hass = hass
-        self._store: Store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+    """Request counters of one config entry, saved by the stats service."""
+
+    def __init__(self, service: "ZeekrStatsService", entry_id: str):
+        self._service = service
+        self.entry_id = entry_id
         self.api_requests_today = 0
         self.api_invokes_today = 0
         self.api_requests_total = 0
         self.api_invokes_total = 0
         self._last_reset = datetime.now().date()
-        self._loaded = False
-        self._dirty = False
-        self._save_lock = asyncio.Lock()
-        self._cancel_save: Callable[[], Any] | None = None
+        self.loaded = False
+        # Per endpoint and across all of them; kept in memory only
+        self.endpoints: dict[str, ZeekrEndpointStats] = {}
+        self.all_endpoints = ZeekrEndpointStats()
+        # Stored with the counters
+        self.history = ZeekrUsageHistory()
 
     async def async_load(self):
         """Load stats from storage."""
-        if self._loaded:
+        if self.loaded:
             return
 
-        data = await self._store.async_load()
+        data = await self._service.async_load_entry(self.entry_id)
         if data:
             self.api_requests_today = data.get("api_requests_today", 0)
             self.api_invokes_today = data.get("api_invokes_today", 0)
             self.api_requests_total = data.get("api_requests_total", 0)
             self.api_invokes_total = data.get("api_invokes_total", 0)
+            self.history.load(data.get("hourly") or {})
             try:
                 self._last_reset = datetime.strptime(
                     data.get("last_reset", str(datetime.now().date())), "%Y-%m-%d"
@@ -46,7 +234,7 @@ class ZeekrRequestStats:
             except (ValueError, TypeError):
                 self._last_reset = datetime.now().date()
 
-        self._loaded = True
+        self.loaded = True
         # Check reset after loading in case we loaded stale data from yesterday
         await self._async_check_reset()
 
@@ -54,33 +242,47 @@ class ZeekrRequestStats:
         self.api_requests_today = 0
         self.api_invokes_today = 0
         self._last_reset = datetime.now().date()
-        self._dirty = True
+        self._service.async_schedule_save()
         await self.async_save()
 
     async def async_inc_request(self):
         await self._async_check_reset()
         self.api_requests_today += 1
         self.api_requests_total += 1
-        self._async_schedule_save()
+        self.history.inc_requests()
+        self._service.async_schedule_save()
 
     async def async_inc_invoke(self):
         await self._async_check_reset()
         self.api_invokes_today += 1
         self.api_invokes_total += 1
-        self._async_schedule_save()
+        self.history.inc_invokes()
+        self._service.async_schedule_save()
+
+    def record_call(
+        self,
+        endpoint: str,
+        duration: float | None,
+        error: Exception | None = None,
+        size: int = 0,
+    ) -> None:
+        """Record the outcome, latency and response size of an API call."""
+        self.endpoints.setdefault(endpoint, ZeekrEndpointStats()).record(duration, error)
+        self.all_endpoints.record(duration, error)
+        self.history.record_call(endpoint, error is not None, size)
+        self._service.async_schedule_save()
+
+    def endpoints_as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return the stats of every endpoint called since the last start."""
+        return {
+            endpoint: stats.as_dict() for endpoint, stats in sorted(self.endpoints.items())
+        }
 
     async def _async_check_reset(self):
         today = datetime.now().date()
         if today != self._last_reset:
             await self.async_reset_today()
 
-    def _async_schedule_save(self) -> None:
-        """Schedule a save."""
-        self._dirty = True
-        if self._cancel_save:
-            self._cancel_save()
-        self._cancel_save = async_call_later(self._hass, SAVE_DELAY, self.async_save)
-
     def as_dict(self):
         return {
             "api_requests_today": self.api_requests_today,
@@ -90,20 +292,126 @@ class ZeekrRequestStats:
             "last_reset": str(self._last_reset),
         }
 
+    def as_stored_dict(self) -> dict[str, Any]:
+        """Return the counters and the hourly history, for storage."""
+        return {**self.as_dict(), "hourly": self.history.as_dict()}
+
     async def async_save(self, *args: Any) -> None:
-        """Save the current stats to storage."""
-        async with self._save_lock:
-            if not self._dirty:
-                return
+        """Save the stats of every entry now if any have changed."""
+        await self._service.async_save()
+
+    async def async_shutdown(self) -> None:
+        """Save pending data on shutdown."""
+        await self.async_save()
+
+
+class ZeekrStatsStore(Store):
+    """Store of the request stats of every config entry."""
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Migrate stats saved by an older version."""
+        if old_major_version == 1:
+            # One set of counters for all entries; the first entry keeps them
+            entries = self.hass.config_entries.async_entries(DOMAIN)
+            if old_data and entries:
+                return {"entries": {entries[0].entry_id: old_data}}
+            return {"entries": {}}
+        return old_data
+
+
+class ZeekrStatsService:
+    """Own the request stats of every config entry and the store they share.
+
+    Each entry counts into its own ZeekrRequestStats, which outlives reloads
+    of the entry so its counts carry on. All entries are written together,
+    at most once per SAVE_DELAY.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._store = ZeekrStatsStore(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._entries: dict[str, ZeekrRequestStats] = {}
+        # Saved counters of entries that haven't loaded them yet; None until
+        # the store is loaded
+        self._stored: dict[str, dict[str, Any]] | None = None
+        self._load_lock = asyncio.Lock()
+        self._save_lock = asyncio.Lock()
+        self._cancel_save: Callable[[], Any] | None = None
+        self._dirty = False
+        self.saves = 0
+
+    def get_stats(self, entry_id: str) -> ZeekrRequestStats:
+        """Return the stats of a config entry."""
+        stats = self._entries.get(entry_id)
+        if stats is None:
+            stats = self._entries[entry_id] = ZeekrRequestStats(self, entry_id)
+        return stats
+
+    async def _async_load(self) -> dict[str, dict[str, Any]]:
+        """Return the saved counters not loaded by an entry yet."""
+        async with self._load_lock:
+            if self._stored is None:
+                data = await self._store.async_load() or {}
+                entries = data.get("entries")
+                self._stored = dict(entries) if isinstance(entries, dict) else {}
+        return self._stored
 
+    async def async_load_entry(self, entry_id: str) -> dict[str, Any] | None:
+        """Return the counters saved for a config entry."""
+        return (await self._async_load()).pop(entry_id, None)
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save within SAVE_DELAY, together with everything else changed by then."""
+        self._dirty = True
+        if self._cancel_save is None:
+            self._cancel_save = async_call_later(self._hass, SAVE_DELAY, self.async_save)
+
+    async def async_save(self, *args: Any) -> None:
+        """Save the stats of every entry that has changed since the last save."""
+        async with self._save_lock:
             if self._cancel_save:
                 self._cancel_save()
                 self._cancel_save = None
-
-            data = self.as_dict()
-            await self._store.async_save(data)
+            # Without the saved counters every other entry's would be lost
+            if not self._dirty or self._stored is None:
+                return
+            # Changes made while writing are picked up by the next save
             self._dirty = False
+            self.saves += 1
+            await self._store.async_save(self._data_to_save())
 
-    async def async_shutdown(self) -> None:
-        """Save pending data on shutdown."""
-        await self.async_save()
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the stored counters of every entry."""
+        entries = dict(self._stored or {})
+        for entry_id, stats in self._entries.items():
+            # Counts from before the entry was loaded would overwrite the saved ones
+            if stats.loaded:
+                entries[entry_id] = stats.as_stored_dict()
+        return {"entries": entries}
+
+    async def async_remove_entry(self, entry_id: str) -> None:
+        """Forget the stats of a removed config entry."""
+        self._entries.pop(entry_id, None)
+        (await self._async_load()).pop(entry_id, None)
+        self.async_schedule_save()
+
+    def get_totals(self) -> dict[str, int]:
+        """Return the counters added up over every loaded entry."""
+        totals = dict.fromkeys(COUNTERS, 0)
+        for stats in self._entries.values():
+            if stats.loaded:
+                for counter in COUNTERS:
+                    totals[counter] += getattr(stats, counter)
+        return totals
+
+
+def get_stats_service(hass: HomeAssistant) -> ZeekrStatsService:
+    """Return the request stats service of this Home Assistant instance."""
+    service = hass.data.get(DATA_STATS)
+    if service is None:
+        service = hass.data[DATA_STATS] = ZeekrStatsService(hass)
+    return service
@@ -0,0 +1,145 @@
+"""Adaptive per-vehicle poll scheduling for Zeekr EV API Integration."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .fields import CHARGING_CHARGER_STATES
+
+VEHICLE_STATE_ACTIVE = "active"
+VEHICLE_STATE_PARKED = "parked"
+VEHICLE_STATE_ASLEEP = "asleep"
+
+# engineStatus values reported while the car is being driven
+DRIVING_ENGINE_STATES = {"engine-running"}
+# usageMode values reported while the car is in deep sleep
+ASLEEP_USAGE_MODES = {"0"}
+
+# Never tick the coordinator faster than this, even if a vehicle is overdue
+MIN_TICK = timedelta(seconds=30)
+
+
+def _is_charging(charger_state: Any) -> bool:
+    """Return True if a chargerState value means energy is flowing."""
+    try:
+        return int(str(charger_state).strip()) in CHARGING_CHARGER_STATES
+    except ValueError:
+        return False
+
+
+def get_vehicle_state(vehicle_data: dict[str, Any] | None) -> str:
+    """Classify a vehicle status snapshot into a polling state."""
+    if not vehicle_data:
+        return VEHICLE_STATE_PARKED
+
+    basic_status = vehicle_data.get("basicVehicleStatus", {}) or {}
+    ev_status = (
+        (vehicle_data.get("additionalVehicleStatus", {}) or {})
+        .get("electricVehicleStatus", {})
+        or {}
+    )
+
+    if _is_charging(ev_status.get("chargerState")):
+        return VEHICLE_STATE_ACTIVE
+
+    engine_status = basic_status.get("engineStatus")
+    if engine_status is not None and str(engine_status).strip().lower() in DRIVING_ENGINE_STATES:
+        return VEHICLE_STATE_ACTIVE
+
+    usage_mode = basic_status.get("usageMode")
+    if usage_mode is not None and str(usage_mode).strip() in ASLEEP_USAGE_MODES:
+        return VEHICLE_STATE_ASLEEP
+
+    return VEHICLE_STATE_PARKED
+
+
+class ZeekrPollScheduler:
+    """Pick the next poll time of each vehicle from its last known state."""
+
+    def __init__(
+        self,
+        base_interval: timedelta,
+        active_interval: timedelta,
+        sleep_interval: timedelta,
+    ) -> None:
+        """Initialize."""
+        self._next_poll: dict[str, datetime] = {}
+        self._last_poll: dict[str, datetime] = {}
+        self.states: dict[str, str] = {}
+        # Floor on every interval, e.g. set by the request budget
+        self.min_interval = timedelta(0)
+        self.set_intervals(base_interval, active_interval, sleep_interval)
+
+    def set_intervals(
+        self,
+        base_interval: timedelta,
+        active_interval: timedelta,
+        sleep_interval: timedelta,
+    ) -> None:
+        """Update the intervals used for each state.
+
+        The active interval is never slower and the sleep interval never faster
+        than the base interval, so the configured polling interval stays the
+        upper bound on staleness for a parked car. Scheduled polls are moved
+        to match the new intervals.
+        """
+        self.base_interval = base_interval
+        self.active_interval = min(active_interval, base_interval)
+        self.sleep_interval = max(sleep_interval, base_interval)
+        for vin in self._next_poll:
+            self._next_poll[vin] = self._last_poll[vin] + self.interval_for_state(
+                self.states[vin]
+            )
+
+    def interval_for_state(self, state: str) -> timedelta:
+        """Return the poll interval for a vehicle state."""
+        if state == VEHICLE_STATE_ACTIVE:
+            interval = self.active_interval
+        elif state == VEHICLE_STATE_ASLEEP:
+            interval = self.sleep_interval
+        else:
+            interval = self.base_interval
+        return max(interval, self.min_interval)
+
+    def is_due(self, vin: str, now: datetime | None = None) -> bool:
+        """Return True if the vehicle should be polled now."""
+        next_poll = self._next_poll.get(vin)
+        if next_poll is None:
+            return True
+        return (now or dt_util.utcnow()) >= next_poll
+
+    def schedule(
+        self,
+        vin: str,
+        vehicle_data: dict[str, Any] | None,
+        now: datetime | None = None,
+    ) -> datetime:
+        """Schedule the next poll of a vehicle from its latest snapshot."""
+        state = get_vehicle_state(vehicle_data)
+        self.states[vin] = state
+        now = now or dt_util.utcnow()
+        self._last_poll[vin] = now
+        next_poll = now + self.interval_for_state(state)
+        self._next_poll[vin] = next_poll
+        return next_poll
+
+    def force(self, vin: str | None = None) -> None:
+        """Make one vehicle (or all vehicles) due on the next refresh."""
+        if vin is None:
+            self._next_poll.clear()
+        else:
+            self._next_poll.pop(vin, None)
+
+    def next_poll(self, vin: str) -> datetime | None:
+        """Return the scheduled poll time of a vehicle."""
+        return self._next_poll.get(vin)
+
+    def time_until_next_poll(self, now: datetime | None = None) -> timedelta:
+        """Return how long the coordinator may sleep before a vehicle is due."""
+        if not self._next_poll:
+            return self.base_interval
+        now = now or dt_util.utcnow()
+        return max(min(self._next_poll.values()) - now, MIN_TICK)
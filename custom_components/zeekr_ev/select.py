@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
@@ -12,6 +12,8 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import ZeekrCoordinator
+from .entity import ZeekrVehicleMixin
+from .fields import FIELDS
 
 OPTION_OFF = "Off"
 OPTION_LEVEL_1 = "Level 1"
@@ -123,7 +125,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class ZeekrSeatSelect(CoordinatorEntity, SelectEntity):
+class ZeekrSeatSelect(ZeekrVehicleMixin, CoordinatorEntity, SelectEntity):
     """Zeekr Seat Select class."""
 
     _attr_has_entity_name = True
@@ -140,7 +142,7 @@ class ZeekrSeatSelect(CoordinatorEntity, SelectEntity):
         status_keys: list[str],
     ) -> None:
         """Initialize the select entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, (vin, "climateStatus"))
         self.vin = vin
         self.service_code = service_code
         self.mode = mode
@@ -152,51 +154,35 @@ class ZeekrSeatSelect(CoordinatorEntity, SelectEntity):
     @property
     def current_option(self) -> str | None:
         """Return the current selected option."""
-        data = self.coordinator.data.get(self.vin, {})
-        climate_status = (
-            data.get("additionalVehicleStatus", {})
-            .get("climateStatus", {})
+        level = self._get_level(
+            lambda key: self.coordinator.get_field_value(self.vin, key)
         )
+        return LEVEL_TO_OPTION.get(level, OPTION_OFF)
 
+    def _get_level(self, get_value: Callable[[str], Any]) -> int:
+        """Return the seat level from the values of the status fields."""
         level = 0
 
         if self.mode == "heat":
             # For heat, the status key usually holds the level directly: 0=Off, 1=L1, 2=L2, 3=L3
             if self.status_keys:
-                val = climate_status.get(self.status_keys[0])
-                if val is not None:
-                    try:
-                        level = int(val)
-                    except (ValueError, TypeError):
-                        level = 0
+                level = get_value(self.status_keys[0]) or 0
 
         elif self.mode == "vent":
             # For vent, status key 0 is On/Off (2=Off, 1=On), status key 1 is Detail/Level
             # Keys: [status_sts, status_detail]
             if len(self.status_keys) >= 2:
-                sts_val = climate_status.get(self.status_keys[0])
-                detail_val = climate_status.get(self.status_keys[1])
-
-                try:
-                    sts = int(sts_val) if sts_val is not None else 2
-                    detail = int(detail_val) if detail_val is not None else 0
-
-                    if sts == 2:  # Off
-                        level = 0
-                    elif sts == 1:  # On
-                        level = detail
-                        if level == 0:
-                            # Fallback if on but level reported as 0, shouldn't happen based on user logs
-                            # User logs: "passVentSts": 1, "passVentDetail": 2 (Level 2)
-                            pass
-                except (ValueError, TypeError):
-                    level = 0
+                sts = get_value(self.status_keys[0])
+                detail = get_value(self.status_keys[1])
+                if sts == 1:  # On
+                    # User logs: "passVentSts": 1, "passVentDetail": 2 (Level 2)
+                    level = detail or 0
 
         # Ensure level is within 0-3
         if level not in LEVEL_TO_OPTION:
             level = 0
 
-        return LEVEL_TO_OPTION.get(level, OPTION_OFF)
+        return level
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
@@ -207,9 +193,6 @@ class ZeekrSeatSelect(CoordinatorEntity, SelectEntity):
         level = OPTION_TO_LEVEL.get(option, 0)
         duration = getattr(self.coordinator, "seat_duration", 15)
 
-        command = "start"
-        service_id = "ZAF"
-
         # Build setting payload
         setting: dict[str, Any] = {"serviceParameters": []}
 
@@ -227,28 +210,25 @@ class ZeekrSeatSelect(CoordinatorEntity, SelectEntity):
 
         setting["serviceParameters"] = params
 
-        await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
-            vehicle.do_remote_control, command, service_id, setting
+        # Sent together with other climate changes made at the same time
+        await self.coordinator.async_send_climate_command(
+            self.vin, setting["serviceParameters"]
         )
 
         # Optimistic update
         self._update_local_state_optimistically(level)
-        self.async_write_ha_state()
 
-        # Trigger refresh (might revert if API is slow, but that's expected eventually)
-        await self.coordinator.async_request_refresh()
+        # Poll until the car reports the new level
+        self.coordinator.async_request_vehicle_refresh(
+            self.vin,
+            expect=lambda data: self._get_level(
+                lambda key: FIELDS[key].extract(data)
+            ) == level,
+        )
 
     def _update_local_state_optimistically(self, level: int):
-        """Update the coordinator data to reflect the change immediately."""
-        data = self.coordinator.data.get(self.vin)
-        if not data:
-            return
-
-        climate_status = (
-            data.setdefault("additionalVehicleStatus", {})
-            .setdefault("climateStatus", {})
-        )
+        """Show the new level until the vehicle confirms it."""
+        climate_status: dict[str, int] = {}
 
         if self.mode == "heat":
             if self.status_keys:
@@ -265,6 +245,13 @@ class ZeekrSeatSelect(CoordinatorEntity, SelectEntity):
                 else:
                     climate_status[sts_key] = 1  # On
                     climate_status[detail_key] = level
+        self.coordinator.async_set_optimistic(
+            self.vin,
+            {
+                ("additionalVehicleStatus", "climateStatus", key): value
+                for key, value in climate_status.items()
+            },
+        )
 
     @property
     def device_info(self):
@@ -20,14 +20,18 @@ from homeassistant.const import (
     UnitOfPressure,
     UnitOfSpeed,
     UnitOfTemperature,
+    UnitOfTime,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, CONF_DRIVE_SIDE, DRIVE_SIDE_LHD, DRIVE_SIDE_RHD
+from .const import DOMAIN, DRIVE_SIDE_RHD
 from .coordinator import ZeekrCoordinator
+from .entity import ZeekrVehicleMixin
+from .fields import FIELDS, TIRE_POSITIONS, ZeekrField
+from .request_stats import get_stats_service
 from .utils import get_api_version
 
 _LOGGER = logging.getLogger(__name__)
@@ -125,6 +129,72 @@ async def async_setup_entry(
         )
     )
 
+    entities.append(
+        ZeekrAPIStatSensor(
+            coordinator,
+            entry.entry_id,
+            "api_errors",
+            "API Errors Since Restart",
+            lambda stats: stats.all_endpoints.errors,
+        )
+    )
+
+    # Latency of recent calls (global, not per vehicle); per endpoint figures
+    # are in the diagnostics
+    entities.append(ZeekrAPILatencySensor(coordinator, entry.entry_id, 50))
+    entities.append(ZeekrAPILatencySensor(coordinator, entry.entry_id, 95))
+
+    # Phase timings of the last poll cycle (global, not per vehicle)
+    entities.append(ZeekrLastPollSensor(coordinator, entry.entry_id))
+
+    # Usage over a rolling 24 hours (global, not per vehicle); hourly and
+    # per endpoint usage is in the diagnostics
+    entities.append(
+        ZeekrAPIUsageSensor(
+            coordinator,
+            entry.entry_id,
+            "api_requests_last_24_hours",
+            "API Requests Last 24 Hours",
+            lambda totals: totals["requests"] + totals["invokes"],
+        )
+    )
+    entities.append(
+        ZeekrAPIUsageSensor(
+            coordinator,
+            entry.entry_id,
+            "api_errors_last_24_hours",
+            "API Errors Last 24 Hours",
+            lambda totals: sum(
+                counts["errors"] for counts in totals["endpoints"].values()
+            ),
+        )
+    )
+
+    # Daily request budget (global, not per vehicle)
+    entities.append(ZeekrAPIBudgetSensor(coordinator, entry.entry_id))
+
+    # Dedicated worker pool load (global, not per vehicle)
+    entities.append(
+        ZeekrAPITransportSensor(
+            coordinator,
+            entry.entry_id,
+            "api_queue_depth",
+            "API Queue Depth",
+            lambda transport: transport.queue_depth,
+            None,
+        )
+    )
+    entities.append(
+        ZeekrAPITransportSensor(
+            coordinator,
+            entry.entry_id,
+            "api_queue_wait",
+            "API Queue Wait",
+            lambda transport: round(transport.average_wait * 1000, 1),
+            UnitOfTime.MILLISECONDS,
+        )
+    )
+
     # coordinator.data might be None or empty on first setup
     if not coordinator.data:
         async_add_entities(entities)
@@ -138,9 +208,7 @@ async def async_setup_entry(
                 vin,
                 "battery_level",
                 "Battery Level",
-                lambda d: d.get("additionalVehicleStatus", {})
-                .get("electricVehicleStatus", {})
-                .get("chargeLevel"),
+                FIELDS["battery_level"],
                 PERCENTAGE,
                 SensorDeviceClass.BATTERY,
             )
@@ -152,9 +220,7 @@ async def async_setup_entry(
                 vin,
                 "range",
                 "Range",
-                lambda d: d.get("additionalVehicleStatus", {})
-                .get("electricVehicleStatus", {})
-                .get("distanceToEmptyOnBatteryOnly"),
+                FIELDS["range"],
                 UnitOfLength.KILOMETERS,
                 SensorDeviceClass.DISTANCE,
             )
@@ -166,9 +232,7 @@ async def async_setup_entry(
                 vin,
                 "odometer",
                 "Odometer",
-                lambda d: d.get("additionalVehicleStatus", {})
-                .get("maintenanceStatus", {})
-                .get("odometer"),
+                FIELDS["odometer"],
                 UnitOfLength.KILOMETERS,
                 SensorDeviceClass.DISTANCE,
                 SensorStateClass.TOTAL_INCREASING,
@@ -181,9 +245,7 @@ async def async_setup_entry(
                 vin,
                 "interior_temp",
                 "Interior Temperature",
-                lambda d: d.get("additionalVehicleStatus", {})
-                .get("climateStatus", {})
-                .get("interiorTemp"),
+                FIELDS["interior_temp"],
                 UnitOfTemperature.CELSIUS,
                 SensorDeviceClass.TEMPERATURE,
             )
@@ -197,15 +259,7 @@ async def async_setup_entry(
                 vin,
                 "trip_2_distance",
                 "Trip 2 Distance",
-                lambda d: (
-                    float(d.get("additionalVehicleStatus", {})
-                          .get("runningStatus", {})
-                          .get("tripMeter2"))
-                    if d.get("additionalVehicleStatus", {})
-                    .get("runningStatus", {})
-                    .get("tripMeter2") is not None
-                    else None
-                ),
+                FIELDS["trip_2_distance"],
                 UnitOfLength.KILOMETERS,
                 SensorDeviceClass.DISTANCE,
                 SensorStateClass.TOTAL_INCREASING,
@@ -218,9 +272,7 @@ async def async_setup_entry(
                 vin,
                 "trip_2_avg_speed",
                 "Trip 2 Average Speed",
-                lambda d: d.get("additionalVehicleStatus", {})
-                .get("runningStatus", {})
-                .get("avgSpeed"),
+                FIELDS["trip_2_avg_speed"],
                 UnitOfSpeed.KILOMETERS_PER_HOUR,
                 SensorDeviceClass.SPEED,
             )
@@ -232,40 +284,34 @@ async def async_setup_entry(
                 vin,
                 "trip_2_avg_consumption",
                 "Trip 2 Average Consumption",
-                lambda d: d.get("additionalVehicleStatus", {})
-                .get("electricVehicleStatus", {})
-                .get("averPowerConsumption"),
+                FIELDS["trip_2_avg_consumption"],
                 "kWh/100km",
                 None,
             )
         )
 
         # Tire Pressures
-        drive_side = entry.data.get(CONF_DRIVE_SIDE, DRIVE_SIDE_LHD)
-        for tire in ["Driver", "Passenger", "DriverRear", "PassengerRear"]:
-            display_label = get_tire_position_label(tire, drive_side)
+        for tire in TIRE_POSITIONS:
             entities.append(
-                ZeekrSensor(
+                ZeekrTireSensor(
                     coordinator,
                     vin,
+                    tire,
                     f"tire_pressure_{tire.lower()}",
-                    f"Tire Pressure {display_label}",
-                    lambda d, t=tire: d.get("additionalVehicleStatus", {})
-                    .get("maintenanceStatus", {})
-                    .get(f"tyreStatus{t}"),
+                    "Tire Pressure",
+                    FIELDS[f"tire_pressure_{tire.lower()}"],
                     UnitOfPressure.KPA,
                     SensorDeviceClass.PRESSURE,
                 )
             )
             entities.append(
-                ZeekrSensor(
+                ZeekrTireSensor(
                     coordinator,
                     vin,
+                    tire,
                     f"tire_temperature_{tire.lower()}",
-                    f"Tire Temperature {display_label}",
-                    lambda d, t=tire: d.get("additionalVehicleStatus", {})
-                    .get("maintenanceStatus", {})
-                    .get(f"tyreTemp{t}"),
+                    "Tire Temperature",
+                    FIELDS[f"tire_temperature_{tire.lower()}"],
                     UnitOfTemperature.CELSIUS,
                     SensorDeviceClass.TEMPERATURE,
                 )
@@ -278,9 +324,7 @@ async def async_setup_entry(
                 vin,
                 "distance_to_empty_on_battery_20_soc",
                 "distanceToEmptyOnBattery20Soc",
-                lambda d: d.get("additionalVehicleStatus", {})
-                .get("electricVehicleStatus", {})
-                .get("distanceToEmptyOnBattery20Soc"),
+                FIELDS["distance_to_empty_on_battery_20_soc"],
                 UnitOfLength.KILOMETERS,
                 SensorDeviceClass.DISTANCE,
             )
@@ -291,9 +335,7 @@ async def async_setup_entry(
                 vin,
                 "distance_to_empty_on_battery_100_soc",
                 "distanceToEmptyOnBattery100Soc",
-                lambda d: d.get("additionalVehicleStatus", {})
-                .get("electricVehicleStatus", {})
-                .get("distanceToEmptyOnBattery100Soc"),
+                FIELDS["distance_to_empty_on_battery_100_soc"],
                 UnitOfLength.KILOMETERS,
                 SensorDeviceClass.DISTANCE,
             )
@@ -307,7 +349,7 @@ async def async_setup_entry(
                     vin,
                     "charge_voltage",
                     "Charge Voltage",
-                    lambda d: d.get("chargingStatus", {}).get("chargeVoltage"),
+                    FIELDS["charge_voltage"],
                     UnitOfElectricPotential.VOLT,
                     SensorDeviceClass.VOLTAGE,
                 )
@@ -319,7 +361,7 @@ async def async_setup_entry(
                     vin,
                     "charge_current",
                     "Charge Current",
-                    lambda d: d.get("chargingStatus", {}).get("chargeCurrent"),
+                    FIELDS["charge_current"],
                     UnitOfElectricCurrent.AMPERE,
                     SensorDeviceClass.CURRENT,
                 )
@@ -331,7 +373,7 @@ async def async_setup_entry(
                     vin,
                     "charge_power",
                     "Charge Power",
-                    lambda d: d.get("chargingStatus", {}).get("chargePower"),
+                    FIELDS["charge_power"],
                     UnitOfPower.KILO_WATT,
                     SensorDeviceClass.POWER,
                 )
@@ -343,7 +385,7 @@ async def async_setup_entry(
                     vin,
                     "charge_speed",
                     "Charge Speed",
-                    lambda d: d.get("chargingStatus", {}).get("chargeSpeed"),
+                    FIELDS["charge_speed"],
                     "km/h",
                     None,
                 )
@@ -359,7 +401,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class ZeekrSensor(CoordinatorEntity, SensorEntity):
+class ZeekrSensor(ZeekrVehicleMixin, CoordinatorEntity, SensorEntity):
     """Zeekr Sensor class."""
 
     _attr_has_entity_name = True
@@ -375,8 +417,15 @@ class ZeekrSensor(CoordinatorEntity, SensorEntity):
         device_class: SensorDeviceClass | None = None,
         state_class: SensorStateClass | None = SensorStateClass.MEASUREMENT,
     ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
+        """Initialize the sensor.
+
+        value_fn is either a field from the registry, read through the
+        coordinator's parsed-value cache, or a function of the snapshot.
+        """
+        super().__init__(
+            coordinator,
+            (vin, value_fn.section) if isinstance(value_fn, ZeekrField) else vin,
+        )
         self.vin = vin
         self.key = key
         self._attr_name = name
@@ -392,6 +441,8 @@ class ZeekrSensor(CoordinatorEntity, SensorEntity):
         data = self.coordinator.data.get(self.vin, {})
         if not data:
             return None
+        if isinstance(self._value_fn, ZeekrField):
+            return self.coordinator.get_field_value(self.vin, self._value_fn)
         return self._value_fn(data)
 
     @property
@@ -404,20 +455,47 @@ class ZeekrSensor(CoordinatorEntity, SensorEntity):
         }
 
 
-class ZeekrAPIStatusSensor(CoordinatorEntity, SensorEntity):
-    """Zeekr API Status sensor with token attributes."""
+class ZeekrTireSensor(ZeekrSensor):
+    """Zeekr tire sensor, named after the tire's position for the drive side."""
+
+    def __init__(
+        self,
+        coordinator: ZeekrCoordinator,
+        vin: str,
+        tire: str,
+        key: str,
+        label: str,
+        value_fn,
+        unit: str | None = None,
+        device_class: SensorDeviceClass | None = None,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, vin, key, label, value_fn, unit, device_class)
+        self.tire = tire
+        self._label = label
+
+    @property
+    def name(self) -> str:
+        """Return the name, which follows the configured drive side."""
+        return f"{self._label} {get_tire_position_label(self.tire, self.coordinator.drive_side)}"
+
+
+class ZeekrAPISensorBase(CoordinatorEntity, SensorEntity):
+    """Base class for the sensors of the Zeekr API device of a config entry."""
 
     def __init__(
         self,
         coordinator: ZeekrCoordinator,
         entry_id: str,
+        key: str,
+        name: str,
     ) -> None:
-        """Initialize the API status sensor."""
+        """Initialize the sensor."""
         super().__init__(coordinator)
         self._entry_id = entry_id
-        self._attr_name = "Zeekr API Status"
-        self._attr_unique_id = f"{entry_id}_api_status"
-        self._attr_icon = "mdi:api"
+        self._key = key
+        self._attr_name = name
+        self._attr_unique_id = f"{entry_id}_{key}"
 
     @property
     def device_info(self):
@@ -430,6 +508,20 @@ class ZeekrAPIStatusSensor(CoordinatorEntity, SensorEntity):
             "sw_version": get_api_version(self.coordinator.client),
         }
 
+
+class ZeekrAPIStatusSensor(ZeekrAPISensorBase):
+    """Zeekr API Status sensor with token attributes."""
+
+    _attr_icon = "mdi:api"
+
+    def __init__(
+        self,
+        coordinator: ZeekrCoordinator,
+        entry_id: str,
+    ) -> None:
+        """Initialize the API status sensor."""
+        super().__init__(coordinator, entry_id, "api_status", "Zeekr API Status")
+
     @property
     def native_value(self):
         """Return the state of the sensor."""
@@ -457,6 +549,13 @@ class ZeekrAPIStatusSensor(CoordinatorEntity, SensorEntity):
             attrs["vehicle_count"] = (
                 len(self.coordinator.vehicles) if self.coordinator.vehicles else 0
             )
+            # Vehicles still showing the data saved before the last restart
+            attrs["restored_vehicles"] = [
+                vin for vin in self.coordinator.data or {}
+                if self.coordinator.is_restored(vin)
+            ]
+            # Endpoints left alone after failing repeatedly
+            attrs["open_circuits"] = self.coordinator.breakers.get_open()
             # Include X-VIN (encrypted VIN) for each vehicle
             if self.coordinator.vehicles and zeekr_app_sig_module:
                 try:
@@ -474,7 +573,9 @@ class ZeekrAPIStatusSensor(CoordinatorEntity, SensorEntity):
 
 
 # Dedicated sensor for API stats
-class ZeekrAPIStatSensor(CoordinatorEntity, SensorEntity):
+class ZeekrAPIStatSensor(ZeekrAPISensorBase):
+    _attr_icon = "mdi:counter"
+
     def __init__(
         self,
         coordinator: ZeekrCoordinator,
@@ -483,13 +584,8 @@ class ZeekrAPIStatSensor(CoordinatorEntity, SensorEntity):
         name: str,
         value_fn,
     ) -> None:
-        super().__init__(coordinator)
-        self._entry_id = entry_id
-        self._key = key
-        self._attr_name = name
-        self._attr_unique_id = f"{entry_id}_{key}"
+        super().__init__(coordinator, entry_id, key, name)
         self._value_fn = value_fn
-        self._attr_icon = "mdi:counter"
 
     @property
     def native_value(self):
@@ -499,25 +595,161 @@ class ZeekrAPIStatSensor(CoordinatorEntity, SensorEntity):
         return None
 
     @property
-    def device_info(self):
-        """Return device info."""
-        return {
-            "identifiers": {(DOMAIN, self._entry_id)},
-            "name": "Zeekr API",
-            "manufacturer": "Zeekr",
-            "model": "API Integration",
-            "sw_version": get_api_version(self.coordinator.client),
-        }
+    def extra_state_attributes(self):
+        """Return the counter added up over every account."""
+        totals = get_stats_service(self.coordinator.hass).get_totals()
+        if self._key in totals:
+            return {"all_accounts": totals[self._key]}
+        return None
+
+
+class ZeekrAPIBudgetSensor(ZeekrAPISensorBase):
+    """Sensor projecting today's API requests at the current poll pace."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:chart-line"
+
+    def __init__(self, coordinator: ZeekrCoordinator, entry_id: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(
+            coordinator,
+            entry_id,
+            "api_projected_requests_today",
+            "API Projected Requests Today",
+        )
+
+    @property
+    def native_value(self) -> int:
+        """Return the requests expected by the end of the day."""
+        return self.coordinator.get_projected_requests()
+
+    @property
+    def extra_state_attributes(self):
+        """Return the budget figures."""
+        return self.coordinator.budget.as_dict()
+
+
+class ZeekrAPILatencySensor(ZeekrAPISensorBase):
+    """Sensor reporting a latency percentile of recent API calls."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_icon = "mdi:timer-outline"
+
+    def __init__(
+        self, coordinator: ZeekrCoordinator, entry_id: str, percent: int = 95
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(
+            coordinator, entry_id, f"api_latency_p{percent}", f"API Latency p{percent}"
+        )
+        self._percent = percent
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the latency percentile of recent calls to any endpoint."""
+        value = self.coordinator.request_stats.all_endpoints.percentile(self._percent)
+        return None if value is None else round(value * 1000, 1)
+
+
+class ZeekrLastPollSensor(ZeekrAPISensorBase):
+    """Sensor reporting how long the last poll cycle took, per phase."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_icon = "mdi:timer-sand"
+
+    def __init__(self, coordinator: ZeekrCoordinator, entry_id: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry_id, "last_poll_duration", "Last Poll Duration")
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the duration of the last poll cycle."""
+        profile = self.coordinator.poll_profiler.last
+        if profile is None:
+            return None
+        return profile.as_dict()["duration_ms"]
+
+    @property
+    def extra_state_attributes(self):
+        """Return the phase timings of the last poll cycle."""
+        profile = self.coordinator.poll_profiler.last
+        if profile is None:
+            return None
+        attributes = profile.as_dict()
+        # Per vehicle timings are in the diagnostics
+        attributes.pop("vehicles")
+        return attributes
+
+
+class ZeekrAPIUsageSensor(ZeekrAPISensorBase):
+    """Sensor reporting API usage over a rolling 24 hours."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:chart-bar"
 
+    def __init__(
+        self,
+        coordinator: ZeekrCoordinator,
+        entry_id: str,
+        key: str,
+        name: str,
+        value_fn,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry_id, key, name)
+        self._value_fn = value_fn
+
+    @property
+    def native_value(self) -> int:
+        """Return the usage of the last 24 hours."""
+        return self._value_fn(self.coordinator.request_stats.history.get_totals(24))
+
+
+class ZeekrAPITransportSensor(ZeekrAPISensorBase):
+    """Sensor reporting the load on the API worker threads."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:timer-sand"
+
+    def __init__(
+        self,
+        coordinator: ZeekrCoordinator,
+        entry_id: str,
+        key: str,
+        name: str,
+        value_fn,
+        unit: str | None,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry_id, key, name)
+        self._value_fn = value_fn
+        self._attr_native_unit_of_measurement = unit
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        transport = getattr(self.coordinator, "transport", None)
+        if transport:
+            return self._value_fn(transport)
+        return None
 
-class ZeekrChargingTimeFormattedSensor(CoordinatorEntity, SensorEntity):
+    @property
+    def extra_state_attributes(self):
+        """Return the full transport figures."""
+        transport = getattr(self.coordinator, "transport", None)
+        return transport.as_dict() if transport else {}
+
+
+class ZeekrChargingTimeFormattedSensor(ZeekrVehicleMixin, CoordinatorEntity, SensorEntity):
     """Sensor for formatted display of charging time remaining (e.g., 2h 53m)."""
 
     _attr_has_entity_name = True
 
     def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, (vin, FIELDS["time_to_fully_charged"].section))
         self.vin = vin
         self._attr_name = "Charging Time Remaining"
         self._attr_unique_id = f"{vin}_charging_time_formatted"
@@ -530,11 +762,7 @@ class ZeekrChargingTimeFormattedSensor(CoordinatorEntity, SensorEntity):
         if not data:
             return None
 
-        raw_minutes = (
-            data.get("additionalVehicleStatus", {})
-            .get("electricVehicleStatus", {})
-            .get("timeToFullyCharged")
-        )
+        raw_minutes = self.coordinator.get_field_value(self.vin, "time_to_fully_charged")
 
         if raw_minutes is None:
             return None
@@ -562,7 +790,7 @@ class ZeekrChargingTimeFormattedSensor(CoordinatorEntity, SensorEntity):
         }
 
 
-class ZeekrVehicleStatusSensor(CoordinatorEntity, SensorEntity):
+class ZeekrVehicleStatusSensor(ZeekrVehicleMixin, CoordinatorEntity, SensorEntity):
     """Sensor for vehicle usage mode / status."""
 
     _attr_has_entity_name = True
@@ -578,7 +806,7 @@ class ZeekrVehicleStatusSensor(CoordinatorEntity, SensorEntity):
 
     def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, (vin, FIELDS["usage_mode"].section))
         self.vin = vin
         self._attr_name = "Vehicle Status"
         self._attr_unique_id = f"{vin}_vehicle_status"
@@ -587,11 +815,7 @@ class ZeekrVehicleStatusSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self):
         """Return mapped vehicle status."""
-        raw = (
-            self.coordinator.data.get(self.vin, {})
-            .get("basicVehicleStatus", {})
-            .get("usageMode")
-        )
+        raw = self.coordinator.get_field_value(self.vin, "usage_mode")
         if raw is None:
             return None
         return self._STATUS_MAP.get(str(raw).strip(), str(raw))
@@ -605,7 +829,7 @@ class ZeekrVehicleStatusSensor(CoordinatorEntity, SensorEntity):
         }
 
 
-class ZeekrEngineStatusSensor(CoordinatorEntity, SensorEntity):
+class ZeekrEngineStatusSensor(ZeekrVehicleMixin, CoordinatorEntity, SensorEntity):
     """Sensor for engine / drive status."""
 
     _attr_has_entity_name = True
@@ -619,7 +843,7 @@ class ZeekrEngineStatusSensor(CoordinatorEntity, SensorEntity):
 
     def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, (vin, FIELDS["engine_status"].section))
         self.vin = vin
         self._attr_name = "Engine Status"
         self._attr_unique_id = f"{vin}_engine_status"
@@ -628,11 +852,7 @@ class ZeekrEngineStatusSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self):
         """Return mapped engine status."""
-        raw = (
-            self.coordinator.data.get(self.vin, {})
-            .get("basicVehicleStatus", {})
-            .get("engineStatus")
-        )
+        raw = self.coordinator.get_field_value(self.vin, "engine_status")
         if raw is None:
             return None
         return self._STATUS_MAP.get(str(raw).strip().lower(), str(raw))
@@ -0,0 +1,114 @@
+"""Services for Zeekr EV API Integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import ZeekrCoordinator
+from .endpoints import ENDPOINT_CHARGE_PLAN, ENDPOINT_TRAVEL_PLAN
+
+SERVICE_SET_CHARGE_PLAN = "set_charge_plan"
+SERVICE_SET_TRAVEL_PLAN = "set_travel_plan"
+
+ATTR_VIN = "vin"
+ATTR_ENABLED = "enabled"
+ATTR_START_TIME = "start_time"
+ATTR_END_TIME = "end_time"
+ATTR_BC_CYCLE_ACTIVE = "bc_cycle_active"
+ATTR_BC_TEMP_ACTIVE = "bc_temp_active"
+ATTR_DEPARTURE_TIME = "departure_time"
+ATTR_AC = "ac"
+ATTR_STEERING_WHEEL_HEATING = "steering_wheel_heating"
+
+SET_CHARGE_PLAN_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_VIN): cv.string,
+        vol.Optional(ATTR_ENABLED): cv.boolean,
+        vol.Optional(ATTR_START_TIME): cv.time,
+        vol.Optional(ATTR_END_TIME): cv.time,
+        vol.Optional(ATTR_BC_CYCLE_ACTIVE): cv.boolean,
+        vol.Optional(ATTR_BC_TEMP_ACTIVE): cv.boolean,
+    }
+)
+
+SET_TRAVEL_PLAN_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_VIN): cv.string,
+        vol.Optional(ATTR_ENABLED): cv.boolean,
+        vol.Optional(ATTR_DEPARTURE_TIME): cv.datetime,
+        vol.Optional(ATTR_AC): cv.boolean,
+        vol.Optional(ATTR_STEERING_WHEEL_HEATING): cv.boolean,
+    }
+)
+
+
+def get_charge_plan_changes(data: dict[str, Any]) -> dict[str, Any]:
+    """Return the charge plan fields set by a service call."""
+    changes: dict[str, Any] = {}
+    if ATTR_ENABLED in data:
+        changes["command"] = "start" if data[ATTR_ENABLED] else "stop"
+    if ATTR_START_TIME in data:
+        changes["startTime"] = data[ATTR_START_TIME].strftime("%H:%M")
+    if ATTR_END_TIME in data:
+        changes["endTime"] = data[ATTR_END_TIME].strftime("%H:%M")
+    if ATTR_BC_CYCLE_ACTIVE in data:
+        changes["bcCycleActive"] = data[ATTR_BC_CYCLE_ACTIVE]
+    if ATTR_BC_TEMP_ACTIVE in data:
+        changes["bcTempActive"] = data[ATTR_BC_TEMP_ACTIVE]
+    return changes
+
+
+def get_travel_plan_changes(data: dict[str, Any]) -> dict[str, Any]:
+    """Return the travel plan fields set by a service call."""
+    changes: dict[str, Any] = {}
+    if ATTR_ENABLED in data:
+        changes["command"] = "start" if data[ATTR_ENABLED] else "stop"
+    if ATTR_DEPARTURE_TIME in data:
+        departure = dt_util.as_utc(data[ATTR_DEPARTURE_TIME])
+        changes["scheduledTime"] = str(int(departure.timestamp() * 1000))
+    if ATTR_AC in data:
+        changes["ac"] = "true" if data[ATTR_AC] else "false"
+    if ATTR_STEERING_WHEEL_HEATING in data:
+        changes["bw"] = "1" if data[ATTR_STEERING_WHEEL_HEATING] else "0"
+    return changes
+
+
+def get_coordinator_for_vin(hass: HomeAssistant, vin: str) -> ZeekrCoordinator:
+    """Return the coordinator of the entry that has a vehicle."""
+    for coordinator in hass.data.get(DOMAIN, {}).values():
+        if isinstance(coordinator, ZeekrCoordinator) and coordinator.get_vehicle_by_vin(vin):
+            return coordinator
+    raise ServiceValidationError(f"No Zeekr vehicle with VIN {vin}")
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the plan services."""
+
+    async def _async_set_plan(call: ServiceCall) -> None:
+        """Write several fields of a plan in one go."""
+        if call.service == SERVICE_SET_CHARGE_PLAN:
+            endpoint = ENDPOINT_CHARGE_PLAN
+            changes = get_charge_plan_changes(call.data)
+        else:
+            endpoint = ENDPOINT_TRAVEL_PLAN
+            changes = get_travel_plan_changes(call.data)
+        if not changes:
+            return
+        vin = call.data[ATTR_VIN]
+        coordinator = get_coordinator_for_vin(hass, vin)
+        await coordinator.plans.async_apply(vin, endpoint, changes)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_CHARGE_PLAN, _async_set_plan, schema=SET_CHARGE_PLAN_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_TRAVEL_PLAN, _async_set_plan, schema=SET_TRAVEL_PLAN_SCHEMA
+    )
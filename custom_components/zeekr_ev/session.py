@@ -0,0 +1,87 @@
+"""Persisted Zeekr API login session for Zeekr EV API Integration.
+
+The client's tokens are kept per config entry, so a restart or reload
+reuses them instead of logging in again. The client logs in again by itself
+when the API rejects a restored token.
+"""
+
+from __future__ import annotations
+
+import base64
+from datetime import datetime, timezone
+import json
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+STORAGE_KEY = "zeekr_ev_session"
+STORAGE_VERSION = 1
+
+# Never written to disk; the password is already in the config entry
+EXCLUDED_KEYS = ("password",)
+
+
+def get_token_expiry(token: str | None) -> datetime | None:
+    """Return when a JWT token expires, or None if it can't be told."""
+    if not token:
+        return None
+    try:
+        payload = token.split()[-1].split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return datetime.fromtimestamp(float(claims["exp"]), tz=timezone.utc)
+    except (IndexError, KeyError, TypeError, ValueError, OverflowError):
+        return None
+
+
+class ZeekrSessionStore:
+    """Save and load the login session of one config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize."""
+        # Private stores are only readable by the Home Assistant user
+        self._store: Store = Store(
+            hass, STORAGE_VERSION, f"{STORAGE_KEY}_{entry_id}", private=True
+        )
+        self._session: dict[str, Any] = {}
+
+    async def async_load(self, username: str) -> dict[str, Any] | None:
+        """Return the saved session of a user, unless it is missing or expired."""
+        stored = await self._store.async_load()
+        if not isinstance(stored, dict) or stored.get("username") != username:
+            return None
+        session = stored.get("session")
+        if not isinstance(session, dict) or not session.get("bearer_token"):
+            return None
+        expires_at = dt_util.parse_datetime(stored.get("expires_at") or "")
+        if expires_at is not None and expires_at <= dt_util.utcnow():
+            return None
+        self._session = session
+        return session
+
+    @callback
+    def async_schedule_save(self, session: dict[str, Any]) -> None:
+        """Save a session exported from the client if its tokens changed."""
+        session = {
+            key: value for key, value in session.items() if key not in EXCLUDED_KEYS
+        }
+        if not session.get("bearer_token") or session == self._session:
+            return
+        self._session = session
+        self._store.async_delay_save(self._data_to_save)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to write."""
+        expires_at = get_token_expiry(self._session.get("bearer_token"))
+        return {
+            "username": self._session.get("username"),
+            "expires_at": expires_at.isoformat() if expires_at else None,
+            "session": self._session,
+        }
+
+    async def async_remove(self) -> None:
+        """Delete the saved session."""
+        self._session = {}
+        await self._store.async_remove()
@@ -0,0 +1,64 @@
+"""Warm-start snapshot of vehicle data for Zeekr EV API Integration.
+
+The last good data of each config entry is kept on disk, so after a restart
+the platforms can be set up straight away and the first poll of the Zeekr
+cloud runs in the background instead of holding up Home Assistant's boot.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+STORAGE_KEY = "zeekr_ev_snapshot"
+STORAGE_VERSION = 1
+SAVE_DELAY = 30  # seconds
+
+
+class ZeekrSnapshotStore:
+    """Save and load the vehicle list and data of one config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize."""
+        # Holds the vehicles' locations; private stores are only readable
+        # by the Home Assistant user
+        self._store: Store = Store(
+            hass, STORAGE_VERSION, f"{STORAGE_KEY}_{entry_id}", private=True
+        )
+        self._vehicles: dict[str, dict] = {}
+        self._data: dict[str, dict] = {}
+
+    async def async_load(self) -> tuple[dict[str, dict], dict[str, dict]] | None:
+        """Return the saved vehicle info and data, or None if there is none."""
+        stored = await self._store.async_load()
+        if not isinstance(stored, dict):
+            return None
+        vehicles = stored.get("vehicles")
+        data = stored.get("data")
+        if not isinstance(vehicles, dict) or not isinstance(data, dict) or not data:
+            return None
+        return vehicles, data
+
+    @callback
+    def async_schedule_save(
+        self, vehicles: dict[str, dict], data: dict[str, dict]
+    ) -> None:
+        """Save the given vehicle info and data after a short delay.
+
+        Saves requested within the delay are merged into one write, and a
+        pending save is flushed when Home Assistant stops.
+        """
+        self._vehicles = vehicles
+        self._data = data
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to write."""
+        return {"vehicles": self._vehicles, "data": self._data}
+
+    async def async_remove(self) -> None:
+        """Delete the saved snapshot."""
+        await self._store.async_remove()
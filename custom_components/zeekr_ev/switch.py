@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any
 
@@ -12,8 +11,15 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .confirm import expect_field
 from .const import DOMAIN
 from .coordinator import ZeekrCoordinator
+from .endpoints import (
+    ENDPOINT_CHARGE_PLAN,
+    ENDPOINT_TRAVEL_PLAN,
+)
+from .entity import ZeekrVehicleMixin
+from .fields import FIELDS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -56,7 +62,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class ZeekrSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
+class ZeekrSwitch(ZeekrVehicleMixin, CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
     """Zeekr Switch class."""
 
     _attr_has_entity_name = True
@@ -72,7 +78,9 @@ class ZeekrSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
         status_group: str = "climateStatus",
     ) -> None:
         """Initialize the switch entity."""
-        super().__init__(coordinator)
+        # The charging switch follows chargerState rather than its status group
+        section = "electricVehicleStatus" if field == "charging" else status_group
+        super().__init__(coordinator, (vin, section))
         self.vin = vin
         self.field = field
         self.status_key = status_key or field
@@ -89,37 +97,9 @@ class ZeekrSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
     @property
     def is_on(self) -> bool | None:
         """Return true if the switch is on."""
-        try:
-            val = None
-            if self.field == "charging":
-                val = (
-                    self.coordinator.data.get(self.vin, {})
-                    .get("additionalVehicleStatus", {})
-                    .get("electricVehicleStatus", {})
-                    .get("chargerState")
-                )
-                if val is None:
-                    return None
-                # "2" (AC charging?), "1" (DC charging?), "25" (stopped AC?), "26" (stopped DC?)
-                # Treat 1 or 2 as charging, 25 or 26 as stopped
-                return str(val) in ("1", "2")
-            else:
-                val = (
-                    self.coordinator.data.get(self.vin, {})
-                    .get("additionalVehicleStatus", {})
-                    .get(self.status_group, {})
-                    .get(self.status_key)
-                )
-                if val is None:
-                    return None
-                if self.field == "sentry_mode":
-                    # vstdModeState: "1" (on), "0" (off)
-                    return str(val) in {"1", "true", "True"}
-                # User: "1" (on), "0" (off), "2" (off)
-                # For defrost and seats, usually "1" is On.
-                return str(val) == "1"
-        except (ValueError, TypeError, AttributeError):
-            return None
+        # chargerState "1"/"2" is charging, "25"/"26" stopped; the climate
+        # and sentry switches are on at "1"
+        return self.coordinator.get_field_value(self.vin, self.field)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
@@ -191,52 +171,10 @@ class ZeekrSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
             return
 
         if setting:
-            await self.coordinator.async_inc_invoke()
-            await self.hass.async_add_executor_job(
-                vehicle.do_remote_control, command, service_id, setting
-            )
+            await self._async_send(vehicle, command, service_id, setting)
 
-            if self.field == "charging":
-                # Wait for backend confirmation for charging
-                timeout = 30  # seconds
-                poll_interval = 2
-                waited = 0
-                charging_confirmed = False
-                while waited < timeout:
-                    try:
-                        # Poll all endpoints used by iOS app for confirmation
-                        status = await self.hass.async_add_executor_job(vehicle.get_charging_status)
-                        await asyncio.sleep(poll_interval)
-                        waited += poll_interval
-                        charger_state = (
-                            status.get("chargerState")
-                            if isinstance(status, dict) else None
-                        )
-                        # iOS trace: chargerState==2 is charging, 25 is stopped
-                        if charger_state is not None and str(charger_state) in ("1", "2"):
-                            charging_confirmed = True
-                            break
-                    except Exception as e:
-                        _LOGGER.info("Error while polling for charging status confirmation: %s", e)
-                        pass
-                if charging_confirmed:
-                    self._update_local_state_optimistically(is_on=True)
-                else:
-                    self._update_local_state_optimistically(is_on=False)
-                self.async_write_ha_state()
-            elif self.field == "sentry_mode":
-                self._update_local_state_optimistically(is_on=True)
-                self.async_write_ha_state()
-
-                async def delayed_refresh():
-                    await asyncio.sleep(10)
-                    await self.coordinator.async_request_refresh()
-
-                self.hass.async_create_task(delayed_refresh())
-            else:
-                self._update_local_state_optimistically(is_on=True)
-                self.async_write_ha_state()
-                await self.coordinator.async_request_refresh()
+            self._update_local_state_optimistically(is_on=True)
+            self._async_confirm(is_on=True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
@@ -296,49 +234,49 @@ class ZeekrSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
             return
 
         if setting:
-            await self.coordinator.async_inc_invoke()
-            await self.hass.async_add_executor_job(
-                vehicle.do_remote_control, command, service_id, setting
-            )
+            await self._async_send(vehicle, command, service_id, setting)
             self._update_local_state_optimistically(is_on=False)
-            self.async_write_ha_state()
-            if self.field == "sentry_mode":
-                async def delayed_refresh():
-                    await asyncio.sleep(10)
-                    await self.coordinator.async_request_refresh()
+            self._async_confirm(is_on=False)
 
-                self.hass.async_create_task(delayed_refresh())
-            else:
-                await self.coordinator.async_request_refresh()
-
-    def _update_local_state_optimistically(self, is_on: bool) -> None:
-        """Update the coordinator data to reflect the change immediately."""
-        data = self.coordinator.data.get(self.vin)
-        if not data:
+    async def _async_send(
+        self, vehicle: Any, command: str, service_id: str, setting: dict
+    ) -> None:
+        """Send the command, batching climate (ZAF) changes per vehicle."""
+        if service_id == "ZAF":
+            await self.coordinator.async_send_climate_command(
+                self.vin, setting["serviceParameters"]
+            )
             return
+        await self.coordinator.async_inc_invoke()
+        await self.coordinator.async_call_api(
+            vehicle.do_remote_control, command, service_id, setting
+        )
+
+    def _async_confirm(self, is_on: bool) -> None:
+        """Poll the vehicle in the background until it reports the new state.
+
+        The state is read back through the status poll, from the same field
+        the optimistic value covers, so a confirmed command also replaces it.
+        """
+        self.coordinator.async_request_vehicle_refresh(
+            self.vin,
+            delay=10 if self.field == "sentry_mode" else 0,
+            expect=expect_field(FIELDS[self.field], is_on),
+        )
 
+    def _update_local_state_optimistically(self, is_on: bool) -> None:
+        """Show the new state until the vehicle confirms it."""
         if self.field == "charging":
-            ev_status = (
-                data.setdefault("additionalVehicleStatus", {})
-                .setdefault("electricVehicleStatus", {})
-            )
-            if is_on:
-                ev_status["chargerState"] = "2"
-            else:
-                ev_status["chargerState"] = "25"
+            path = ("additionalVehicleStatus", "electricVehicleStatus", "chargerState")
+            value = "2" if is_on else "25"
         else:
-            status_group = (
-                data.setdefault("additionalVehicleStatus", {})
-                .setdefault(self.status_group, {})
-            )
-
-            if self.field == "defrost":
-                status_group[self.field] = "1" if is_on else "0"
-            elif self.field == "steering_wheel_heat":
+            path = ("additionalVehicleStatus", self.status_group, self.status_key)
+            if self.field == "steering_wheel_heat":
                 # User says: "steerWhlHeatingSts": "1" when on, "2" when off
-                status_group[self.status_key] = "1" if is_on else "2"
-            elif self.field == "sentry_mode":
-                status_group[self.status_key] = "1" if is_on else "0"
+                value = "1" if is_on else "2"
+            else:
+                value = "1" if is_on else "0"
+        self.coordinator.async_set_optimistic(self.vin, {path: value})
 
     @property
     def device_info(self):
@@ -350,7 +288,7 @@ class ZeekrSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
         }
 
 
-class ZeekrChargingScheduleSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
+class ZeekrChargingScheduleSwitch(ZeekrVehicleMixin, CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
     """Switch to enable/disable the charging schedule."""
 
     _attr_has_entity_name = True
@@ -358,7 +296,7 @@ class ZeekrChargingScheduleSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEnt
 
     def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
         """Initialize the charging schedule switch."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, (vin, "chargePlan"))
         self.vin = vin
         self._attr_name = "Charge Plan"
         self._attr_unique_id = f"{vin}_charging_schedule"
@@ -367,11 +305,7 @@ class ZeekrChargingScheduleSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEnt
     def is_on(self) -> bool | None:
         """Return true if the charging schedule is active."""
         try:
-            command = (
-                self.coordinator.data.get(self.vin, {})
-                .get("chargePlan", {})
-                .get("command")
-            )
+            command = self.coordinator.plans.get_plan(self.vin, ENDPOINT_CHARGE_PLAN).get("command")
             if command is not None:
                 return str(command) == "start"
         except (ValueError, TypeError, AttributeError):
@@ -388,30 +322,10 @@ class ZeekrChargingScheduleSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEnt
 
     async def _set_schedule(self, command: str) -> None:
         """Set the charging schedule command."""
-        vehicle = self.coordinator.get_vehicle_by_vin(self.vin)
-        if not vehicle:
+        if not self.coordinator.get_vehicle_by_vin(self.vin):
             return
 
-        current_plan = self.coordinator.data.get(self.vin, {}).get("chargePlan", {})
-        start_time = current_plan.get("startTime", "00:00")
-        end_time = current_plan.get("endTime", "06:00")
-        bc_cycle = current_plan.get("bcCycleActive", False)
-        bc_temp = current_plan.get("bcTempActive", False)
-
-        await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
-            vehicle.set_charge_plan,
-            start_time,
-            end_time,
-            command,
-            bc_cycle,
-            bc_temp,
-        )
-
-        # Optimistic update
-        plan_data = self.coordinator.data.setdefault(self.vin, {}).setdefault("chargePlan", {})
-        plan_data["command"] = command
-        self.async_write_ha_state()
+        self.coordinator.plans.async_edit(self.vin, ENDPOINT_CHARGE_PLAN, {"command": command})
 
     @property
     def device_info(self):
@@ -423,7 +337,7 @@ class ZeekrChargingScheduleSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEnt
         }
 
 
-class ZeekrTravelPlanSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
+class ZeekrTravelPlanSwitch(ZeekrVehicleMixin, CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
     """Switch to enable/disable the travel plan (pre-conditioning)."""
 
     _attr_has_entity_name = True
@@ -431,7 +345,7 @@ class ZeekrTravelPlanSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
 
     def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
         """Initialize the travel plan switch."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, (vin, "travelPlan"))
         self.vin = vin
         self._attr_name = "Travel Plan"
         self._attr_unique_id = f"{vin}_travel_plan"
@@ -440,11 +354,7 @@ class ZeekrTravelPlanSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
     def is_on(self) -> bool | None:
         """Return true if the travel plan is active."""
         try:
-            command = (
-                self.coordinator.data.get(self.vin, {})
-                .get("travelPlan", {})
-                .get("command")
-            )
+            command = self.coordinator.plans.get_plan(self.vin, ENDPOINT_TRAVEL_PLAN).get("command")
             if command is not None:
                 return str(command) == "start"
         except (ValueError, TypeError, AttributeError):
@@ -461,31 +371,10 @@ class ZeekrTravelPlanSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
 
     async def _set_travel_plan(self, command: str) -> None:
         """Set the travel plan command."""
-        vehicle = self.coordinator.get_vehicle_by_vin(self.vin)
-        if not vehicle:
+        if not self.coordinator.get_vehicle_by_vin(self.vin):
             return
 
-        current_plan = self.coordinator.data.get(self.vin, {}).get("travelPlan", {})
-        scheduled_time = current_plan.get("scheduledTime", "")
-        ac = current_plan.get("ac", "true")
-        ac_preconditioning = str(ac).lower() == "true"
-        bw = current_plan.get("bw", "0")
-        steering_wheel_heating = bw not in ("0", "", None)
-
-        await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
-            vehicle.set_travel_plan,
-            command,
-            "",  # start_time
-            scheduled_time,
-            ac_preconditioning,
-            steering_wheel_heating,
-        )
-
-        # Optimistic update
-        plan_data = self.coordinator.data.setdefault(self.vin, {}).setdefault("travelPlan", {})
-        plan_data["command"] = command
-        self.async_write_ha_state()
+        self.coordinator.plans.async_edit(self.vin, ENDPOINT_TRAVEL_PLAN, {"command": command})
 
     @property
     def device_info(self):
@@ -497,7 +386,7 @@ class ZeekrTravelPlanSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
         }
 
 
-class ZeekrDepartureACSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
+class ZeekrDepartureACSwitch(ZeekrVehicleMixin, CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
     """Switch to enable/disable AC pre-conditioning on departure."""
 
     _attr_has_entity_name = True
@@ -505,7 +394,7 @@ class ZeekrDepartureACSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
 
     def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
         """Initialize the departure AC switch."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, (vin, "travelPlan"))
         self.vin = vin
         self._attr_name = "Departure AC"
         self._attr_unique_id = f"{vin}_departure_ac"
@@ -514,11 +403,7 @@ class ZeekrDepartureACSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
     def is_on(self) -> bool | None:
         """Return true if AC is enabled for departure."""
         try:
-            ac = (
-                self.coordinator.data.get(self.vin, {})
-                .get("travelPlan", {})
-                .get("ac")
-            )
+            ac = self.coordinator.plans.get_plan(self.vin, ENDPOINT_TRAVEL_PLAN).get("ac")
             if ac is not None:
                 return str(ac).lower() == "true"
         except (ValueError, TypeError, AttributeError):
@@ -535,31 +420,13 @@ class ZeekrDepartureACSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
 
     async def _set_departure_ac(self, ac_on: bool) -> None:
         """Set the departure AC setting."""
-        vehicle = self.coordinator.get_vehicle_by_vin(self.vin)
-        if not vehicle:
+        if not self.coordinator.get_vehicle_by_vin(self.vin):
             return
 
-        current_plan = self.coordinator.data.get(self.vin, {}).get("travelPlan", {})
-        command = current_plan.get("command", "start")
-        scheduled_time = current_plan.get("scheduledTime", "")
-        bw = current_plan.get("bw", "0")
-        steering_wheel_heating = bw not in ("0", "", None)
-
-        await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
-            vehicle.set_travel_plan,
-            command,
-            "",  # start_time
-            scheduled_time,
-            ac_on,
-            steering_wheel_heating,
+        self.coordinator.plans.async_edit(
+            self.vin, ENDPOINT_TRAVEL_PLAN, {"ac": "true" if ac_on else "false"}
         )
 
-        # Optimistic update
-        plan_data = self.coordinator.data.setdefault(self.vin, {}).setdefault("travelPlan", {})
-        plan_data["ac"] = "true" if ac_on else "false"
-        self.async_write_ha_state()
-
     @property
     def device_info(self):
         """Return device info."""
@@ -13,6 +13,7 @@ from homeassistant.helpers.restore_state import RestoreEntity
 
 from .const import DOMAIN
 from .coordinator import ZeekrCoordinator
+from .endpoints import ENDPOINT_CHARGE_PLAN
 from .entity import ZeekrEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -61,7 +62,7 @@ class ZeekrChargeScheduleTime(ZeekrEntity, TimeEntity, RestoreEntity):
         plan_field: str,
     ) -> None:
         """Initialize the time entity."""
-        super().__init__(coordinator, vin)
+        super().__init__(coordinator, vin, "chargePlan")
         self._plan_field = plan_field
         self._attr_name = name
         self._attr_unique_id = f"{vin}_{key}"
@@ -71,11 +72,9 @@ class ZeekrChargeScheduleTime(ZeekrEntity, TimeEntity, RestoreEntity):
     def native_value(self) -> time | None:
         """Return the current time value from the charge plan."""
         try:
-            val = (
-                self.coordinator.data.get(self.vin, {})
-                .get("chargePlan", {})
-                .get(self._plan_field)
-            )
+            val = self.coordinator.plans.get_plan(
+                self.vin, ENDPOINT_CHARGE_PLAN
+            ).get(self._plan_field)
             if val:
                 parts = val.split(":")
                 return time(hour=int(parts[0]), minute=int(parts[1]))
@@ -95,40 +94,15 @@ class ZeekrChargeScheduleTime(ZeekrEntity, TimeEntity, RestoreEntity):
                 pass
 
     async def async_set_value(self, value: time) -> None:
-        """Set a new time value and push the full charge plan to the API."""
-        vehicle = self.coordinator.get_vehicle_by_vin(self.vin)
-        if not vehicle:
-            return
+        """Set a new time value in the charge plan.
 
-        # Get current plan values for the fields we're NOT changing
-        current_plan = self.coordinator.data.get(self.vin, {}).get("chargePlan", {})
-        current_start = current_plan.get("startTime", "00:00")
-        current_end = current_plan.get("endTime", "06:00")
-        current_command = current_plan.get("command", "start")
-        bc_cycle = current_plan.get("bcCycleActive", False)
-        bc_temp = current_plan.get("bcTempActive", False)
-
-        new_time_str = value.strftime("%H:%M")
-
-        if self._plan_field == "startTime":
-            start_time = new_time_str
-            end_time = current_end
-        else:
-            start_time = current_start
-            end_time = new_time_str
-
-        await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
-            vehicle.set_charge_plan,
-            start_time,
-            end_time,
-            current_command,
-            bc_cycle,
-            bc_temp,
-        )
+        The plan is written once edits stop coming in, so editing both the
+        start and the end time sends a single plan.
+        """
+        if not self.coordinator.get_vehicle_by_vin(self.vin):
+            return
 
-        # Optimistic update
         self._fallback_value = value
-        plan_data = self.coordinator.data.setdefault(self.vin, {}).setdefault("chargePlan", {})
-        plan_data[self._plan_field] = new_time_str
-        self.async_write_ha_state()
+        self.coordinator.plans.async_edit(
+            self.vin, ENDPOINT_CHARGE_PLAN, {self._plan_field: value.strftime("%H:%M")}
+        )
@@ -0,0 +1,454 @@
+"""Transports that run Zeekr API calls for Zeekr EV API Integration.
+
+Every call into the zeekr_ev_api client goes through a transport, so how the
+client is driven can be changed per config entry without touching the
+coordinator or the platforms.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import importlib
+import json
+import threading
+import time
+from types import ModuleType
+from typing import Any, Callable, TypeVar
+
+import aiohttp
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from requests import Request
+from yarl import URL
+
+from .const import (
+    CONF_API_WORKERS,
+    CONF_TRANSPORT,
+    DEFAULT_API_WORKERS,
+    DEFAULT_TRANSPORT,
+    TRANSPORT_AIOHTTP,
+)
+from .request_stats import get_response_size
+
+_T = TypeVar("_T")
+
+
+@dataclass
+class ZeekrCallTiming:
+    """How long one call waited for a worker, and then ran on it, in seconds.
+
+    Left at None for a call that never got that far. The size of the
+    response, in bytes, is measured on the worker too.
+    """
+
+    wait: float | None = None
+    duration: float | None = None
+    size: int | None = None
+
+
+class ZeekrTransport(ABC):
+    """Base class for running zeekr_ev_api client calls from the event loop.
+
+    Tracks how many calls are waiting for a worker thread and how long they
+    waited, so slow polls can be told apart from a slow network.
+    """
+
+    name = "base"
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._lock = threading.Lock()
+        self.queue_depth = 0
+        self.active_calls = 0
+        self.total_calls = 0
+        self.last_wait = 0.0
+        self.max_wait = 0.0
+        self._total_wait = 0.0
+
+    @property
+    def average_wait(self) -> float:
+        """Return the average time calls waited for a worker, in seconds."""
+        if not self.total_calls:
+            return 0.0
+        return self._total_wait / self.total_calls
+
+    async def async_call(
+        self,
+        func: Callable[..., _T],
+        *args: Any,
+        timing: ZeekrCallTiming | None = None,
+    ) -> _T:
+        """Run a client or vehicle method and return its result.
+
+        With timing, the call's wait for a worker and its run time on it are
+        filled in, also when it fails, and the size of what it returned.
+        """
+        submitted = time.monotonic()
+        with self._lock:
+            self.queue_depth += 1
+
+        def _job() -> _T:
+            started = time.monotonic()
+            wait = started - submitted
+            with self._lock:
+                self.queue_depth -= 1
+                self.active_calls += 1
+                self.total_calls += 1
+                self.last_wait = wait
+                self.max_wait = max(self.max_wait, wait)
+                self._total_wait += wait
+            if timing is not None:
+                timing.wait = wait
+            try:
+                result = func(*args)
+            finally:
+                if timing is not None:
+                    timing.duration = time.monotonic() - started
+                with self._lock:
+                    self.active_calls -= 1
+            if timing is not None:
+                # Serializing large responses would block the event loop
+                timing.size = get_response_size(result)
+            return result
+
+        return await self._async_run(_job)
+
+    @abstractmethod
+    async def _async_run(self, job: Callable[[], _T]) -> _T:
+        """Run a prepared job."""
+
+    async def async_shutdown(self) -> None:
+        """Release any resources held by the transport."""
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the transport's load figures."""
+        return {
+            "transport": self.name,
+            "queue_depth": self.queue_depth,
+            "active_calls": self.active_calls,
+            "total_calls": self.total_calls,
+            "last_wait": round(self.last_wait, 4),
+            "average_wait": round(self.average_wait, 4),
+            "max_wait": round(self.max_wait, 4),
+        }
+
+
+class ZeekrExecutorTransport(ZeekrTransport):
+    """Run the blocking client in Home Assistant's shared executor."""
+
+    name = "executor"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        super().__init__()
+        self._hass = hass
+
+    async def _async_run(self, job: Callable[[], _T]) -> _T:
+        """Run a job in the executor."""
+        return await self._hass.async_add_executor_job(job)
+
+
+class ZeekrThreadPoolTransport(ZeekrTransport):
+    """Run the blocking client on a bounded thread pool owned by the entry.
+
+    Keeps Zeekr traffic from competing with the recorder and other
+    integrations for Home Assistant's shared executor threads.
+    """
+
+    name = "thread_pool"
+
+    def __init__(self, max_workers: int) -> None:
+        """Initialize."""
+        super().__init__()
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="zeekr_ev"
+        )
+
+    async def _async_run(self, job: Callable[[], _T]) -> _T:
+        """Run a job on the pool."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, job)
+
+    async def async_shutdown(self) -> None:
+        """Stop the pool, dropping calls that have not started yet."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the transport's load figures."""
+        return {**super().as_dict(), "max_workers": self.max_workers}
+
+
+@dataclass(frozen=True)
+class ZeekrRequest:
+    """A vehicle read the aiohttp transport sends itself."""
+
+    url: str  # name of the URL in zeekr_ev_api.const
+    label: str
+    query: str = ""
+    # When the API reports a failure: raise, or return no data like the client
+    required: bool = True
+
+
+# Vehicle methods sent on the aiohttp session, by name
+AIOHTTP_REQUESTS: dict[str, ZeekrRequest] = {
+    "get_status": ZeekrRequest(
+        "VEHICLESTATUS_URL", "vehicle status", "?latest=false&target=new"
+    ),
+    "get_remote_control_state": ZeekrRequest("REMOTECONTROLSTATE_URL", "vehicle status"),
+    "get_charging_status": ZeekrRequest(
+        "VEHICLECHARGINGSTATUS_URL", "vehicle charging status"
+    ),
+    "get_charging_limit": ZeekrRequest("CHARGING_LIMIT_URL", "vehicle charging limit"),
+    "get_charge_plan": ZeekrRequest("CHARGING_PLAN_URL", "charge plan", required=False),
+    "get_travel_plan": ZeekrRequest(
+        "LATEST_TRAVEL_PLAN_URL", "travel plan", required=False
+    ),
+}
+# Remote commands are sent on the aiohttp session too
+COMMAND_METHOD = "do_remote_control"
+# Service id of the commands the API takes on its charging endpoint
+CHARGE_SERVICE_ID = "RCS"
+# Message of a response to a request made with an expired bearer token
+TOKEN_EXPIRED = "Token expired"
+
+
+def get_api_module(client: Any, name: str) -> ModuleType:
+    """Return a module of the zeekr_ev_api package the client was loaded from.
+
+    That is the installed package or the local copy in custom_components,
+    whichever the config entry uses. The client has imported it already.
+    """
+    package = type(client).__module__.rpartition(".")[0]
+    return importlib.import_module(f"{package}.{name}")
+
+
+def get_client_timeout(timeout: Any) -> aiohttp.ClientTimeout:
+    """Return the client's (connect, read) timeout, or single timeout, for aiohttp."""
+    if isinstance(timeout, (tuple, list)):
+        connect, read = timeout
+        return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+    return aiohttp.ClientTimeout(total=timeout)
+
+
+class ZeekrAiohttpTransport(ZeekrTransport):
+    """Send vehicle reads and remote commands on Home Assistant's aiohttp session.
+
+    Requests are built and signed by zeekr_ev_api exactly as the client
+    does, then sent without holding a thread, over the keep-alive
+    connections of the shared session. A response saying the bearer token
+    expired logs in again and the request is retried once, as the client
+    does. Login, the vehicle list and plan writes still run the blocking
+    client, on the fallback transport.
+    """
+
+    name = "aiohttp"
+
+    def __init__(
+        self,
+        client: Any,
+        session: aiohttp.ClientSession,
+        fallback: ZeekrTransport,
+    ) -> None:
+        """Initialize."""
+        super().__init__()
+        self.client = client
+        self.fallback = fallback
+        self.requests = 0
+        self.token_refreshes = 0
+        self._session = session
+        self._const = get_api_module(client, "const")
+        self._app_sig = get_api_module(client, "zeekr_app_sig")
+        self._exceptions = get_api_module(client, "exceptions")
+        self._refresh_lock = asyncio.Lock()
+
+    async def async_call(
+        self,
+        func: Callable[..., _T],
+        *args: Any,
+        timing: ZeekrCallTiming | None = None,
+    ) -> _T:
+        """Send a vehicle read or command itself, or run any other call blocking."""
+        name = getattr(func, "__name__", None)
+        vin = getattr(getattr(func, "__self__", None), "vin", None)
+        if vin is None or (name not in AIOHTTP_REQUESTS and name != COMMAND_METHOD):
+            return await super().async_call(func, *args, timing=timing)
+
+        started = time.monotonic()
+        with self._lock:
+            self.active_calls += 1
+            self.total_calls += 1
+        if timing is not None:
+            timing.wait = 0.0
+        try:
+            if name == COMMAND_METHOD:
+                return await self._async_send_command(vin, *args, timing=timing)
+            return await self._async_get(AIOHTTP_REQUESTS[name], vin, timing=timing)
+        finally:
+            if timing is not None:
+                timing.duration = time.monotonic() - started
+            with self._lock:
+                self.active_calls -= 1
+
+    async def _async_run(self, job: Callable[[], _T]) -> _T:
+        """Run a blocking job on the fallback transport."""
+        return await self.fallback._async_run(job)
+
+    async def _async_get(
+        self, request: ZeekrRequest, vin: str, timing: ZeekrCallTiming | None
+    ) -> Any:
+        """Fetch a vehicle read and return its data."""
+        url = f"{self.client.region_login_server}{getattr(self._const, request.url)}"
+        result = await self._async_send("GET", f"{url}{request.query}", vin, None, timing)
+        if not result.get("success", False):
+            if request.required:
+                raise self._exceptions.ZeekrException(
+                    f"Failed to get {request.label}: {result}"
+                )
+            return {}
+        return result.get("data", {})
+
+    async def _async_send_command(
+        self,
+        vin: str,
+        command: str,
+        service_id: str,
+        setting: dict[str, Any],
+        timing: ZeekrCallTiming | None = None,
+    ) -> bool:
+        """Send a remote command and return whether the API accepted it."""
+        if service_id == CHARGE_SERVICE_ID:
+            path = self._const.CHARGE_CONTROL_URL
+        else:
+            path = self._const.REMOTECONTROL_URL
+        body = json.dumps(
+            {"command": command, "serviceId": service_id, "setting": setting},
+            separators=(",", ":"),
+        )
+        result = await self._async_send(
+            "POST", f"{self.client.region_login_server}{path}", vin, body, timing
+        )
+        return result.get("success", False)
+
+    async def _async_send(
+        self,
+        method: str,
+        url: str,
+        vin: str,
+        body: str | None,
+        timing: ZeekrCallTiming | None,
+    ) -> dict[str, Any]:
+        """Send a signed request, logging in again once if the token expired."""
+        if not self.client.logged_in:
+            raise self._exceptions.ZeekrException("Not logged in")
+        for retry in (True, False):
+            token = self.client.bearer_token
+            result = await self._async_send_signed(method, url, vin, body, timing)
+            if result.get("msg") != TOKEN_EXPIRED:
+                return result
+            if not retry:
+                break
+            await self._async_refresh_token(token)
+        raise self._exceptions.AuthException("Token expired (retry failed)")
+
+    async def _async_send_signed(
+        self,
+        method: str,
+        url: str,
+        vin: str,
+        body: str | None,
+        timing: ZeekrCallTiming | None,
+    ) -> dict[str, Any]:
+        """Sign a request the way the client does and send it."""
+        client = self.client
+        headers = dict(client.logged_in_headers or {})
+        headers["authorization"] = headers.get("authorization") or client.bearer_token
+        headers["X-VIN"] = client._get_encrypted_vin(vin)
+        prepared = client.session.prepare_request(
+            Request(method, url, headers=headers, data=body)
+        )
+        signed = self._app_sig.sign_request(prepared, client.prod_secret)
+
+        self.requests += 1
+        async with self._session.request(
+            signed.method,
+            URL(signed.url, encoded=True),
+            headers=dict(signed.headers),
+            data=signed.body,
+            timeout=get_client_timeout(getattr(client, "timeout", (10, 30))),
+        ) as response:
+            content = await response.read()
+        if timing is not None:
+            timing.size = len(content)
+        try:
+            return json.loads(content)
+        except ValueError as err:
+            return {
+                "success": False,
+                "error": f"Invalid JSON response: {err}",
+                "status_code": response.status,
+            }
+
+    async def _async_refresh_token(self, expired: str | None) -> None:
+        """Log in again, unless another request already replaced the expired token."""
+        async with self._refresh_lock:
+            if self.client.bearer_token != expired:
+                return
+            self.token_refreshes += 1
+            try:
+                await super().async_call(self._relogin)
+            except Exception as err:
+                raise self._exceptions.AuthException(
+                    f"Token refresh failed: {err}"
+                ) from err
+
+    def _relogin(self) -> None:
+        """Log the client in again; runs blocking, on the fallback transport."""
+        self.client.login(relogin=True)
+
+    async def async_shutdown(self) -> None:
+        """Stop the fallback transport; the shared session stays open."""
+        await self.fallback.async_shutdown()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the transport's load figures."""
+        return {
+            **super().as_dict(),
+            "requests": self.requests,
+            "token_refreshes": self.token_refreshes,
+            "fallback": self.fallback.as_dict(),
+        }
+
+
+def create_blocking_transport(
+    hass: HomeAssistant, entry: ConfigEntry | None = None
+) -> ZeekrTransport:
+    """Create the transport that runs the blocking client for a config entry.
+
+    A worker count of 0 falls back to Home Assistant's shared executor.
+    """
+    max_workers = DEFAULT_API_WORKERS
+    if entry is not None:
+        max_workers = int(entry.data.get(CONF_API_WORKERS, DEFAULT_API_WORKERS))
+    if max_workers > 0:
+        return ZeekrThreadPoolTransport(max_workers)
+    return ZeekrExecutorTransport(hass)
+
+
+def create_transport(
+    hass: HomeAssistant, entry: ConfigEntry | None = None, client: Any = None
+) -> ZeekrTransport:
+    """Create the transport used by a config entry.
+
+    The aiohttp transport needs the entry's client to sign its requests.
+    """
+    blocking = create_blocking_transport(hass, entry)
+    transport = DEFAULT_TRANSPORT
+    if entry is not None:
+        transport = entry.data.get(CONF_TRANSPORT, DEFAULT_TRANSPORT)
+    if transport == TRANSPORT_AIOHTTP and client is not None:
+        return ZeekrAiohttpTransport(client, async_get_clientsession(hass), blocking)
+    return blocking
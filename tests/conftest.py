@@ -1,6 +1,13 @@
 import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 
+from custom_components.zeekr_ev.debounce import ZeekrWriteDebouncer
+from custom_components.zeekr_ev.fields import FIELDS
+from custom_components.zeekr_ev.overlay import ZeekrOptimisticOverlay, set_path
+from custom_components.zeekr_ev.plans import ZeekrPlanEditor
+
 
 class DummyConfigEntries:
     async def async_forward_entry_setups(self, entry, platforms):
@@ -36,6 +43,200 @@ def hass():
     return DummyHass()
 
 
+class FakeCoordinator:
+    """Stand-in for ZeekrCoordinator in entity tests.
+
+    Calls run straight away and optimistic values are written into data,
+    as the overlay would show them.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.vehicles = {}
+        self.async_inc_invoke = AsyncMock()
+        self.async_request_vehicle_refresh = MagicMock()
+        self.last_update_success = True
+        # VINs still showing the warm-start snapshot
+        self.restored = set()
+        # VINs whose own coordinator's last poll failed
+        self.unavailable = set()
+
+    def is_restored(self, vin):
+        return vin in self.restored
+
+    def is_vehicle_available(self, vin):
+        return vin not in self.unavailable
+
+    def get_vehicle_data(self, vin):
+        return self.data.get(vin)
+
+    def get_field_value(self, vin, field):
+        if isinstance(field, str):
+            field = FIELDS[field]
+        return field.extract(self.data.get(vin))
+
+    def async_set_optimistic(self, vin, values):
+        for path, value in values.items():
+            self.data[vin] = set_path(self.data[vin], path, value)
+
+    async def async_call_api(self, func, *args):
+        return func(*args)
+
+    async def async_send_climate_command(self, vin, parameters):
+        self.vehicles[vin].do_remote_control("start", "ZAF", {"serviceParameters": parameters})
+
+    def get_vehicle_by_vin(self, vin):
+        return self.vehicles.get(vin)
+
+    def inc_invoke(self):
+        pass
+
+    async def async_request_refresh(self):
+        pass
+
+
+class FakeVehicle:
+    """A vehicle of FakeZeekrClient, parked and unplugged."""
+
+    def __init__(self, vin):
+        self.vin = vin
+        self.data = {"vin": vin}
+        self.calls = []
+
+    def get_status(self):
+        return {"basicVehicleStatus": {"engineStatus": "engine-off"}}
+
+    def get_remote_control_state(self):
+        return {}
+
+    def get_charging_status(self):
+        return {}
+
+    def get_charging_limit(self):
+        return {"soc": "800"}
+
+    def get_charge_plan(self):
+        return {"startTime": "01:00", "endTime": "06:00", "command": "start"}
+
+    def get_travel_plan(self):
+        return {}
+
+    def do_remote_control(self, command, service_id, setting):
+        self.calls.append((command, service_id, setting))
+        return True
+
+
+class FakeZeekrClient:
+    """Stand-in for zeekr_ev_api's ZeekrClient, which isn't installed here."""
+
+    def __init__(self, **kwargs):
+        self.username = kwargs.get("username")
+        self.password = kwargs.get("password")
+        self.logged_in = False
+        self.auth_token = None
+        self.bearer_token = None
+        self.vin_key = kwargs.get("vin_key", "")
+        self.vin_iv = kwargs.get("vin_iv", "")
+        self.logins = 0
+        self.vehicles = [FakeVehicle("VIN1")]
+
+    def login(self):
+        self.logins += 1
+        self.logged_in = True
+        self.auth_token = "auth"
+        self.bearer_token = "Bearer token"
+
+    def get_vehicle_list(self):
+        return self.vehicles
+
+    def export_session(self):
+        return {
+            "username": self.username,
+            "password": self.password,
+            "auth_token": self.auth_token,
+            "bearer_token": self.bearer_token,
+        }
+
+    def load_session(self, session):
+        self.username = session["username"]
+        self.password = session["password"]
+        self.auth_token = session.get("auth_token")
+        self.bearer_token = session.get("bearer_token")
+        self.logged_in = bool(self.bearer_token)
+
+
+@pytest.fixture
+def mock_zeekr_client():
+    """Set entries up with FakeZeekrClient; yields the clients created."""
+    clients = []
+
+    def create_client(**kwargs):
+        client = FakeZeekrClient(**kwargs)
+        clients.append(client)
+        return client
+
+    with patch(
+        "custom_components.zeekr_ev.get_zeekr_client_class", return_value=create_client
+    ), patch("custom_components.zeekr_ev.sensor.zeekr_app_sig_module", MagicMock()):
+        yield clients
+
+
+# Modules that schedule their own timers
+TIMER_MODULES = ("batcher", "confirm", "debounce", "overlay", "refresh")
+
+
+@pytest.fixture
+def call_later():
+    """Keep timers from running; the cancel of each is kept in cancels."""
+    mock_call_later = MagicMock()
+    mock_call_later.cancels = []
+
+    def schedule(*args):
+        cancel = MagicMock()
+        mock_call_later.cancels.append(cancel)
+        return cancel
+
+    mock_call_later.side_effect = schedule
+    patches = [
+        patch(f"custom_components.zeekr_ev.{module}.async_call_later", mock_call_later)
+        for module in TIMER_MODULES
+    ]
+    for timer_patch in patches:
+        timer_patch.start()
+    yield mock_call_later
+    for timer_patch in patches:
+        timer_patch.stop()
+
+
+@pytest.fixture
+def plan_coordinator(hass):
+    """Return a coordinator with a real overlay, debouncer and plan editor."""
+    coordinator = MagicMock()
+    coordinator.data = {
+        "VIN1": {
+            "chargePlan": {
+                "startTime": "01:00",
+                "endTime": "06:00",
+                "command": "stop",
+                "bcCycleActive": False,
+                "bcTempActive": False,
+            },
+            "travelPlan": {"command": "start", "scheduledTime": "1700000000000", "ac": "true", "bw": "0"},
+        }
+    }
+    coordinator.write_debouncer = ZeekrWriteDebouncer(hass, 2)
+    coordinator.overlay = ZeekrOptimisticOverlay(hass, MagicMock())
+    coordinator.get_vehicle_data = lambda vin: coordinator.overlay.apply(
+        vin, coordinator.data.get(vin)
+    )
+    coordinator.async_set_optimistic = coordinator.overlay.async_set
+    coordinator.async_debounce_write = coordinator.write_debouncer.async_schedule
+    coordinator.async_inc_invoke = AsyncMock()
+    coordinator.async_call_api = AsyncMock()
+    coordinator.plans = ZeekrPlanEditor(coordinator)
+    return coordinator
+
+
 @pytest.fixture
 def mock_config_entry():
     """Return a mock ConfigEntry for testing."""
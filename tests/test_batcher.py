@@ -0,0 +1,99 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.zeekr_ev.batcher import (
+    ZeekrClimateBatcher,
+    get_function,
+    merge_parameters,
+)
+
+
+def make_batcher(send):
+    hass = MagicMock()
+    hass.loop = asyncio.get_running_loop()
+    return ZeekrClimateBatcher(hass, send)
+
+
+def test_get_function():
+    assert get_function("SH.11.level") == "SH.11"
+    assert get_function("AC.temp") == "AC"
+    assert get_function("DF") == "DF"
+
+
+def test_merge_replaces_earlier_changes_of_a_function():
+    parameters = [
+        {"key": "SH.11", "value": "true"},
+        {"key": "SH.11.level", "value": "3"},
+        {"key": "SW", "value": "true"},
+    ]
+    merged = merge_parameters(parameters, [{"key": "SH.11", "value": "false"}])
+    assert merged == [{"key": "SW", "value": "true"}, {"key": "SH.11", "value": "false"}]
+
+
+@pytest.mark.asyncio
+async def test_commands_in_window_share_one_invoke(call_later):
+    send = AsyncMock()
+    batcher = make_batcher(send)
+
+    tasks = [
+        asyncio.create_task(batcher.async_send("VIN1", [{"key": "SW", "value": "true"}])),
+        asyncio.create_task(batcher.async_send("VIN1", [{"key": "DF", "value": "true"}])),
+        asyncio.create_task(batcher.async_send("VIN2", [{"key": "AC", "value": "false"}])),
+    ]
+    await asyncio.sleep(0)
+    assert call_later.call_count == 2
+    assert not any(task.done() for task in tasks)
+
+    for call in call_later.call_args_list:
+        await call[0][2]()
+    await asyncio.gather(*tasks)
+
+    send.assert_any_await(
+        "VIN1", [{"key": "SW", "value": "true"}, {"key": "DF", "value": "true"}]
+    )
+    send.assert_any_await("VIN2", [{"key": "AC", "value": "false"}])
+    assert batcher.requests == 3
+    assert batcher.sends == 2
+
+
+@pytest.mark.asyncio
+async def test_send_error_reaches_every_caller(call_later):
+    batcher = make_batcher(AsyncMock(side_effect=Exception("API Error")))
+
+    tasks = [
+        asyncio.create_task(batcher.async_send("VIN1", [{"key": "SW", "value": "true"}])),
+        asyncio.create_task(batcher.async_send("VIN1", [{"key": "DF", "value": "true"}])),
+    ]
+    await asyncio.sleep(0)
+    await call_later.call_args[0][2]()
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert [str(result) for result in results] == ["API Error", "API Error"]
+
+
+@pytest.mark.asyncio
+async def test_shutdown_cancels_pending(call_later):
+    batcher = make_batcher(AsyncMock())
+    task = asyncio.create_task(batcher.async_send("VIN1", [{"key": "SW", "value": "true"}]))
+    await asyncio.sleep(0)
+
+    batcher.async_shutdown()
+    call_later.cancels[-1].assert_called_once()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+@pytest.mark.asyncio
+async def test_flush_sends_pending_batches(call_later):
+    send = AsyncMock()
+    batcher = make_batcher(send)
+
+    task = asyncio.create_task(batcher.async_send("VIN1", [{"key": "SW", "value": "true"}]))
+    await asyncio.sleep(0)
+    await batcher.async_flush()
+    await task
+
+    send.assert_awaited_once_with("VIN1", [{"key": "SW", "value": "true"}])
+    call_later.cancels[-1].assert_called_once()
@@ -0,0 +1,88 @@
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from custom_components.zeekr_ev.breaker import (
+    FAILURE_THRESHOLD,
+    MAX_OPEN_DURATION,
+    OPEN_DURATION,
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    ZeekrCircuitBreaker,
+    ZeekrCircuitBreakers,
+    get_backoff_delay,
+)
+
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def open_breaker():
+    breaker = ZeekrCircuitBreaker()
+    for _ in range(FAILURE_THRESHOLD - 1):
+        assert not breaker.record_failure(NOW, Exception("boom"))
+    assert breaker.record_failure(NOW, Exception("boom"))
+    return breaker
+
+
+def test_backoff_delay_is_jittered_and_capped():
+    with patch("custom_components.zeekr_ev.breaker.random.uniform", side_effect=lambda a, b: b):
+        assert get_backoff_delay(0) == 1.0
+        assert get_backoff_delay(2) == 4.0
+        assert get_backoff_delay(10) == 10.0
+
+
+def test_opens_after_repeated_failures():
+    breaker = open_breaker()
+    assert breaker.state == STATE_OPEN
+    assert breaker.open_until == NOW + OPEN_DURATION
+    assert breaker.last_error == "boom"
+    assert not breaker.allow_request(NOW + OPEN_DURATION / 2)
+
+
+def test_probe_after_open_duration():
+    breaker = open_breaker()
+    later = NOW + OPEN_DURATION
+
+    assert breaker.allow_request(later)
+    assert breaker.state == STATE_HALF_OPEN
+    # Only one probe at a time
+    assert not breaker.allow_request(later)
+
+    assert breaker.record_success()
+    assert breaker.state == STATE_CLOSED
+    assert breaker.allow_request(later)
+
+
+def test_failed_probe_doubles_open_duration():
+    breaker = open_breaker()
+    later = NOW + OPEN_DURATION
+    breaker.allow_request(later)
+
+    # Not reported as newly opened again
+    assert not breaker.record_failure(later, Exception("still down"))
+    assert breaker.state == STATE_OPEN
+    assert breaker.open_until == later + OPEN_DURATION * 2
+
+    breaker.trips = 20
+    breaker.allow_request(breaker.open_until)
+    breaker.record_failure(later, Exception("still down"))
+    assert breaker.open_until == later + MAX_OPEN_DURATION
+
+
+def test_success_resets_failure_count():
+    breaker = ZeekrCircuitBreaker()
+    breaker.record_failure(NOW, Exception("boom"))
+    assert not breaker.record_success()
+    assert breaker.failures == 0
+
+
+def test_breakers_report_open_endpoints():
+    breakers = ZeekrCircuitBreakers()
+    assert breakers.get("VIN1", "travel_plan") is breakers.get("VIN1", "travel_plan")
+    breakers.get("VIN1", "charge_plan").record_failure(NOW, Exception("boom"))
+    for _ in range(FAILURE_THRESHOLD):
+        breakers.get("VIN1", "travel_plan").record_failure(NOW, Exception("boom"))
+
+    assert breakers.get_open() == {"VIN1": ["travel_plan"]}
+    assert set(breakers.as_dict()["VIN1"]) == {"charge_plan", "travel_plan"}
+    assert breakers.as_dict()["VIN1"]["travel_plan"]["state"] == STATE_OPEN
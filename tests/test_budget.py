@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from custom_components.zeekr_ev.budget import ZeekrBudgetGovernor, get_time_until_reset
+from custom_components.zeekr_ev.endpoints import SUB_ENDPOINTS
+
+# Six hours before midnight UTC, the time zone tests run in
+NOW = datetime(2026, 1, 1, 18, 0, tzinfo=timezone.utc)
+
+
+def make_governor(requests=0, invokes=0, daily_limit=1000, command_reserve=100):
+    stats = SimpleNamespace(api_requests_today=requests, api_invokes_today=invokes)
+    governor = ZeekrBudgetGovernor(stats, daily_limit, command_reserve)
+    governor.poll_cost = 2.0
+    return governor
+
+
+def test_time_until_reset():
+    assert get_time_until_reset(NOW) == timedelta(hours=6)
+
+
+def test_disabled_without_limit():
+    governor = make_governor(requests=5000, daily_limit=0)
+    assert not governor.enabled
+    assert governor.poll_interval(2, NOW) == timedelta(0)
+
+
+def test_initial_poll_cost_covers_sub_fetches():
+    governor = ZeekrBudgetGovernor(SimpleNamespace(api_requests_today=0, api_invokes_today=0))
+    assert governor.poll_cost == 1 + len(SUB_ENDPOINTS)
+
+
+def test_reserve_is_held_back_for_commands():
+    governor = make_governor(requests=500, invokes=30)
+    assert governor.used_today == 530
+    assert governor.reserve_left == 70
+    assert governor.poll_budget_left == 400
+
+    governor = make_governor(requests=500, invokes=150)
+    assert governor.reserve_left == 0
+    assert governor.poll_budget_left == 350
+
+
+def test_poll_interval_spreads_budget_until_reset():
+    # 400 requests left at 2 per poll: 200 polls over 6 hours for 2 vehicles
+    governor = make_governor(requests=500)
+    assert governor.poll_interval(2, NOW) == timedelta(minutes=3.6)
+
+
+def test_poll_interval_waits_for_reset_when_spent():
+    governor = make_governor(requests=899)
+    assert governor.poll_interval(1, NOW) == timedelta(hours=6)
+
+
+def test_record_poll_smooths_cost():
+    governor = make_governor()
+    governor.record_poll(7)
+    assert governor.poll_cost == 3.0
+
+
+def test_projected_usage():
+    # 12 polls per hour for 6 hours at 2 requests each, invokes at today's rate
+    governor = make_governor(requests=100, invokes=6)
+    assert governor.projected_usage([timedelta(minutes=5)], NOW) == 106 + 144 + 2
+    assert governor.projected_usage([timedelta(0)], NOW) == 108
+
+
+def test_allow_poll_within_poll_budget():
+    assert make_governor(requests=500).allow_poll(400)
+    assert not make_governor(requests=500).allow_poll(401)
+    assert make_governor(requests=5000, daily_limit=0).allow_poll(10)
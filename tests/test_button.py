@@ -23,6 +23,9 @@ class MockCoordinator:
         self.async_inc_invoke = AsyncMock()
         self.async_request_refresh = AsyncMock()
 
+    async def async_call_api(self, func, *args):
+        return func(*args)
+
     def get_vehicle_by_vin(self, vin):
         for v in self.vehicles:
             if v.vin == vin:
@@ -1,8 +1,9 @@
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import ANY, MagicMock
 import pytest
 from homeassistant.components.climate import HVACMode
 from custom_components.zeekr_ev.climate import ZeekrClimate, async_setup_entry
 from custom_components.zeekr_ev.const import DOMAIN
+from tests.conftest import FakeCoordinator
 
 
 class MockVehicle:
@@ -13,18 +14,8 @@ class MockVehicle:
         return True
 
 
-class MockCoordinator:
-    def __init__(self, data):
-        self.data = data
-        self.vehicles = {}
-        self.async_inc_invoke = AsyncMock()
-        self.ac_duration = 15
-
-    def get_vehicle_by_vin(self, vin):
-        return self.vehicles.get(vin)
-
-    async def async_request_refresh(self):
-        pass
+class MockCoordinator(FakeCoordinator):
+    ac_duration = 15
 
 
 class DummyHass:
@@ -77,11 +68,12 @@ async def test_climate_optimistic_update():
     # Verify Optimistic Update
     climate_status = coordinator.data[vin]["additionalVehicleStatus"]["climateStatus"]
     assert climate_status["preClimateActive"] == "1"
-    climate.async_write_ha_state.assert_called()
 
-    # Verify Delayed Refresh Task Created
-    assert climate.hass.async_create_task.called
-    climate.hass.async_create_task.call_args[0][0].close()
+    # Verify the car is polled until it reports climate on
+    coordinator.async_request_vehicle_refresh.assert_called_once_with(vin, delay=10, expect=ANY)
+    expect = coordinator.async_request_vehicle_refresh.call_args.kwargs["expect"]
+    assert expect(coordinator.data[vin])
+    assert not expect({})
 
     # Test Turn Off
     await climate.async_set_hvac_mode(HVACMode.OFF)
@@ -103,11 +95,9 @@ async def test_climate_optimistic_update():
     # Verify Optimistic Update
     climate_status = coordinator.data[vin]["additionalVehicleStatus"]["climateStatus"]
     assert climate_status["preClimateActive"] == "0"
-    climate.async_write_ha_state.assert_called()
 
-    # Verify Delayed Refresh Task Created again
-    assert climate.hass.async_create_task.call_count == 2
-    climate.hass.async_create_task.call_args[0][0].close()
+    # Verify Delayed Refresh Requested again
+    assert coordinator.async_request_vehicle_refresh.call_count == 2
 
 
 @pytest.mark.asyncio
@@ -162,7 +152,22 @@ async def test_climate_attributes(hass):
     climate = ZeekrClimate(coordinator, vin)
 
     attrs = climate.extra_state_attributes
-    assert attrs["last_updated"] == expected_iso
+    assert attrs == {"last_updated": expected_iso}
+
+    # Values from the warm-start snapshot are marked until the first poll
+    coordinator.restored.add(vin)
+    attrs = climate.extra_state_attributes
+    assert attrs == {"last_updated": expected_iso, "restored": True}
+    coordinator.restored.clear()
+
+    # The entity follows its vehicle's coordinator as well as the account's
+    assert climate.available
+    coordinator.unavailable.add(vin)
+    assert not climate.available
+    coordinator.unavailable.clear()
+    coordinator.last_update_success = False
+    assert not climate.available
+    coordinator.last_update_success = True
 
     # Test missing updateTime
     initial_data[vin]["additionalVehicleStatus"]["climateStatus"].pop("updateTime")
@@ -1,4 +1,6 @@
 import pytest
+import voluptuous as vol
+
 import custom_components.zeekr_ev.config_flow as config_flow
 from custom_components.zeekr_ev.utils import validate_input
 from custom_components.zeekr_ev.const import (
@@ -75,6 +77,23 @@ def test_polling_interval_config_key():
     assert CONF_POLLING_INTERVAL == "polling_interval"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "key", ["active_polling_interval", "sleep_polling_interval", "slow_refresh_interval"]
+)
+async def test_options_reject_intervals_below_a_minute(hass, key):
+    entry = type("Entry", (), {"data": {"username": "user", "password": "secret"}})()
+    flow = config_flow.ZeekrEVAPIOptionsFlowHandler(entry)
+    flow.hass = hass
+    result = await flow.async_step_user()
+    schema = result["data_schema"]
+
+    assert schema({key: 1})[key] == 1
+    for value in (0, -5):
+        with pytest.raises(vol.Invalid):
+            schema({key: value})
+
+
 def test_validation_logic():
     """Test validation logic."""
     # Valid input (with base64 strings)
@@ -0,0 +1,97 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.zeekr_ev.confirm import (
+    CONFIRM_DELAYS,
+    CONFIRM_TIMEOUT,
+    ZeekrConfirmationEngine,
+    expect_field,
+)
+from custom_components.zeekr_ev.fields import FIELDS
+
+
+class FakeLoop:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+def make_engine(hass, data):
+    hass.loop = FakeLoop()
+    flush = AsyncMock()
+    on_timeout = MagicMock()
+    engine = ZeekrConfirmationEngine(hass, flush, data.get, on_timeout)
+    return engine, flush, on_timeout
+
+
+async def run_poll(hass, call_later):
+    delay = call_later.call_args[0][1]
+    hass.loop.now += delay
+    await call_later.call_args[0][2]()
+    return delay
+
+
+def test_expect_field():
+    expect = expect_field(FIELDS["defrost"], True)
+    assert expect({"additionalVehicleStatus": {"climateStatus": {"defrost": "1"}}})
+    assert not expect({})
+
+
+@pytest.mark.asyncio
+async def test_commands_share_polls_until_confirmed(hass, call_later):
+    data = {"VIN1": {"state": "old"}, "VIN2": {"state": "old"}}
+    engine, flush, on_timeout = make_engine(hass, data)
+
+    engine.async_confirm("VIN1", lambda d: d["state"] == "new", "charging_status")
+    engine.async_confirm("VIN1", lambda d: d["state"] == "new", "status")
+    engine.async_confirm("VIN2", lambda d: d["state"] == "new", "status", delay=15)
+    assert call_later.call_count == 1
+    assert call_later.call_args[0][1] == CONFIRM_DELAYS[0]
+
+    # VIN2 isn't due yet
+    await run_poll(hass, call_later)
+    flush.assert_awaited_once_with({"VIN1": {"charging_status", "status"}})
+    assert len(engine.pending) == 3
+
+    # Unconfirmed commands back off
+    assert call_later.call_args[0][1] == CONFIRM_DELAYS[0]
+    data["VIN1"] = {"state": "new"}
+    await run_poll(hass, call_later)
+    assert [c.vin for c in engine.pending] == ["VIN2"]
+    assert engine.confirmed == 2
+
+    data["VIN2"] = {"state": "new"}
+    await run_poll(hass, call_later)
+    assert flush.await_args_list[-1].args[0] == {"VIN2": {"status"}}
+    assert engine.pending == []
+    assert engine.polls == 3
+    on_timeout.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_unconfirmed_command_times_out(hass, call_later):
+    engine, flush, on_timeout = make_engine(hass, {"VIN1": {}})
+    engine.async_confirm("VIN1", lambda d: False, "charging_status")
+
+    waited = 0
+    delays = []
+    while engine.pending:
+        delays.append(await run_poll(hass, call_later))
+        waited += delays[-1]
+
+    assert delays[1:4] == list(CONFIRM_DELAYS[:3])
+    assert waited == CONFIRM_DELAYS[0] + CONFIRM_TIMEOUT
+    assert engine.timed_out == 1
+    assert on_timeout.call_args[0][0].vin == "VIN1"
+
+
+@pytest.mark.asyncio
+async def test_shutdown_drops_pending(hass, call_later):
+    engine, _, _ = make_engine(hass, {})
+    engine.async_confirm("VIN1", lambda d: True)
+    engine.async_shutdown()
+    call_later.cancels[-1].assert_called_once()
+    assert engine.pending == []
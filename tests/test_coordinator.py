@@ -1,8 +1,17 @@
 from unittest.mock import MagicMock, AsyncMock, patch
 import pytest
 import asyncio
-from custom_components.zeekr_ev.coordinator import ZeekrCoordinator
+from datetime import timedelta
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+from custom_components.zeekr_ev.breaker import FAILURE_THRESHOLD, OPEN_DURATION, RETRY_ATTEMPTS
+from custom_components.zeekr_ev.coordinator import (
+    ZeekrCoordinator,
+    ZeekrVehicleCoordinator,
+    get_changed_sections,
+)
 from custom_components.zeekr_ev.const import DOMAIN
+from custom_components.zeekr_ev.scheduler import MIN_TICK
 
 
 class MockVehicle:
@@ -18,12 +27,14 @@ class MockVehicle:
 
 class MockClient:
     def __init__(self, vehicles):
+        self.logged_in = True
         self.get_vehicle_list = MagicMock(return_value=vehicles)
 
 
 class DummyConfig:
     def __init__(self):
-        self.data = {"polling_interval": 60}
+        # Run API calls through the (mocked) shared executor
+        self.data = {"polling_interval": 60, "api_workers": 0}
         self.entry_id = "test_entry"
         self.config_dir = "/tmp/dummy_config_dir"
 
@@ -45,7 +56,9 @@ def mock_data_update_coordinator_init(self, hass, logger, name, update_interval=
     self.logger = logger
     self.name = name
     self.update_interval = update_interval
-    self._listeners = []
+    self.data = None
+    self._listeners = {}
+    self.last_update_success = True
     self._micro_controller = MagicMock()
 
 
@@ -239,3 +252,835 @@ async def test_coordinator_update_charging_limit_failure():
     finally:
         if coordinator._unsub_reset:
             coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_skips_sleeping_vehicle_until_due():
+    """A vehicle in deep sleep keeps its snapshot until its slower interval elapses."""
+    asleep = MockVehicle("VIN1")
+    asleep.get_status.return_value = {"basicVehicleStatus": {"usageMode": "0"}}
+    charging = MockVehicle("VIN2")
+    charging.get_status.return_value = {
+        "additionalVehicleStatus": {"electricVehicleStatus": {"chargerState": "2"}}
+    }
+    for vehicle in (asleep, charging):
+        vehicle.get_remote_control_state.return_value = {}
+        vehicle.get_charging_status.return_value = {}
+        vehicle.get_charging_limit.return_value = {}
+        vehicle.get_charge_plan.return_value = {}
+        vehicle.get_travel_plan.return_value = {}
+
+    client = MockClient([asleep, charging])
+    hass = DummyHass()
+    config = DummyConfig()
+    config.data = {
+        "polling_interval": 5,
+        "active_polling_interval": 1,
+        "sleep_polling_interval": 30,
+        "api_workers": 0,
+    }
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, client, config)
+
+    coordinator.request_stats = MagicMock()
+    coordinator.request_stats.async_inc_request = AsyncMock()
+
+    try:
+        coordinator.data = await coordinator._async_update_data()
+        assert set(coordinator.data) == {"VIN1", "VIN2"}
+
+        # Both are scheduled in the future: nothing is due right away
+        first_snapshot = coordinator.data["VIN1"]
+        coordinator.scheduler.force("VIN2")
+        coordinator.data = await coordinator._async_update_data()
+
+        assert asleep.get_status.call_count == 1
+        assert charging.get_status.call_count == 2
+        assert coordinator.data["VIN1"] is first_snapshot
+        assert coordinator.update_interval <= timedelta(minutes=1)
+
+        # A requested refresh polls every vehicle
+        coordinator.scheduler.force()
+        coordinator.data = await coordinator._async_update_data()
+        assert asleep.get_status.call_count == 2
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_slow_endpoints_served_from_cache():
+    """Plans and charging limit are re-used until stale or marked dirty."""
+    vin = "VIN1"
+    vehicle = MockVehicle(vin)
+    vehicle.get_status.return_value = {}
+    vehicle.get_remote_control_state.return_value = {"remote": "ok"}
+    vehicle.get_charging_status.return_value = {"status": "ok"}
+    vehicle.get_charging_limit.return_value = {"soc": "800"}
+    vehicle.get_charge_plan.return_value = {"startTime": "00:00"}
+    vehicle.get_travel_plan.return_value = {"scheduledTime": "1700000000000"}
+
+    client = MockClient([vehicle])
+    hass = DummyHass()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, client, DummyConfig())
+
+    coordinator.request_stats = MagicMock()
+    coordinator.request_stats.async_inc_request = AsyncMock()
+
+    try:
+        await coordinator._async_update_data()
+        coordinator.scheduler.force()
+        data = await coordinator._async_update_data()
+
+        # Realtime endpoints are fetched on every poll, slow ones only once
+        assert vehicle.get_status.call_count == 2
+        assert vehicle.get_remote_control_state.call_count == 2
+        assert vehicle.get_charging_status.call_count == 2
+        vehicle.get_charging_limit.assert_called_once()
+        vehicle.get_charge_plan.assert_called_once()
+        vehicle.get_travel_plan.assert_called_once()
+
+        # Cached values are still merged into the snapshot
+        assert data[vin]["chargingLimit"]["soc"] == "800"
+        assert data[vin]["chargePlan"]["startTime"] == "00:00"
+        assert data[vin]["travelPlan"]["scheduledTime"] == "1700000000000"
+
+        # A write marks the endpoint dirty so it is re-fetched once
+        vehicle.get_charge_plan.return_value = {"startTime": "01:00"}
+        coordinator.mark_endpoint_dirty(vin, "charge_plan")
+        coordinator.scheduler.force()
+        data = await coordinator._async_update_data()
+        assert vehicle.get_charge_plan.call_count == 2
+        assert data[vin]["chargePlan"]["startTime"] == "01:00"
+        vehicle.get_travel_plan.assert_called_once()
+
+        # Once older than the slow tier max age, everything is re-fetched
+        coordinator.endpoint_max_age["slow"] = timedelta(0)
+        coordinator.scheduler.force()
+        await coordinator._async_update_data()
+        assert vehicle.get_charging_limit.call_count == 2
+        assert vehicle.get_travel_plan.call_count == 2
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_skips_pointless_sub_fetches():
+    """Unplugged or sleeping vehicles carry forward sections with a stale marker."""
+    vin = "VIN1"
+    vehicle = MockVehicle(vin)
+    vehicle.get_status.return_value = {
+        "additionalVehicleStatus": {"electricVehicleStatus": {"statusOfChargerConnection": "1"}}
+    }
+    vehicle.get_remote_control_state.return_value = {"vstdModeState": "0"}
+    vehicle.get_charging_status.return_value = {"chargePower": "7"}
+    vehicle.get_charging_limit.return_value = {"soc": "800"}
+    vehicle.get_charge_plan.return_value = {"startTime": "00:00"}
+    vehicle.get_travel_plan.return_value = {"scheduledTime": "1700000000000"}
+
+    client = MockClient([vehicle])
+    hass = DummyHass()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, client, DummyConfig())
+
+    coordinator.request_stats = MagicMock()
+    coordinator.request_stats.async_inc_request = AsyncMock()
+
+    try:
+        await coordinator._async_update_data()
+        assert coordinator.stale_endpoints[vin] == set()
+
+        # Unplugged and asleep: neither realtime endpoint is worth a request
+        vehicle.get_status.return_value = {
+            "basicVehicleStatus": {"usageMode": "0"},
+            "additionalVehicleStatus": {"electricVehicleStatus": {"statusOfChargerConnection": "0"}},
+        }
+        coordinator.scheduler.force()
+        data = await coordinator._async_update_data()
+
+        vehicle.get_charging_status.assert_called_once()
+        vehicle.get_remote_control_state.assert_called_once()
+        assert data[vin]["chargingStatus"]["chargePower"] == "7"
+        assert data[vin]["additionalVehicleStatus"]["remoteControlState"]["vstdModeState"] == "0"
+        assert coordinator.stale_endpoints[vin] >= {"charging_status", "remote_control_state"}
+        assert coordinator.get_endpoint_fetched_at(vin, "charging_status") is not None
+
+        # A dirty endpoint is fetched even when the rule says to skip it
+        coordinator.mark_endpoint_dirty(vin, "charging_status")
+        coordinator.scheduler.force()
+        await coordinator._async_update_data()
+        assert vehicle.get_charging_status.call_count == 2
+        assert "charging_status" not in coordinator.stale_endpoints[vin]
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_command_refresh_only_polls_requested_vehicle():
+    """A refresh after a command re-polls the commanded vehicle only."""
+    first = MockVehicle("VIN1")
+    second = MockVehicle("VIN2")
+    for vehicle in (first, second):
+        vehicle.get_status.return_value = {}
+        vehicle.get_charge_plan.return_value = {"startTime": "00:00"}
+
+    client = MockClient([first, second])
+    hass = DummyHass()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, client, DummyConfig())
+        coordinator.snapshot = MagicMock()
+
+    coordinator.request_stats = MagicMock()
+    coordinator.request_stats.async_inc_request = AsyncMock()
+
+    try:
+        coordinator.data = await coordinator._async_update_data()
+        await coordinator._async_refresh_vehicles({"VIN1": {"status", "charge_plan"}})
+
+        assert first.get_status.call_count == 2
+        assert first.get_charge_plan.call_count == 2
+        assert second.get_status.call_count == 1
+        assert second.get_charge_plan.call_count == 1
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_refresh_vehicle_endpoints_only():
+    """Refreshing one endpoint merges it and only notifies that vehicle."""
+    first = MockVehicle("VIN1")
+    second = MockVehicle("VIN2")
+    for vehicle in (first, second):
+        vehicle.get_status.return_value = {"basicVehicleStatus": {"usageMode": "1"}}
+        vehicle.get_charge_plan.return_value = {"startTime": "00:00"}
+
+    client = MockClient([first, second])
+    hass = DummyHass()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, client, DummyConfig())
+        coordinator.snapshot = MagicMock()
+
+    coordinator.request_stats = MagicMock()
+    coordinator.request_stats.async_inc_request = AsyncMock()
+
+    first_listener = MagicMock()
+    second_listener = MagicMock()
+    account_listener = MagicMock()
+    coordinator._listeners = {
+        1: (first_listener, "VIN1"),
+        2: (second_listener, "VIN2"),
+        3: (account_listener, None),
+    }
+
+    try:
+        coordinator.data = await coordinator._async_update_data()
+        previous = coordinator.data
+
+        first.get_charge_plan.return_value = {"startTime": "01:30"}
+        await coordinator.async_refresh_vehicle("VIN1", ["charge_plan"])
+
+        # Only the charge plan was fetched again
+        assert first.get_status.call_count == 1
+        assert first.get_charge_plan.call_count == 2
+        assert second.get_charge_plan.call_count == 1
+
+        assert coordinator.data["VIN1"]["chargePlan"] == {"startTime": "01:30"}
+        assert coordinator.data["VIN1"]["basicVehicleStatus"] == {"usageMode": "1"}
+        assert previous["VIN1"]["chargePlan"] == {"startTime": "00:00"}
+        assert coordinator.data["VIN2"] is previous["VIN2"]
+
+        first_listener.assert_called_once()
+        account_listener.assert_called_once()
+        second_listener.assert_not_called()
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_per_vehicle_coordinators():
+    """Each vehicle gets its own coordinator; its updates only wake its entities."""
+    charging = MockVehicle("VIN1")
+    charging.get_status.return_value = {
+        "additionalVehicleStatus": {"electricVehicleStatus": {"chargerState": "2"}}
+    }
+    failing = MockVehicle("VIN2")
+    failing.get_status.side_effect = Exception("API Error")
+
+    client = MockClient([charging, failing])
+    hass = DummyHass()
+    config = DummyConfig()
+    config.data = {
+        "polling_interval": 5,
+        "active_polling_interval": 1,
+        "api_workers": 0,
+        "per_vehicle_coordinators": True,
+    }
+
+    async def child_refresh(self):
+        try:
+            self.data = await self._async_update_data()
+            self.last_update_success = True
+        except UpdateFailed:
+            self.last_update_success = False
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True), \
+            patch.object(ZeekrVehicleCoordinator, "async_refresh", child_refresh), \
+            patch.object(ZeekrVehicleCoordinator, "async_add_listener", MagicMock(return_value=MagicMock())):
+        coordinator = ZeekrCoordinator(hass, client, config)
+        coordinator.snapshot = MagicMock()
+        coordinator.request_stats = MagicMock()
+        coordinator.request_stats.async_inc_request = AsyncMock()
+
+        try:
+            data = await coordinator._async_update_data()
+
+            assert set(coordinator.vehicle_coordinators) == {"VIN1", "VIN2"}
+            assert list(data) == ["VIN1"]
+            # The parent no longer polls; each child runs on its own interval
+            assert coordinator.update_interval is None
+            assert coordinator.vehicle_coordinators["VIN1"].update_interval == timedelta(minutes=1)
+            assert coordinator.vehicle_coordinators["VIN2"].last_update_success is False
+
+            coordinator.data = data
+            first_listener = MagicMock()
+            second_listener = MagicMock()
+            coordinator._listeners = {1: (first_listener, "VIN1"), 2: (second_listener, "VIN2")}
+
+            charging.get_status.return_value = {"basicVehicleStatus": {"usageMode": "1"}}
+            child = coordinator.vehicle_coordinators["VIN1"]
+            await child.async_refresh()
+            coordinator._async_handle_vehicle_update("VIN1")
+
+            assert coordinator.data["VIN1"] == {"basicVehicleStatus": {"usageMode": "1"}}
+            assert child.update_interval == timedelta(minutes=5)
+            first_listener.assert_called_once()
+            second_listener.assert_not_called()
+            assert coordinator.is_vehicle_available("VIN1")
+            assert not coordinator.is_vehicle_available("VIN2")
+
+            # A failed poll keeps the data but makes every entity of the vehicle
+            # unavailable, including those only following one section
+            section_listener = MagicMock()
+            coordinator._listeners[3] = (section_listener, ("VIN1", "chargePlan"))
+            first_listener.reset_mock()
+            charging.get_status.side_effect = Exception("API Error")
+            await child.async_refresh()
+            coordinator._async_handle_vehicle_update("VIN1")
+
+            assert not coordinator.is_vehicle_available("VIN1")
+            assert coordinator.data["VIN1"] == {"basicVehicleStatus": {"usageMode": "1"}}
+            first_listener.assert_called_once()
+            section_listener.assert_called_once()
+            second_listener.assert_not_called()
+
+            # Failing again changes nothing; recovering notifies them all again
+            await child.async_refresh()
+            coordinator._async_handle_vehicle_update("VIN1")
+            first_listener.assert_called_once()
+            charging.get_status.side_effect = None
+            await child.async_refresh()
+            coordinator._async_handle_vehicle_update("VIN1")
+
+            assert coordinator.is_vehicle_available("VIN1")
+            assert first_listener.call_count == 2
+            assert section_listener.call_count == 2
+            second_listener.assert_not_called()
+
+            # A zero interval, saved before options were range checked, still
+            # leaves the scheduler's tick between polls of a charging car
+            charging.get_status.return_value = {
+                "additionalVehicleStatus": {"electricVehicleStatus": {"chargerState": "2"}}
+            }
+            await child.async_refresh()
+            assert child.update_interval == timedelta(minutes=1)
+            assert coordinator.async_apply_options(
+                {**config.data, "active_polling_interval": 0}
+            ) is True
+            assert child.update_interval == MIN_TICK
+            await child.async_refresh()
+            assert child.update_interval == MIN_TICK
+        finally:
+            if coordinator._unsub_reset:
+                coordinator._unsub_reset()
+
+
+def test_get_changed_sections():
+    old = {
+        "basicVehicleStatus": {"usageMode": "1"},
+        "additionalVehicleStatus": {
+            "climateStatus": {"interiorTemp": "20.0"},
+            "electricVehicleStatus": {"chargerState": "0"},
+        },
+        "chargePlan": {"startTime": "00:00"},
+    }
+    new = {
+        "basicVehicleStatus": {"usageMode": "1"},
+        "additionalVehicleStatus": {
+            "climateStatus": {"interiorTemp": "21.0"},
+            "electricVehicleStatus": {"chargerState": "0"},
+        },
+        "travelPlan": {"scheduledTime": "1700000000000"},
+    }
+    assert get_changed_sections(old, new) == {"climateStatus", "chargePlan", "travelPlan"}
+    assert get_changed_sections(old, old) == set()
+    assert get_changed_sections(None, {"chargePlan": {}}) == {"chargePlan"}
+
+
+@pytest.mark.asyncio
+async def test_coordinator_only_notifies_changed_sections():
+    """Listeners are only called when their vehicle or section changed."""
+    client = MockClient([])
+    hass = DummyHass()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, client, DummyConfig())
+        coordinator.snapshot = MagicMock()
+
+    vehicle_listener = MagicMock()
+    climate_listener = MagicMock()
+    plan_listener = MagicMock()
+    other_listener = MagicMock()
+    account_listener = MagicMock()
+    coordinator._listeners = {
+        1: (vehicle_listener, "VIN1"),
+        2: (climate_listener, ("VIN1", "climateStatus")),
+        3: (plan_listener, ("VIN1", "chargePlan")),
+        4: (other_listener, "VIN2"),
+        5: (account_listener, None),
+    }
+
+    try:
+        snapshot = {
+            "additionalVehicleStatus": {"climateStatus": {"interiorTemp": "20.0"}},
+            "chargePlan": {"startTime": "00:00"},
+        }
+        coordinator.data = {"VIN1": snapshot, "VIN2": {"basicVehicleStatus": {}}}
+        coordinator.async_update_listeners()
+        for listener in (vehicle_listener, climate_listener, plan_listener, other_listener, account_listener):
+            assert listener.call_count == 1
+
+        # Identical data only reaches the account-wide listeners
+        coordinator.data = {"VIN1": dict(snapshot), "VIN2": {"basicVehicleStatus": {}}}
+        coordinator.async_update_listeners()
+        assert vehicle_listener.call_count == 1
+        assert account_listener.call_count == 2
+
+        # A climate change skips the plan and the other vehicle
+        coordinator.data = {
+            "VIN1": {**snapshot, "additionalVehicleStatus": {"climateStatus": {"interiorTemp": "22.0"}}},
+            "VIN2": {"basicVehicleStatus": {}},
+        }
+        coordinator.async_update_listeners()
+        assert vehicle_listener.call_count == 2
+        assert climate_listener.call_count == 2
+        assert plan_listener.call_count == 1
+        assert other_listener.call_count == 1
+
+        # A failed update reaches everyone so entities can go unavailable
+        coordinator.last_update_success = False
+        coordinator.async_update_listeners()
+        assert plan_listener.call_count == 2
+        assert other_listener.call_count == 2
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+def test_coordinator_field_cache():
+    """Parsed values are cached until the vehicle snapshot changes."""
+    client = MockClient([])
+    hass = DummyHass()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, client, DummyConfig())
+        coordinator.snapshot = MagicMock()
+
+    try:
+        snapshot = {"additionalVehicleStatus": {"electricVehicleStatus": {"chargeLevel": "80"}}}
+        coordinator.data = {"VIN1": snapshot}
+        assert coordinator.get_field_value("VIN1", "battery_level") == "80"
+
+        # In-place edits are only seen once the cache is dropped
+        snapshot["additionalVehicleStatus"]["electricVehicleStatus"]["chargeLevel"] = "81"
+        assert coordinator.get_field_value("VIN1", "battery_level") == "80"
+        coordinator.async_invalidate_fields("VIN1")
+        assert coordinator.get_field_value("VIN1", "battery_level") == "81"
+
+        # A new snapshot drops the cache when listeners are notified
+        coordinator.data = {
+            "VIN1": {"additionalVehicleStatus": {"electricVehicleStatus": {"chargeLevel": "82"}}}
+        }
+        coordinator.async_update_listeners()
+        assert coordinator.get_field_value("VIN1", "battery_level") == "82"
+        assert coordinator.get_field_value("VIN2", "battery_level") is None
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_optimistic_values():
+    """Optimistic values are shown over the data until a poll confirms them."""
+    hass = DummyHass()
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, MockClient([]), DummyConfig())
+    coordinator.snapshot = MagicMock()
+    lock_listener = MagicMock()
+    coordinator._listeners = {1: (lock_listener, ("VIN1", "drivingSafetyStatus"))}
+    path = ("additionalVehicleStatus", "drivingSafetyStatus", "centralLockingStatus")
+
+    def snapshot(locked):
+        return {"additionalVehicleStatus": {"drivingSafetyStatus": {"centralLockingStatus": locked}}}
+
+    try:
+        coordinator.data = {"VIN1": snapshot("0")}
+        coordinator.async_update_listeners()
+        assert coordinator.get_field_value("VIN1", "lock_centralLockingStatus") is False
+
+        with patch("custom_components.zeekr_ev.overlay.async_call_later"):
+            coordinator.async_set_optimistic("VIN1", {path: "1"})
+        assert lock_listener.call_count == 2
+        assert coordinator.get_field_value("VIN1", "lock_centralLockingStatus") is True
+        # Commands are only confirmed by what the vehicle reports
+        assert coordinator.data["VIN1"] == snapshot("0")
+
+        # A poll with the old state changes nothing for the entities
+        coordinator.data = {"VIN1": snapshot("0")}
+        coordinator.async_update_listeners()
+        assert lock_listener.call_count == 2
+        assert coordinator.get_field_value("VIN1", "lock_centralLockingStatus") is True
+
+        # Once confirmed, the data is shown as is
+        coordinator.data = {"VIN1": snapshot("1")}
+        coordinator.async_update_listeners()
+        assert coordinator.overlay.get_values("VIN1") == {}
+        assert coordinator.get_vehicle_data("VIN1") is coordinator.data["VIN1"]
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_warm_start_from_snapshot():
+    """Restored data is stale until the first poll, which also logs in."""
+    vin = "VIN1"
+    vehicle = MockVehicle(vin)
+    vehicle.get_status.return_value = {"basicVehicleStatus": {"usageMode": "1"}}
+    client = MockClient([vehicle])
+    client.logged_in = False
+    client.login = MagicMock(side_effect=lambda: setattr(client, "logged_in", True))
+    hass = DummyHass()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, client, DummyConfig())
+        coordinator.snapshot = MagicMock()
+
+    coordinator.request_stats = MagicMock()
+    coordinator.request_stats.async_inc_request = AsyncMock()
+
+    try:
+        coordinator.snapshot.async_load = AsyncMock(return_value=None)
+        assert await coordinator.async_restore_snapshot() is False
+
+        coordinator.snapshot.async_load = AsyncMock(
+            return_value=({vin: {"plateNo": "AB-123"}}, {vin: {"basicVehicleStatus": {}}})
+        )
+        assert await coordinator.async_restore_snapshot() is True
+        assert coordinator.data == {vin: {"basicVehicleStatus": {}}}
+        assert coordinator.restored_vehicles == {vin: {"plateNo": "AB-123"}}
+        assert coordinator.is_restored(vin)
+
+        coordinator.data = await coordinator._async_update_data()
+        client.login.assert_called_once()
+        assert not coordinator.is_restored(vin)
+        assert coordinator.data[vin]["basicVehicleStatus"] == {"usageMode": "1"}
+
+        # The fresh data is saved for the next start
+        coordinator.async_update_listeners()
+        vehicles, data = coordinator.snapshot.async_schedule_save.call_args.args
+        assert vehicles == {vin: {}}
+        assert data == coordinator.data
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_restore_session():
+    """A saved session is loaded into a client that isn't logged in."""
+    client = MockClient([])
+    client.logged_in = False
+
+    def load_session(session):
+        client.session = session
+        client.logged_in = True
+
+    client.load_session = MagicMock(side_effect=load_session)
+    client.export_session = MagicMock(return_value={"bearer_token": "new"})
+    hass = DummyHass()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, client, DummyConfig())
+        coordinator.session_store = MagicMock()
+
+    try:
+        coordinator.session_store.async_load = AsyncMock(return_value=None)
+        assert await coordinator.async_restore_session("user", "pw") is False
+        client.load_session.assert_not_called()
+
+        coordinator.session_store.async_load = AsyncMock(return_value={"bearer_token": "old"})
+        assert await coordinator.async_restore_session("user", "pw") is True
+        assert client.session == {"bearer_token": "old", "username": "user", "password": "pw"}
+
+        # Already logged in: nothing to restore
+        assert await coordinator.async_restore_session("user", "pw") is False
+
+        coordinator.async_save_session()
+        coordinator.session_store.async_schedule_save.assert_called_once_with({"bearer_token": "new"})
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+def test_coordinator_apply_options():
+    """Polling and display settings apply in place; others need a reload."""
+    client = MockClient([])
+    hass = DummyHass()
+    config = DummyConfig()
+    config.data = {
+        "polling_interval": 5,
+        "slow_refresh_interval": 60,
+        "drive_side": "lhd",
+        "api_workers": 0,
+        "username": "user",
+    }
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, client, config)
+
+    listener = MagicMock()
+    coordinator._listeners = {1: (listener, ("VIN1", "maintenanceStatus"))}
+    coordinator._schedule_refresh = MagicMock()
+
+    try:
+        assert coordinator.async_apply_options({**config.data, "username": "other"}) is False
+        assert coordinator.async_apply_options({**config.data, "api_workers": 2}) is False
+        assert coordinator.scheduler.base_interval == timedelta(minutes=5)
+
+        options = {**config.data, "polling_interval": 10, "slow_refresh_interval": 120, "drive_side": "rhd"}
+        assert coordinator.async_apply_options(options) is True
+        assert coordinator.scheduler.base_interval == timedelta(minutes=10)
+        assert coordinator.update_interval == timedelta(minutes=10)
+        assert coordinator.endpoint_max_age["slow"] == timedelta(minutes=120)
+        assert coordinator.drive_side == "rhd"
+        coordinator._schedule_refresh.assert_called_once()
+        # Entities are told so tire names can follow the drive side
+        listener.assert_called_once()
+
+        # Nothing changed
+        assert coordinator.async_apply_options(options) is True
+        listener.assert_called_once()
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_endpoint_retry_and_breaker():
+    """A failing sub-fetch is retried, then left alone once its breaker opens."""
+    vin = "VIN1"
+    vehicle = MockVehicle(vin)
+    vehicle.get_status.return_value = {}
+    vehicle.get_travel_plan.side_effect = Exception("API Error")
+
+    client = MockClient([vehicle])
+    hass = DummyHass()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, client, DummyConfig())
+    coordinator.request_stats = MagicMock()
+    coordinator.request_stats.async_inc_request = AsyncMock()
+    coordinator.vehicles = [vehicle]
+
+    try:
+        with patch("custom_components.zeekr_ev.coordinator.asyncio.sleep", AsyncMock()) as sleep:
+            for _ in range(FAILURE_THRESHOLD):
+                coordinator.mark_endpoint_dirty(vin, "travel_plan")
+                await coordinator._async_update_vehicle(vehicle)
+            assert sleep.await_count == FAILURE_THRESHOLD
+        assert vehicle.get_travel_plan.call_count == FAILURE_THRESHOLD * RETRY_ATTEMPTS
+        assert coordinator.breakers.get_open() == {vin: ["travel_plan"]}
+
+        # Open: not called at all, the other endpoints still are
+        vehicle.get_travel_plan.reset_mock()
+        await coordinator._async_update_vehicle(vehicle)
+        vehicle.get_travel_plan.assert_not_called()
+        assert vehicle.get_status.call_count == FAILURE_THRESHOLD + 1
+
+        # Probe once the open duration is over
+        vehicle.get_travel_plan.side_effect = None
+        vehicle.get_travel_plan.return_value = {"scheduledTime": "1"}
+        with patch(
+            "custom_components.zeekr_ev.coordinator.dt_util.utcnow",
+            return_value=dt_util.utcnow() + OPEN_DURATION,
+        ):
+            _, data = await coordinator._async_update_vehicle(vehicle)
+        vehicle.get_travel_plan.assert_called_once()
+        assert data["travelPlan"] == {"scheduledTime": "1"}
+        assert coordinator.breakers.get_open() == {}
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_records_calls_per_endpoint():
+    vehicle = MockVehicle("VIN1")
+    vehicle.get_status.__name__ = "get_status"
+    vehicle.get_charge_plan.__name__ = "get_charge_plan"
+    vehicle.get_charge_plan.side_effect = Exception("boom")
+    hass = DummyHass()
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    coordinator.request_stats = MagicMock()
+
+    try:
+        await coordinator.async_call_api(vehicle.get_status)
+        with pytest.raises(Exception, match="boom"):
+            await coordinator.async_call_api(vehicle.get_charge_plan)
+
+        (status_call, plan_call) = coordinator.request_stats.record_call.call_args_list
+        assert status_call.args[0] == "status"
+        assert status_call.args[1] >= 0
+        assert plan_call.args[0] == "charge_plan"
+        assert str(plan_call.args[2]) == "boom"
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_confirms_commands_in_background(call_later):
+    """Commands with an expectation go to the confirmation engine."""
+    hass = DummyHass()
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, MockClient([]), DummyConfig())
+    coordinator.refresh_broker = MagicMock()
+    coordinator.confirmations = MagicMock()
+
+    try:
+        def expect(data):
+            return True
+
+        # The optimistic values set just before belong to the command
+        coordinator.async_update_vehicle_listeners = MagicMock()
+        coordinator.async_set_optimistic("VIN1", {("chargingStatus", "state"): "1"})
+        coordinator.async_request_vehicle_refresh("VIN1", "charging_status", expect=expect)
+        coordinator.confirmations.async_confirm.assert_called_once_with(
+            "VIN1", expect, "charging_status", delay=0,
+            values={("chargingStatus", "state"): "1"},
+        )
+        coordinator.refresh_broker.async_request.assert_not_called()
+        assert "charging_status" in coordinator._dirty_endpoints["VIN1"]
+
+        # An unconfirmed sub-endpoint command drops the optimistic values
+        # and falls back to a full refresh
+        coordinator.overlay = MagicMock()
+        coordinator.async_update_vehicle_listeners.reset_mock()
+        confirmation = MagicMock(vin="VIN1", endpoints=frozenset({"charging_status"}))
+        coordinator._async_handle_unconfirmed(confirmation)
+        coordinator.overlay.async_discard.assert_called_once_with("VIN1", confirmation.values)
+        coordinator.async_update_vehicle_listeners.assert_called_once_with("VIN1")
+        coordinator.refresh_broker.async_request.assert_called_once_with("VIN1", "status")
+
+        confirmation.endpoints = frozenset({"status"})
+        coordinator._async_handle_unconfirmed(confirmation)
+        assert coordinator.refresh_broker.async_request.call_count == 1
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_confirmation_polls_stay_within_budget():
+    hass = DummyHass()
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, MockClient([]), DummyConfig())
+    coordinator._async_refresh_vehicles = AsyncMock()
+    coordinator.budget = MagicMock()
+
+    try:
+        coordinator.budget.allow_poll.return_value = True
+        await coordinator._async_poll_confirmations({"VIN1": {"status", "charging_status"}})
+        coordinator.budget.allow_poll.assert_called_once_with(2)
+        coordinator._async_refresh_vehicles.assert_awaited_once()
+
+        coordinator.budget.allow_poll.return_value = False
+        await coordinator._async_poll_confirmations({"VIN1": {"status"}})
+        coordinator._async_refresh_vehicles.assert_awaited_once()
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_sends_climate_batch_as_one_invoke():
+    vehicle = MockVehicle("VIN1")
+    vehicle.do_remote_control = MagicMock()
+    hass = DummyHass()
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    coordinator.vehicles = [vehicle]
+    coordinator.request_stats = MagicMock()
+    coordinator.request_stats.async_inc_invoke = AsyncMock()
+
+    try:
+        parameters = [{"key": "SW", "value": "true"}, {"key": "DF", "value": "true"}]
+        await coordinator._async_send_climate_parameters("VIN1", parameters)
+        vehicle.do_remote_control.assert_called_once_with(
+            "start", "ZAF", {"serviceParameters": parameters}
+        )
+        coordinator.request_stats.async_inc_invoke.assert_awaited_once()
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_profiles_poll_cycles():
+    vehicle = MockVehicle("VIN1")
+    vehicle.get_status.return_value = {"basicVehicleStatus": {}}
+    hass = DummyHass()
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    coordinator.request_stats = MagicMock()
+    coordinator.request_stats.async_inc_request = AsyncMock()
+    coordinator._async_save_snapshot = MagicMock()
+    coordinator.async_save_session = MagicMock()
+
+    try:
+        coordinator.data = await coordinator._async_update_data()
+        coordinator.async_update_listeners()
+
+        profile = coordinator.poll_profiler.last.as_dict()
+        assert set(profile["phases_ms"]) == {"vehicle_list", "vehicles", "notify"}
+        assert profile["vehicles"][0]["vin"] == "VIN1"
+        assert {"status_ms", "sub_fetch_ms", "merge_ms"} <= set(profile["vehicles"][0])
+        # Vehicle list, status and five sub-fetches
+        assert profile["calls"] == 7
+        assert profile["errors"] == 0
+        assert profile["queue_wait_ms"] >= 0
+        assert profile["duration_ms"] >= profile["phases_ms"]["vehicles"]
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
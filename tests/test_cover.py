@@ -1,7 +1,8 @@
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock
 import pytest
 from custom_components.zeekr_ev.cover import ZeekrSunshade, ZeekrWindows, ZeekrWindow, async_setup_entry
 from custom_components.zeekr_ev.const import DOMAIN
+from tests.conftest import FakeCoordinator
 
 
 class MockVehicle:
@@ -12,22 +13,9 @@ class MockVehicle:
         return True
 
 
-class MockCoordinator:
-    def __init__(self, data):
-        self.data = data
-        self.vehicles = {}
-        self.seat_duration = 15
-        self.ac_duration = 15
-        self.async_inc_invoke = AsyncMock()
-
-    def get_vehicle_by_vin(self, vin):
-        return self.vehicles.get(vin)
-
-    def inc_invoke(self):
-        pass
-
-    async def async_request_refresh(self):
-        pass
+class MockCoordinator(FakeCoordinator):
+    seat_duration = 15
+    ac_duration = 15
 
 
 @pytest.mark.asyncio
@@ -57,7 +45,6 @@ async def test_sunshade_optimistic_update(hass):
     climate_status = coordinator.data[vin]["additionalVehicleStatus"]["climateStatus"]
     assert climate_status["curtainOpenStatus"] == "2"
     assert climate_status["curtainPos"] == 100
-    sunshade.async_write_ha_state.assert_called()
 
     # Test close
     await sunshade.async_close_cover()
@@ -65,7 +52,6 @@ async def test_sunshade_optimistic_update(hass):
     climate_status = coordinator.data[vin]["additionalVehicleStatus"]["climateStatus"]
     assert climate_status["curtainOpenStatus"] == "1"
     assert climate_status["curtainPos"] == 0
-    sunshade.async_write_ha_state.assert_called()
 
 
 @pytest.mark.asyncio
@@ -153,7 +139,6 @@ async def test_windows_optimistic_update(hass):
     assert climate_status["winPosDriver"] == 100
     assert windows.is_closed is False
     assert windows.current_cover_position == 100
-    windows.async_write_ha_state.assert_called()
 
     # Test Close
     await windows.async_close_cover()
@@ -163,7 +148,6 @@ async def test_windows_optimistic_update(hass):
     assert climate_status["winPosDriver"] == 0
     assert windows.is_closed is True
     assert windows.current_cover_position == 0
-    windows.async_write_ha_state.assert_called()
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,35 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from custom_components.zeekr_ev.datetime import ZeekrDepartureTime
+
+
+pytestmark = pytest.mark.usefixtures("call_later")
+
+
+def test_native_value_from_travel_plan(plan_coordinator):
+    departure = ZeekrDepartureTime(plan_coordinator, "VIN1")
+    assert departure.native_value == datetime.fromtimestamp(1700000000, tz=timezone.utc)
+
+    plan_coordinator.data["VIN1"]["travelPlan"]["scheduledTime"] = ""
+    assert departure.native_value is None
+
+
+@pytest.mark.asyncio
+async def test_set_value_writes_travel_plan(plan_coordinator):
+    departure = ZeekrDepartureTime(plan_coordinator, "VIN1")
+    vehicle = plan_coordinator.get_vehicle_by_vin.return_value
+    value = datetime(2027, 1, 15, 7, 30, tzinfo=timezone.utc)
+
+    await departure.async_set_value(value)
+
+    # Shown before the plan is written
+    assert departure.native_value == value
+    assert plan_coordinator.data["VIN1"]["travelPlan"]["scheduledTime"] == "1700000000000"
+    plan_coordinator.async_call_api.assert_not_awaited()
+
+    await plan_coordinator.write_debouncer.async_flush()
+    plan_coordinator.async_call_api.assert_awaited_once_with(
+        vehicle.set_travel_plan, "start", "", str(int(value.timestamp() * 1000)), True, False
+    )
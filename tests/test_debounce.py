@@ -0,0 +1,56 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from custom_components.zeekr_ev.debounce import ZeekrWriteDebouncer
+
+
+@pytest.mark.asyncio
+async def test_only_settled_changes_are_written(hass, call_later):
+    debouncer = ZeekrWriteDebouncer(hass, 2)
+    write = AsyncMock()
+
+    debouncer.async_schedule("VIN1", "charge_plan", {"startTime": "01:00"}, write)
+    debouncer.async_schedule("VIN1", "charge_plan", {"startTime": "02:00"}, write)
+    debouncer.async_schedule("VIN1", "charge_plan", {"endTime": "07:00"}, write)
+    assert debouncer.get_pending("VIN1", "charge_plan") == {
+        "startTime": "02:00",
+        "endTime": "07:00",
+    }
+
+    # Every change restarts the delay
+    assert call_later.call_count == 3
+    assert call_later.call_args[0][1] == 2
+    assert [cancel.call_count for cancel in call_later.cancels] == [1, 1, 0]
+
+    await call_later.call_args[0][2]()
+    write.assert_awaited_once_with({"startTime": "02:00", "endTime": "07:00"})
+    assert debouncer.requests == 3
+    assert debouncer.writes == 1
+    assert debouncer.get_pending("VIN1", "charge_plan") == {}
+
+
+@pytest.mark.asyncio
+async def test_targets_are_debounced_separately(hass, call_later):
+    debouncer = ZeekrWriteDebouncer(hass, 2)
+    limit_write = AsyncMock()
+    plan_write = AsyncMock()
+
+    debouncer.async_schedule("VIN1", "charging_limit", {"soc": 800}, limit_write)
+    debouncer.async_schedule("VIN1", "charge_plan", {"startTime": "01:00"}, plan_write)
+    debouncer.async_schedule("VIN2", "charging_limit", {"soc": 900}, limit_write)
+
+    await debouncer.async_flush()
+    plan_write.assert_awaited_once_with({"startTime": "01:00"})
+    assert limit_write.await_count == 2
+    assert debouncer.writes == 3
+
+
+@pytest.mark.asyncio
+async def test_write_error_is_logged(hass, call_later, caplog):
+    debouncer = ZeekrWriteDebouncer(hass, 2)
+    debouncer.async_schedule(
+        "VIN1", "charging_limit", {"soc": 800}, AsyncMock(side_effect=Exception("API Error"))
+    )
+    await call_later.call_args[0][2]()
+    assert "Error writing charging_limit for VIN1: API Error" in caplog.text
@@ -1,10 +1,19 @@
 from custom_components.zeekr_ev.device_tracker import ZeekrDeviceTracker
+from custom_components.zeekr_ev.fields import FIELDS
 
 
 class DummyCoordinator:
     def __init__(self, data):
         self.data = data
 
+    def get_field_value(self, vin, field):
+        if isinstance(field, str):
+            field = FIELDS[field]
+        return field.extract(self.data.get(vin))
+
+    def async_invalidate_fields(self, vin):
+        pass
+
 
 def test_latitude_longitude_parsing():
     data = {
@@ -0,0 +1,90 @@
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.zeekr_ev.breaker import ZeekrCircuitBreakers
+from custom_components.zeekr_ev.const import DOMAIN
+from custom_components.zeekr_ev.diagnostics import (
+    async_get_config_entry_diagnostics,
+    get_payload_sizes,
+    get_shape,
+)
+from custom_components.zeekr_ev.profiling import ZeekrPollProfiler
+from custom_components.zeekr_ev.request_stats import get_stats_service
+
+
+def test_get_shape():
+    assert get_shape({"a": {"b": 1, "c": "x"}, "d": [{"e": 1.5}], "f": [], "g": None}) == {
+        "a": {"b": "int", "c": "str"},
+        "d": [{"e": "float"}],
+        "f": [],
+        "g": "NoneType",
+    }
+
+
+def test_get_payload_sizes():
+    sizes = get_payload_sizes({"small": 1, "large": {"key": "value"}})
+    assert list(sizes["sections"]) == ["large", "small"]
+    assert sizes["sections"] == {"large": 16, "small": 1}
+    assert sizes["bytes"] == 39
+    assert get_payload_sizes(None) == {"bytes": 0, "sections": {}}
+
+
+@pytest.mark.asyncio
+async def test_config_entry_diagnostics(hass):
+    coordinator = MagicMock()
+    coordinator.data = {
+        "VIN1": {"basicVehicleStatus": {"position": {"latitude": "52.1"}}},
+        "VIN2": {"basicVehicleStatus": {}},
+    }
+    coordinator.stale_endpoints = {"VIN2": {"status"}}
+    fetched = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    coordinator.get_endpoint_fetched_at = (
+        lambda vin, endpoint: fetched if endpoint == "charge_plan" else None
+    )
+    coordinator.is_restored = lambda vin: vin == "VIN2"
+    coordinator.poll_profiler = ZeekrPollProfiler()
+    with coordinator.poll_profiler.cycle() as profile:
+        profile.add_phase("status", 0.5, "VIN2")
+    coordinator.breakers = ZeekrCircuitBreakers()
+    coordinator.breakers.get("VIN1", "charge_plan").failures = 1
+    with patch("custom_components.zeekr_ev.request_stats.ZeekrStatsStore"):
+        coordinator.request_stats = get_stats_service(hass).get_stats("entry_1")
+    coordinator.budget.as_dict.return_value = {"daily_limit": 1000}
+    coordinator.transport.as_dict.return_value = {"transport": "executor"}
+    coordinator.confirmations.pending = []
+    entry = MagicMock(entry_id="entry_1", data={"username": "me", "password": "secret", "polling_interval": 5})
+    hass.data[DOMAIN] = {"entry_1": coordinator}
+
+    entities = [MagicMock(domain="sensor"), MagicMock(domain="sensor"), MagicMock(domain="lock")]
+    with patch("custom_components.zeekr_ev.diagnostics.er.async_get"), patch(
+        "custom_components.zeekr_ev.diagnostics.er.async_entries_for_config_entry",
+        return_value=entities,
+    ):
+        diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["entry"]["data"] == {
+        "username": "**REDACTED**",
+        "password": "**REDACTED**",
+        "polling_interval": 5,
+    }
+    # VINs and values don't leave the integration
+    assert "VIN1" not in str(diagnostics)
+    assert "52.1" not in str(diagnostics)
+    vehicle = diagnostics["vehicles"]["vehicle_1"]
+    assert vehicle["shape"] == {"basicVehicleStatus": {"position": {"latitude": "str"}}}
+    assert vehicle["payload"]["sections"]["basicVehicleStatus"] > 0
+    assert diagnostics["vehicles"]["vehicle_2"]["restored"] is True
+    assert diagnostics["vehicles"]["vehicle_2"]["stale_endpoints"] == ["status"]
+    assert vehicle["fetched_at"]["charge_plan"] == fetched.isoformat()
+    assert vehicle["fetched_at"]["charging_status"] is None
+    assert diagnostics["total_bytes"] > vehicle["payload"]["bytes"]
+    assert diagnostics["entities"] == {"lock": 1, "sensor": 2}
+    (cycle,) = diagnostics["poll_cycles"]
+    assert cycle["vehicles"] == [{"vehicle": "vehicle_2", "status_ms": 500.0}]
+    assert list(diagnostics["circuit_breakers"]) == ["vehicle_1"]
+    assert diagnostics["request_stats"]["api_requests_today"] == 0
+    assert len(diagnostics["request_stats"]["hourly"]) == 24
+    assert diagnostics["request_stats"]["last_30_days"]["requests"] == 0
+    assert diagnostics["budget"] == {"daily_limit": 1000}
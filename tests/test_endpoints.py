@@ -0,0 +1,70 @@
+from custom_components.zeekr_ev.endpoints import (
+    ENDPOINT_CHARGE_PLAN,
+    ENDPOINT_CHARGING_STATUS,
+    ENDPOINT_REMOTE_CONTROL_STATE,
+    SUB_ENDPOINTS_BY_KEY,
+    TIER_SLOW,
+    get_call_endpoint,
+)
+
+
+def test_merge_nested_path():
+    data = {"additionalVehicleStatus": {"climateStatus": {}}}
+    SUB_ENDPOINTS_BY_KEY[ENDPOINT_REMOTE_CONTROL_STATE].merge(data, {"vstdModeState": "1"})
+    assert data["additionalVehicleStatus"]["remoteControlState"] == {"vstdModeState": "1"}
+    assert "climateStatus" in data["additionalVehicleStatus"]
+
+
+def test_merge_update_existing():
+    data = {"chargingStatus": {"chargeVoltage": "230"}}
+    SUB_ENDPOINTS_BY_KEY[ENDPOINT_CHARGING_STATUS].merge(data, {"chargeCurrent": "16"})
+    assert data["chargingStatus"] == {"chargeVoltage": "230", "chargeCurrent": "16"}
+
+
+def test_merge_copies_result():
+    """Optimistic writes into the snapshot must not alter the cached result."""
+    result = {"command": "start"}
+    data = {}
+    endpoint = SUB_ENDPOINTS_BY_KEY[ENDPOINT_CHARGE_PLAN]
+    endpoint.merge(data, result)
+    data["chargePlan"]["command"] = "stop"
+    assert result["command"] == "start"
+    assert endpoint.tier == TIER_SLOW
+
+
+def test_skip_rules():
+    unplugged = {"additionalVehicleStatus": {"electricVehicleStatus": {"statusOfChargerConnection": "0"}}}
+    plugged = {"additionalVehicleStatus": {"electricVehicleStatus": {"statusOfChargerConnection": "1"}}}
+    charging = SUB_ENDPOINTS_BY_KEY[ENDPOINT_CHARGING_STATUS]
+    assert charging.should_skip(unplugged)
+    assert not charging.should_skip(plugged)
+    assert not charging.should_skip({})
+    # Sections the API sends as null
+    assert not charging.should_skip({"additionalVehicleStatus": None})
+    assert not charging.should_skip({"additionalVehicleStatus": {"electricVehicleStatus": None}})
+
+    remote = SUB_ENDPOINTS_BY_KEY[ENDPOINT_REMOTE_CONTROL_STATE]
+    assert remote.should_skip({"basicVehicleStatus": {"usageMode": "0"}})
+    assert not remote.should_skip({"basicVehicleStatus": {"usageMode": "1"}})
+    assert not SUB_ENDPOINTS_BY_KEY[ENDPOINT_CHARGE_PLAN].should_skip(unplugged)
+
+
+def test_call_endpoint_names():
+    class Vehicle:
+        def get_status(self):
+            pass
+
+        def get_charge_plan(self):
+            pass
+
+        def do_remote_control(self, command, service_id, setting):
+            pass
+
+        def set_charge_plan(self, *args):
+            pass
+
+    vehicle = Vehicle()
+    assert get_call_endpoint(vehicle.get_status, ()) == "status"
+    assert get_call_endpoint(vehicle.get_charge_plan, ()) == ENDPOINT_CHARGE_PLAN
+    assert get_call_endpoint(vehicle.do_remote_control, ("start", "RDL", {})) == "invoke_RDL"
+    assert get_call_endpoint(vehicle.set_charge_plan, ()) == "set_charge_plan"
@@ -0,0 +1,60 @@
+from custom_components.zeekr_ev.fields import FIELDS, ZeekrField, lock_field
+
+
+def test_extract_nested_value():
+    data = {"additionalVehicleStatus": {"electricVehicleStatus": {"chargeLevel": "80"}}}
+    assert FIELDS["battery_level"].extract(data) == "80"
+    assert FIELDS["battery_level"].extract({}) is None
+    assert FIELDS["battery_level"].extract(None) is None
+
+
+def test_extract_parses_and_applies_default():
+    status = {"additionalVehicleStatus": {"electricVehicleStatus": {"chargerState": "2"}}}
+    assert FIELDS["charging_status"].extract(status) is True
+    # A missing chargerState counts as not charging
+    assert FIELDS["charging_status"].extract({}) is False
+    # Other parsed fields stay unknown when missing
+    assert FIELDS["door_open_driver"].extract({}) is None
+
+
+def test_extract_unparsable_value_is_none():
+    data = {"additionalVehicleStatus": {"climateStatus": {"interiorTemp": "n/a"}}}
+    assert FIELDS["interior_temp_value"].extract(data) is None
+    assert FIELDS["interior_temp"].extract(data) == "n/a"
+    # A non-dict where a section is expected is treated as missing
+    assert FIELDS["interior_temp"].extract({"additionalVehicleStatus": "oops"}) is None
+
+
+def test_converted_fields():
+    data = {
+        "chargingLimit": {"soc": "800"},
+        "additionalVehicleStatus": {"climateStatus": {"updateTime": "1763418526287"}},
+    }
+    assert FIELDS["charging_limit"].extract(data) == 80.0
+    assert (
+        FIELDS["climate_updated"].extract(data).isoformat()
+        == "2025-11-17T22:28:46.287000+00:00"
+    )
+    assert FIELDS["climate_updated"].extract({}) is None
+
+
+def test_field_section():
+    assert FIELDS["battery_level"].section == "electricVehicleStatus"
+    assert FIELDS["latitude"].section == "basicVehicleStatus"
+    assert FIELDS["charge_power"].section == "chargingStatus"
+    assert ZeekrField("plan", ("chargePlan", "command")).section == "chargePlan"
+
+
+def test_lock_field_parsers():
+    lid = lock_field("chargeLidDcAcStatus", "electricVehicleStatus")
+    assert lid.extract(
+        {"additionalVehicleStatus": {"electricVehicleStatus": {"chargeLidDcAcStatus": "2"}}}
+    ) is True
+    assert lid.extract(
+        {"additionalVehicleStatus": {"electricVehicleStatus": {"chargeLidDcAcStatus": "3"}}}
+    ) is None
+    hood = lock_field("engineHoodOpenStatus")
+    assert hood.extract(
+        {"additionalVehicleStatus": {"drivingSafetyStatus": {"engineHoodOpenStatus": "0"}}}
+    ) is True
+    assert FIELDS["lock_centralLockingStatus"] == lock_field("centralLockingStatus")
@@ -1,5 +1,15 @@
+import json
+
 import pytest
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component import plugins
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
 from custom_components.zeekr_ev import async_setup_entry
+from custom_components.zeekr_ev.const import DOMAIN
+
+# Entry setup, reload and unload run against a real Home Assistant
+hass = plugins.hass
 
 
 class DummyEntry:
@@ -16,3 +26,88 @@ async def test_async_setup_entry_missing_credentials(hass):
     entry = DummyEntry(data={})
     res = await async_setup_entry(hass, entry)
     assert res is False
+
+
+@pytest.mark.asyncio
+async def test_reload_on_option_change(hass, enable_custom_integrations, mock_zeekr_client):
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"username": "user", "password": "secret", "per_vehicle_coordinators": True},
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    old = hass.data[DOMAIN][entry.entry_id]
+    assert old.vehicle_coordinators
+
+    # Not a live option, so the entry is reloaded
+    hass.config_entries.async_update_entry(entry, data={**entry.data, "api_workers": 2})
+    await hass.async_block_till_done()
+    new = hass.data[DOMAIN][entry.entry_id]
+    assert new is not old
+    assert len(entry.update_listeners) == 1
+    assert old._unsub_reset is None
+    for child in old.vehicle_coordinators.values():
+        assert child._shutdown_requested
+        assert child._unsub_refresh is None
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert not entry.update_listeners
+    assert new._unsub_reset is None
+
+
+@pytest.mark.asyncio
+async def test_unload_sends_pending_writes(hass, enable_custom_integrations, mock_zeekr_client):
+    entry = MockConfigEntry(domain=DOMAIN, data={"username": "user", "password": "secret"})
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    (vehicle,) = mock_zeekr_client[0].vehicles
+
+    entity_id = er.async_get(hass).async_get_entity_id("number", DOMAIN, "VIN1_charging_limit")
+    await hass.services.async_call(
+        "number", "set_value", {"entity_id": entity_id, "value": 70}, blocking=True
+    )
+    assert coordinator.write_debouncer.get_pending("VIN1", "charging_limit")
+    assert not vehicle.calls
+
+    # Unloaded before the write delay has passed
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert len(vehicle.calls) == 1
+    assert coordinator.write_debouncer.writes == 1
+
+
+@pytest.mark.asyncio
+async def test_session_reused_without_password(
+    hass, hass_storage, enable_custom_integrations, mock_zeekr_client
+):
+    entry = MockConfigEntry(domain=DOMAIN, data={"username": "user", "password": "secret"})
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert mock_zeekr_client[0].logins == 1
+
+    # Unloading writes the session saved after the login
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    stored = hass_storage[f"{DOMAIN}_session_{entry.entry_id}"]["data"]
+    assert stored["username"] == "user"
+    assert stored["session"]["bearer_token"] == "Bearer token"
+    assert "password" not in stored["session"]
+    assert "secret" not in json.dumps(stored)
+
+    # The next setup logs in with the saved tokens
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    client = mock_zeekr_client[1]
+    assert client.logins == 0
+    assert client.logged_in
+    assert client.bearer_token == "Bearer token"
+    # The password comes from the config entry
+    assert client.password == "secret"
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
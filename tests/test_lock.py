@@ -1,7 +1,8 @@
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import ANY, MagicMock
 import pytest
 from custom_components.zeekr_ev.lock import ZeekrLock, async_setup_entry
 from custom_components.zeekr_ev.const import DOMAIN
+from tests.conftest import FakeCoordinator
 
 
 class MockVehicle:
@@ -12,22 +13,6 @@ class MockVehicle:
         return True
 
 
-class MockCoordinator:
-    def __init__(self, data):
-        self.data = data
-        self.vehicles = {}
-        self.async_inc_invoke = AsyncMock()
-
-    def get_vehicle_by_vin(self, vin):
-        return self.vehicles.get(vin)
-
-    def inc_invoke(self):
-        pass
-
-    async def async_request_refresh(self):
-        pass
-
-
 class DummyConfig:
     def __init__(self):
         self.config_dir = "/tmp/dummy_config_dir"
@@ -50,15 +35,10 @@ class DummyHass:
             task.close()
 
 
-class DummyCoordinator:
-    def __init__(self, data):
-        self.data = data
-
-
 # Keeping existing tests...
 def test_is_locked_none_when_missing():
     data = {"VIN1": {"additionalVehicleStatus": {"drivingSafetyStatus": {}}}}
-    coordinator = DummyCoordinator(data)
+    coordinator = FakeCoordinator(data)
     lk = ZeekrLock(coordinator, "VIN1", "doorLockStatusDriver", "Driver door lock", "drivingSafetyStatus")
     assert lk.is_locked is None
 
@@ -66,24 +46,24 @@ def test_is_locked_none_when_missing():
 def test_is_locked_openstatus_logic():
     # For fields ending with OpenStatus: "1" -> open -> locked False
     data_open = {"VIN1": {"additionalVehicleStatus": {"drivingSafetyStatus": {"trunkOpenStatus": "1"}}}}
-    coordinator = DummyCoordinator(data_open)
+    coordinator = FakeCoordinator(data_open)
     lk = ZeekrLock(coordinator, "VIN1", "trunkOpenStatus", "Trunk open", "drivingSafetyStatus")
     assert lk.is_locked is False
 
     data_closed = {"VIN1": {"additionalVehicleStatus": {"drivingSafetyStatus": {"trunkOpenStatus": "0"}}}}
-    coordinator = DummyCoordinator(data_closed)
+    coordinator = FakeCoordinator(data_closed)
     lk = ZeekrLock(coordinator, "VIN1", "trunkOpenStatus", "Trunk open", "drivingSafetyStatus")
     assert lk.is_locked is True
 
 
 def test_is_locked_regular_field():
     data_locked = {"VIN1": {"additionalVehicleStatus": {"drivingSafetyStatus": {"doorLockStatusDriver": "1"}}}}
-    coordinator = DummyCoordinator(data_locked)
+    coordinator = FakeCoordinator(data_locked)
     lk = ZeekrLock(coordinator, "VIN1", "doorLockStatusDriver", "Driver door lock", "drivingSafetyStatus")
     assert lk.is_locked is True
 
     data_unlocked = {"VIN1": {"additionalVehicleStatus": {"drivingSafetyStatus": {"doorLockStatusDriver": "0"}}}}
-    coordinator = DummyCoordinator(data_unlocked)
+    coordinator = FakeCoordinator(data_unlocked)
     lk = ZeekrLock(coordinator, "VIN1", "doorLockStatusDriver", "Driver door lock", "drivingSafetyStatus")
     assert lk.is_locked is False
 
@@ -91,12 +71,12 @@ def test_is_locked_regular_field():
 def test_is_locked_charge_lid_logic():
     # "1" = Open (Unlocked), "2" = Closed (Locked)
     data_open = {"VIN1": {"additionalVehicleStatus": {"electricVehicleStatus": {"chargeLidDcAcStatus": "1"}}}}
-    coordinator = DummyCoordinator(data_open)
+    coordinator = FakeCoordinator(data_open)
     lk = ZeekrLock(coordinator, "VIN1", "chargeLidDcAcStatus", "Charge Lid", "electricVehicleStatus")
     assert lk.is_locked is False
 
     data_closed = {"VIN1": {"additionalVehicleStatus": {"electricVehicleStatus": {"chargeLidDcAcStatus": "2"}}}}
-    coordinator = DummyCoordinator(data_closed)
+    coordinator = FakeCoordinator(data_closed)
     lk = ZeekrLock(coordinator, "VIN1", "chargeLidDcAcStatus", "Charge Lid", "electricVehicleStatus")
     assert lk.is_locked is True
 
@@ -115,7 +95,7 @@ async def test_lock_optimistic_update_central_locking():
         }
     }
 
-    coordinator = MockCoordinator(initial_data)
+    coordinator = FakeCoordinator(initial_data)
     coordinator.vehicles[vin] = MockVehicle(vin)
 
     lock = ZeekrLock(coordinator, vin, "centralLockingStatus", "Central locking", "drivingSafetyStatus")
@@ -127,14 +107,15 @@ async def test_lock_optimistic_update_central_locking():
 
     status = coordinator.data[vin]["additionalVehicleStatus"]["drivingSafetyStatus"]
     assert status["centralLockingStatus"] == "1"
-    lock.async_write_ha_state.assert_called()
+    coordinator.async_request_vehicle_refresh.assert_called_once_with(vin, delay=15, expect=ANY)
+    expect = coordinator.async_request_vehicle_refresh.call_args.kwargs["expect"]
+    assert expect(coordinator.data[vin])
 
     # Test Unlock
     await lock.async_unlock()
 
     status = coordinator.data[vin]["additionalVehicleStatus"]["drivingSafetyStatus"]
     assert status["centralLockingStatus"] == "0"
-    lock.async_write_ha_state.assert_called()
 
 
 @pytest.mark.asyncio
@@ -150,7 +131,7 @@ async def test_lock_optimistic_update_charge_lid():
         }
     }
 
-    coordinator = MockCoordinator(initial_data)
+    coordinator = FakeCoordinator(initial_data)
     coordinator.vehicles[vin] = MockVehicle(vin)
 
     lock = ZeekrLock(coordinator, vin, "chargeLidDcAcStatus", "Charge Lid", "electricVehicleStatus")
@@ -162,19 +143,17 @@ async def test_lock_optimistic_update_charge_lid():
 
     status = coordinator.data[vin]["additionalVehicleStatus"]["electricVehicleStatus"]
     assert status["chargeLidDcAcStatus"] == "2"  # Closed/Locked
-    lock.async_write_ha_state.assert_called()
 
     # Test Unlock (Open)
     await lock.async_unlock()
 
     status = coordinator.data[vin]["additionalVehicleStatus"]["electricVehicleStatus"]
     assert status["chargeLidDcAcStatus"] == "1"  # Open/Unlocked
-    lock.async_write_ha_state.assert_called()
 
 
 @pytest.mark.asyncio
 async def test_lock_no_vehicle(hass):
-    coordinator = MockCoordinator({"VIN1": {}})
+    coordinator = FakeCoordinator({"VIN1": {}})
     lock = ZeekrLock(coordinator, "VIN1", "centralLockingStatus", "Label", "drivingSafetyStatus")
 
     # Should safely return
@@ -184,14 +163,14 @@ async def test_lock_no_vehicle(hass):
 
 @pytest.mark.asyncio
 async def test_lock_device_info(hass):
-    coordinator = MockCoordinator({"VIN1": {}})
+    coordinator = FakeCoordinator({"VIN1": {}})
     lock = ZeekrLock(coordinator, "VIN1", "field", "Label", "cat")
     assert lock.device_info["identifiers"] == {(DOMAIN, "VIN1")}
 
 
 @pytest.mark.asyncio
 async def test_lock_async_setup_entry(hass, mock_config_entry):
-    coordinator = MockCoordinator({"VIN1": {}})
+    coordinator = FakeCoordinator({"VIN1": {}})
     hass.data[DOMAIN] = {mock_config_entry.entry_id: coordinator}
 
     async_add_entities = MagicMock()
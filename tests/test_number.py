@@ -1,6 +1,7 @@
 from unittest.mock import MagicMock, AsyncMock
 import pytest
 from custom_components.zeekr_ev.number import ZeekrChargingLimitNumber, ZeekrConfigNumber
+from tests.conftest import FakeCoordinator
 
 
 class MockVehicle:
@@ -9,19 +10,22 @@ class MockVehicle:
         self.do_remote_control = MagicMock()
 
 
-class MockCoordinator:
+class MockCoordinator(FakeCoordinator):
+    seat_duration = 15
+
     def __init__(self, vehicles):
-        self.vehicles = vehicles
-        self.data = {v.vin: {} for v in vehicles}
-        self.async_inc_invoke = AsyncMock()
+        super().__init__({v.vin: {} for v in vehicles})
+        self.vehicles = {v.vin: v for v in vehicles}
         self.async_request_refresh = AsyncMock()
-        self.seat_duration = 15
+        self.pending_writes = []
+
+    def async_debounce_write(self, vin, target, changes, write):
+        self.pending_writes.append((target, changes, write))
 
-    def get_vehicle_by_vin(self, vin):
-        for v in self.vehicles:
-            if v.vin == vin:
-                return v
-        return None
+    async def async_flush_writes(self):
+        while self.pending_writes:
+            _, changes, write = self.pending_writes.pop(0)
+            await write(changes)
 
 
 class DummyConfig:
@@ -51,9 +55,13 @@ async def test_charging_limit_number():
     number_entity.hass = DummyHass()
     number_entity.async_write_ha_state = MagicMock()
 
-    # Test setting value 80%
+    # Test setting value 80%: shown straight away, sent once it settles
     await number_entity.async_set_native_value(80.0)
+    assert number_entity.native_value == 80.0
+    vehicle.do_remote_control.assert_not_called()
+    assert coordinator.pending_writes[0][:2] == ("charging_limit", {"soc": 800})
 
+    await coordinator.async_flush_writes()
     coordinator.async_inc_invoke.assert_called_once()
     vehicle.do_remote_control.assert_called_with(
         "start",
@@ -76,6 +84,9 @@ async def test_charging_limit_number():
         }
     )
 
+    # The cached charging limit must be re-fetched on the next poll
+    coordinator.async_request_vehicle_refresh.assert_called_once_with(vin, "charging_limit")
+
     # Check optimistic update
     assert number_entity.native_value == 80.0
     number_entity.async_write_ha_state.assert_called()
@@ -0,0 +1,87 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.zeekr_ev.overlay import ZeekrOptimisticOverlay, get_path, set_path
+
+LOCK = ("additionalVehicleStatus", "drivingSafetyStatus", "centralLockingStatus")
+
+
+def status(locked):
+    return {
+        "additionalVehicleStatus": {"drivingSafetyStatus": {"centralLockingStatus": locked}},
+        "chargePlan": {"startTime": "01:00"},
+    }
+
+
+def test_set_path_copies_only_the_path():
+    data = status("0")
+    new = set_path(data, LOCK, "1")
+    assert get_path(new, LOCK) == "1"
+    assert get_path(data, LOCK) == "0"
+    assert new["chargePlan"] is data["chargePlan"]
+    assert set_path({}, ("chargePlan", "endTime"), "06:00") == {"chargePlan": {"endTime": "06:00"}}
+
+
+@pytest.mark.asyncio
+async def test_value_shown_until_confirmed(hass, call_later):
+    overlay = ZeekrOptimisticOverlay(hass, MagicMock())
+    overlay.async_set("VIN1", {LOCK: "1"})
+
+    # A poll that still has the old state doesn't flip it back
+    old = status("0")
+    assert get_path(overlay.apply("VIN1", old), LOCK) == "1"
+    assert get_path(old, LOCK) == "0"
+    assert overlay.get_values("VIN1") == {LOCK: "1"}
+
+    # Dropped once the vehicle reports it, numbers matching strings
+    confirmed = status(1)
+    assert overlay.apply("VIN1", confirmed) is confirmed
+    assert overlay.get_values("VIN1") == {}
+    assert overlay.confirmed == 1
+    call_later.cancels[-1].assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_value_expires(hass, call_later):
+    on_expire = MagicMock()
+    overlay = ZeekrOptimisticOverlay(hass, on_expire, ttl=60)
+    overlay.async_set("VIN1", {LOCK: "1"})
+    assert call_later.call_args[0][1] == pytest.approx(60, abs=1)
+
+    with patch.object(hass.loop, "time", return_value=hass.loop.time() + 60):
+        call_later.call_args[0][2]()
+    on_expire.assert_called_once_with("VIN1")
+    assert overlay.get_values("VIN1") == {}
+    assert overlay.expired == 1
+    # Nothing left to wake up for
+    assert call_later.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_discard_and_missing_data(hass, call_later):
+    overlay = ZeekrOptimisticOverlay(hass, MagicMock())
+    overlay.async_set("VIN1", {LOCK: "1"})
+
+    # Nothing is laid over a vehicle without data
+    assert overlay.apply("VIN1", None) is None
+    assert overlay.async_discard("VIN1") is True
+    assert overlay.async_discard("VIN1") is False
+    assert overlay.apply("VIN1", status("0")) == status("0")
+
+
+@pytest.mark.asyncio
+async def test_discard_only_the_given_values(hass, call_later):
+    start = ("chargePlan", "startTime")
+    overlay = ZeekrOptimisticOverlay(hass, MagicMock())
+    overlay.async_set("VIN1", {LOCK: "1", start: "02:00"})
+    overlay.async_set("VIN1", {start: "03:00"})
+
+    # The start time was set again since, so only the lock goes
+    assert overlay.async_discard("VIN1", {LOCK: "1", start: "02:00"}) is True
+    assert overlay.get_values("VIN1") == {start: "03:00"}
+    call_later.cancels[-1].assert_not_called()
+
+    assert overlay.async_discard("VIN1", {start: "03:00"}) is True
+    assert overlay.get_values("VIN1") == {}
+    call_later.cancels[-1].assert_called_once()
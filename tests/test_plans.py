@@ -0,0 +1,87 @@
+import pytest
+
+from custom_components.zeekr_ev.endpoints import ENDPOINT_CHARGE_PLAN, ENDPOINT_TRAVEL_PLAN
+from custom_components.zeekr_ev.plans import ZeekrPlanEditor
+
+
+pytestmark = pytest.mark.usefixtures("call_later")
+
+
+@pytest.mark.asyncio
+async def test_edits_close_together_are_written_once(plan_coordinator):
+    editor = ZeekrPlanEditor(plan_coordinator)
+    vehicle = plan_coordinator.get_vehicle_by_vin.return_value
+
+    editor.async_edit("VIN1", ENDPOINT_CHARGE_PLAN, {"startTime": "02:00"})
+    editor.async_edit("VIN1", ENDPOINT_CHARGE_PLAN, {"command": "start"})
+
+    # Shown at once, without touching the data read from the vehicle
+    assert plan_coordinator.get_vehicle_data("VIN1")["chargePlan"]["startTime"] == "02:00"
+    assert plan_coordinator.data["VIN1"]["chargePlan"]["startTime"] == "01:00"
+    assert editor.get_plan("VIN1", ENDPOINT_CHARGE_PLAN)["command"] == "start"
+    plan_coordinator.async_call_api.assert_not_awaited()
+
+    await plan_coordinator.write_debouncer.async_flush()
+    plan_coordinator.async_call_api.assert_awaited_once_with(
+        vehicle.set_charge_plan, "02:00", "06:00", "start", False, False
+    )
+    plan_coordinator.async_inc_invoke.assert_awaited_once()
+    plan_coordinator.async_request_vehicle_refresh.assert_called_once_with("VIN1", ENDPOINT_CHARGE_PLAN)
+
+
+@pytest.mark.asyncio
+async def test_consecutive_writes_keep_earlier_edits(plan_coordinator):
+    editor = ZeekrPlanEditor(plan_coordinator)
+    vehicle = plan_coordinator.get_vehicle_by_vin.return_value
+
+    editor.async_edit("VIN1", ENDPOINT_CHARGE_PLAN, {"startTime": "02:00"})
+    await plan_coordinator.write_debouncer.async_flush()
+    # The vehicle still reports the old plan when the next edit is written
+    editor.async_edit("VIN1", ENDPOINT_CHARGE_PLAN, {"endTime": "07:00"})
+    await plan_coordinator.write_debouncer.async_flush()
+
+    assert plan_coordinator.async_call_api.await_args_list[-1].args == (
+        vehicle.set_charge_plan, "02:00", "07:00", "stop", False, False
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_plan_includes_pending_edits(plan_coordinator):
+    editor = ZeekrPlanEditor(plan_coordinator)
+
+    editor.async_edit("VIN1", ENDPOINT_CHARGE_PLAN, {"endTime": "07:00"})
+    # A poll replaces the data before the edit is written
+    plan_coordinator.data = {"VIN1": {"chargePlan": {"startTime": "01:00", "endTime": "06:00"}}}
+
+    assert editor.get_plan("VIN1", ENDPOINT_CHARGE_PLAN) == {
+        "startTime": "01:00",
+        "endTime": "07:00",
+    }
+
+
+@pytest.mark.asyncio
+async def test_apply_writes_pending_edits_now(plan_coordinator, call_later):
+    editor = ZeekrPlanEditor(plan_coordinator)
+    vehicle = plan_coordinator.get_vehicle_by_vin.return_value
+
+    editor.async_edit("VIN1", ENDPOINT_TRAVEL_PLAN, {"ac": "false"})
+    await editor.async_apply(
+        "VIN1", ENDPOINT_TRAVEL_PLAN, {"scheduledTime": "1800000000000", "bw": "1"}
+    )
+
+    # The timer of the debounced write, scheduled after the overlay's
+    call_later.cancels[1].assert_called_once()
+    plan_coordinator.async_call_api.assert_awaited_once_with(
+        vehicle.set_travel_plan, "start", "", "1800000000000", False, True
+    )
+    assert plan_coordinator.write_debouncer.get_pending("VIN1", ENDPOINT_TRAVEL_PLAN) == {}
+
+
+@pytest.mark.asyncio
+async def test_apply_raises_write_errors(plan_coordinator):
+    editor = ZeekrPlanEditor(plan_coordinator)
+    plan_coordinator.async_call_api.side_effect = Exception("boom")
+
+    with pytest.raises(Exception, match="boom"):
+        await editor.async_apply("VIN1", ENDPOINT_CHARGE_PLAN, {"command": "start"})
+    plan_coordinator.async_request_vehicle_refresh.assert_not_called()
@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+from custom_components.zeekr_ev.profiling import (
+    PHASE_NOTIFY,
+    PHASE_STATUS,
+    PHASE_VEHICLES,
+    ZeekrPollProfiler,
+    profile_phase,
+    record_api_call,
+)
+
+
+@pytest.mark.asyncio
+async def test_cycle_collects_phases_and_calls():
+    profiler = ZeekrPollProfiler(size=2)
+
+    async def fetch(vin):
+        with profile_phase(PHASE_STATUS, vin):
+            record_api_call(0.25, 1.0, False)
+
+    with profiler.cycle() as profile:
+        with profile_phase(PHASE_VEHICLES):
+            # Tasks started within the cycle count towards it
+            await asyncio.gather(fetch("VIN1"), fetch("VIN2"))
+        record_api_call(None, None, True)
+
+    assert profile.duration is not None
+    assert set(profile.vehicles) == {"VIN1", "VIN2"}
+    assert PHASE_STATUS in profile.vehicles["VIN1"]
+    data = profile.as_dict()
+    assert data["calls"] == 3
+    assert data["errors"] == 1
+    assert data["queue_wait_ms"] == 500.0
+    assert data["network_ms"] == 2000.0
+    assert PHASE_VEHICLES in data["phases_ms"]
+    assert data["vehicles"][0]["vin"] == "VIN1"
+    assert "status_ms" in data["vehicles"][0]
+
+    # Outside a cycle nothing is recorded
+    record_api_call(1.0, 1.0, False)
+    with profile_phase(PHASE_STATUS, "VIN1"):
+        pass
+    assert profile.calls == 3
+
+
+def test_notify_added_to_last_cycle_once():
+    profiler = ZeekrPollProfiler(size=2)
+    assert profiler.last is None
+    for _ in range(3):
+        with profiler.cycle():
+            pass
+    assert len(profiler.as_list()) == 2
+
+    profiler.record_notify(0.01)
+    profiler.record_notify(0.5)
+    assert profiler.last.phases == {PHASE_NOTIFY: 0.01}
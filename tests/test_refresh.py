@@ -0,0 +1,70 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from custom_components.zeekr_ev.refresh import ZeekrRefreshBroker
+
+
+@pytest.mark.asyncio
+async def test_requests_in_window_share_one_refresh(hass, call_later):
+    flush = AsyncMock()
+    broker = ZeekrRefreshBroker(hass, flush)
+
+    broker.async_request("VIN1")
+    broker.async_request("VIN1", "charge_plan")
+    broker.async_request("VIN2", "travel_plan")
+    assert broker.requests == 3
+    assert call_later.call_count == 1
+
+    await call_later.call_args[0][2]()
+
+    flush.assert_awaited_once_with({"VIN1": {"charge_plan"}, "VIN2": {"travel_plan"}})
+    assert broker.flushes == 1
+    assert broker.pending == {}
+
+
+@pytest.mark.asyncio
+async def test_longest_delay_wins(hass, call_later):
+    flush = AsyncMock()
+    broker = ZeekrRefreshBroker(hass, flush)
+
+    broker.async_request("VIN1")
+    first_cancel = call_later.cancels[0]
+
+    # A lock command needs 15s before its state can be read back, so the
+    # earlier request waits for it instead of refreshing twice
+    broker.async_request("VIN1", delay=15)
+    first_cancel.assert_called_once()
+    assert call_later.call_args[0][1] == 15
+
+    # A shorter request is covered by the refresh already scheduled
+    broker.async_request("VIN2")
+    assert call_later.call_count == 2
+
+    await call_later.call_args[0][2]()
+    flush.assert_awaited_once_with({"VIN1": set(), "VIN2": set()})
+
+
+@pytest.mark.asyncio
+async def test_empty_flush_is_skipped(hass, call_later):
+    flush = AsyncMock()
+    broker = ZeekrRefreshBroker(hass, flush)
+
+    broker.async_request("VIN1")
+    action = call_later.call_args[0][2]
+    await action()
+    await action()
+
+    assert flush.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_shutdown_cancels_pending_refresh(hass, call_later):
+    flush = AsyncMock()
+    broker = ZeekrRefreshBroker(hass, flush)
+
+    broker.async_request("VIN1", delay=10)
+    broker.async_shutdown()
+
+    call_later.cancels[-1].assert_called_once()
+    assert broker.pending == {}
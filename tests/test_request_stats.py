@@ -2,12 +2,21 @@ import pytest
 from unittest.mock import MagicMock, patch, AsyncMock
 from datetime import datetime, timedelta
 
-from custom_components.zeekr_ev.request_stats import ZeekrRequestStats
+from custom_components.zeekr_ev.request_stats import (
+    HISTORY_HOURS,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+    ZeekrStatsService,
+    ZeekrStatsStore,
+    ZeekrUsageHistory,
+    get_response_size,
+    get_stats_service,
+)
 
 
 @pytest.fixture
 def mock_store(hass):
-    with patch("custom_components.zeekr_ev.request_stats.Store") as mock_store_cls:
+    with patch("custom_components.zeekr_ev.request_stats.ZeekrStatsStore") as mock_store_cls:
         mock_store_instance = MagicMock()
         mock_store_instance.async_load = AsyncMock()
         mock_store_instance.async_save = AsyncMock()
@@ -17,41 +26,41 @@ def mock_store(hass):
 
 @pytest.mark.asyncio
 async def test_request_stats_init(hass, mock_store):
-    stats = ZeekrRequestStats(hass)
+    stats = get_stats_service(hass).get_stats("entry_1")
     assert stats.api_requests_today == 0
     assert stats.api_invokes_today == 0
-    assert stats._loaded is False
+    assert stats.loaded is False
 
 
 @pytest.mark.asyncio
 async def test_request_stats_load_existing(hass, mock_store):
-    mock_store.async_load.return_value = {
+    mock_store.async_load.return_value = {"entries": {"entry_1": {
         'api_requests_today': 10,
         'api_invokes_today': 5,
         'api_requests_total': 100,
         'api_invokes_total': 50,
         'last_reset': str(datetime.now().date())
-    }
+    }}}
 
-    stats = ZeekrRequestStats(hass)
+    stats = get_stats_service(hass).get_stats("entry_1")
     await stats.async_load()
 
     assert stats.api_requests_today == 10
     assert stats.api_invokes_today == 5
     assert stats.api_requests_total == 100
-    assert stats._loaded is True
+    assert stats.loaded is True
 
 
 @pytest.mark.asyncio
 async def test_request_stats_load_reset_needed(hass, mock_store):
     yesterday = datetime.now().date() - timedelta(days=1)
-    mock_store.async_load.return_value = {
+    mock_store.async_load.return_value = {"entries": {"entry_1": {
         'api_requests_today': 10,
         'api_invokes_today': 5,
         'last_reset': str(yesterday)
-    }
+    }}}
 
-    stats = ZeekrRequestStats(hass)
+    stats = get_stats_service(hass).get_stats("entry_1")
     await stats.async_load()
 
     # Should have reset
@@ -69,14 +78,14 @@ async def test_inc_request(hass, mock_store):
     # Setup default return value for load to avoid MagicMock pollution
     mock_store.async_load.return_value = {}
 
-    stats = ZeekrRequestStats(hass)
+    stats = get_stats_service(hass).get_stats("entry_1")
     await stats.async_load()
 
     # Increment and check state
     await stats.async_inc_request()
     assert stats.api_requests_today == 1
     assert stats.api_requests_total == 1
-    assert stats._dirty is True
+    assert stats._service._dirty is True
     mock_store.async_save.assert_not_called()
 
     # Now, trigger shutdown and verify save
@@ -90,16 +99,217 @@ async def test_inc_invoke(hass, mock_store):
     # Setup default return value for load
     mock_store.async_load.return_value = {}
 
-    stats = ZeekrRequestStats(hass)
+    stats = get_stats_service(hass).get_stats("entry_1")
     await stats.async_load()
 
     # Increment and check state
     await stats.async_inc_invoke()
     assert stats.api_invokes_today == 1
     assert stats.api_invokes_total == 1
-    assert stats._dirty is True
+    assert stats._service._dirty is True
     mock_store.async_save.assert_not_called()
 
     # Now, trigger shutdown and verify save
     await stats.async_shutdown()
     mock_store.async_save.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_record_call_per_endpoint(hass, mock_store):
+    stats = get_stats_service(hass).get_stats("entry_1")
+    for duration in (0.1, 0.2, 0.3, 0.4, 3.0):
+        stats.record_call("status", duration)
+    stats.record_call("invoke_RDL", None, Exception("timeout"))
+    stats.record_call("invoke_RDL", 45.0, Exception("bad gateway"))
+
+    status = stats.endpoints_as_dict()["status"]
+    assert status["calls"] == 5
+    assert status["errors"] == 0
+    assert status["p50_ms"] == 300.0
+    assert status["p95_ms"] == 3000.0
+    assert status["histogram"]["<=0.25s"] == 2
+    assert status["histogram"]["<=5s"] == 1
+
+    invoke = stats.endpoints_as_dict()["invoke_RDL"]
+    assert invoke["calls"] == 2
+    assert invoke["errors"] == 2
+    assert invoke["last_error"] == "bad gateway"
+    assert invoke["histogram"][">30s"] == 1
+
+    assert stats.all_endpoints.calls == 7
+    assert stats.all_endpoints.errors == 2
+    # Not stored with the daily counters
+    assert "endpoints" not in stats.as_dict()
+    await stats.async_shutdown()
+
+
+def test_usage_history_buckets_per_hour():
+    history = ZeekrUsageHistory()
+    with patch.object(ZeekrUsageHistory, "current_hour", return_value=1000):
+        history.inc_requests()
+        history.record_call("status", False, 500)
+        history.inc_invokes()
+        history.record_call("invoke_RDL", True, 20)
+    with patch.object(ZeekrUsageHistory, "current_hour", return_value=1001):
+        history.inc_requests()
+        history.record_call("status", False, 700)
+
+        assert history.get_totals(1) == {
+            "requests": 1,
+            "invokes": 0,
+            "endpoints": {"status": {"calls": 1, "errors": 0, "bytes": 700}},
+        }
+        totals = history.get_totals(24)
+        assert totals["requests"] == 2
+        assert totals["endpoints"]["status"] == {"calls": 2, "errors": 0, "bytes": 1200}
+        assert totals["endpoints"]["invoke_RDL"]["errors"] == 1
+        hourly = history.get_hourly_requests(3)
+        assert list(hourly.values()) == [0, 2, 1]
+
+    # Hours older than 30 days are dropped once a new hour starts
+    with patch.object(ZeekrUsageHistory, "current_hour", return_value=1000 + HISTORY_HOURS):
+        history.inc_requests()
+    assert list(history.as_dict()) == ["1001", str(1000 + HISTORY_HOURS)]
+
+
+@pytest.mark.asyncio
+async def test_usage_history_saved_with_stats(hass, mock_store):
+    mock_store.async_load.return_value = {}
+    stats = get_stats_service(hass).get_stats("entry_1")
+    await stats.async_load()
+    hour = ZeekrUsageHistory.current_hour()
+
+    await stats.async_inc_request()
+    stats.record_call("status", 0.5, size=get_response_size({"a": 1}))
+    await stats.async_shutdown()
+    saved = mock_store.async_save.call_args[0][0]
+    assert saved["entries"]["entry_1"]["hourly"] == {
+        str(hour): {"requests": 1, "invokes": 0, "endpoints": {"status": [1, 0, 8]}}
+    }
+
+    mock_store.async_load.return_value = saved
+    restored = ZeekrStatsService(hass).get_stats("entry_1")
+    await restored.async_load()
+    assert restored.history.get_totals(24)["endpoints"]["status"]["bytes"] == 8
+
+
+@pytest.mark.asyncio
+async def test_entries_share_one_save(hass, mock_store):
+    mock_store.async_load.return_value = {}
+    service = get_stats_service(hass)
+    first = service.get_stats("entry_1")
+    second = service.get_stats("entry_2")
+    await first.async_load()
+    await second.async_load()
+    mock_store.async_load.assert_called_once()
+
+    with patch(
+        "custom_components.zeekr_ev.request_stats.async_call_later"
+    ) as mock_call_later:
+        await first.async_inc_request()
+        await second.async_inc_invoke()
+        first.record_call("status", 0.5)
+    # One save window for every change of every entry
+    mock_call_later.assert_called_once()
+
+    await service.async_save()
+    await first.async_shutdown()
+    await second.async_shutdown()
+    mock_store.async_save.assert_called_once()
+    entries = mock_store.async_save.call_args[0][0]["entries"]
+    assert entries["entry_1"]["api_requests_total"] == 1
+    assert entries["entry_2"]["api_invokes_total"] == 1
+    assert service.get_totals() == {
+        "api_requests_today": 1,
+        "api_invokes_today": 1,
+        "api_requests_total": 1,
+        "api_invokes_total": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_stats_kept_across_reload(hass, mock_store):
+    mock_store.async_load.return_value = {}
+    stats = get_stats_service(hass).get_stats("entry_1")
+    await stats.async_load()
+    await stats.async_inc_request()
+    await stats.async_shutdown()
+
+    # A reloaded entry counts on from the same stats without loading again
+    assert get_stats_service(hass).get_stats("entry_1") is stats
+    await stats.async_load()
+    assert stats.api_requests_total == 1
+    mock_store.async_load.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_stored_entries_kept_until_loaded(hass, mock_store):
+    today = str(datetime.now().date())
+    mock_store.async_load.return_value = {
+        "entries": {
+            "entry_1": {"api_requests_total": 7, "last_reset": today},
+            "entry_2": {"api_requests_total": 3, "last_reset": today},
+        }
+    }
+    service = get_stats_service(hass)
+    stats = service.get_stats("entry_1")
+    await stats.async_load()
+    assert stats.api_requests_total == 7
+
+    # Counts of an entry that isn't loaded yet are saved as they were
+    await stats.async_inc_request()
+    await stats.async_shutdown()
+    entries = mock_store.async_save.call_args[0][0]["entries"]
+    assert entries["entry_1"]["api_requests_total"] == 8
+    assert entries["entry_2"] == {"api_requests_total": 3, "last_reset": today}
+
+    # Until the entry is removed
+    with patch("custom_components.zeekr_ev.request_stats.async_call_later"):
+        await service.async_remove_entry("entry_2")
+    await service.async_save()
+    assert "entry_2" not in mock_store.async_save.call_args[0][0]["entries"]
+
+
+@pytest.mark.asyncio
+async def test_remove_entry_keeps_other_entries(hass, mock_store):
+    today = str(datetime.now().date())
+    mock_store.async_load.return_value = {
+        "entries": {
+            "entry_1": {"api_requests_total": 7, "last_reset": today},
+            "entry_2": {"api_requests_total": 3, "last_reset": today},
+        }
+    }
+    service = get_stats_service(hass)
+    # Removed before any entry loaded the store
+    with patch("custom_components.zeekr_ev.request_stats.async_call_later"):
+        await service.async_remove_entry("entry_2")
+    await service.async_save()
+    assert mock_store.async_save.call_args[0][0] == {
+        "entries": {"entry_1": {"api_requests_total": 7, "last_reset": today}}
+    }
+
+
+@pytest.mark.asyncio
+async def test_nothing_saved_before_load(hass, mock_store):
+    stats = get_stats_service(hass).get_stats("entry_1")
+    with patch("custom_components.zeekr_ev.request_stats.async_call_later"):
+        await stats.async_inc_request()
+    await stats.async_shutdown()
+    mock_store.async_save.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_store_migrates_to_entries():
+    hass = MagicMock()
+    hass.config_entries.async_entries.return_value = [
+        MagicMock(entry_id="entry_1"),
+        MagicMock(entry_id="entry_2"),
+    ]
+    store = ZeekrStatsStore(hass, STORAGE_VERSION, STORAGE_KEY)
+    old_data = {"api_requests_total": 100}
+    # The first entry keeps the counts of the old format
+    assert await store._async_migrate_func(1, 1, old_data) == {
+        "entries": {"entry_1": old_data}
+    }
+    hass.config_entries.async_entries.return_value = []
+    assert await store._async_migrate_func(1, 1, old_data) == {"entries": {}}
@@ -0,0 +1,131 @@
+from datetime import datetime, timedelta, timezone
+
+from custom_components.zeekr_ev.scheduler import (
+    MIN_TICK,
+    VEHICLE_STATE_ACTIVE,
+    VEHICLE_STATE_ASLEEP,
+    VEHICLE_STATE_PARKED,
+    ZeekrPollScheduler,
+    get_vehicle_state,
+)
+
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def make_scheduler():
+    return ZeekrPollScheduler(
+        base_interval=timedelta(minutes=5),
+        active_interval=timedelta(minutes=1),
+        sleep_interval=timedelta(minutes=30),
+    )
+
+
+def test_get_vehicle_state_charging():
+    data = {"additionalVehicleStatus": {"electricVehicleStatus": {"chargerState": "2"}}}
+    assert get_vehicle_state(data) == VEHICLE_STATE_ACTIVE
+    # The same states as the charging binary sensor, sent as numbers too
+    data = {"additionalVehicleStatus": {"electricVehicleStatus": {"chargerState": 15}}}
+    assert get_vehicle_state(data) == VEHICLE_STATE_ACTIVE
+    data = {"additionalVehicleStatus": {"electricVehicleStatus": {"chargerState": None}}}
+    assert get_vehicle_state(data) == VEHICLE_STATE_PARKED
+
+
+def test_get_vehicle_state_driving():
+    data = {"basicVehicleStatus": {"engineStatus": "engine-running", "usageMode": "13"}}
+    assert get_vehicle_state(data) == VEHICLE_STATE_ACTIVE
+
+
+def test_get_vehicle_state_deep_sleep():
+    data = {
+        "basicVehicleStatus": {"engineStatus": "engine-off", "usageMode": "0"},
+        "additionalVehicleStatus": {"electricVehicleStatus": {"chargerState": "0"}},
+    }
+    assert get_vehicle_state(data) == VEHICLE_STATE_ASLEEP
+
+
+def test_get_vehicle_state_parked_and_missing():
+    assert get_vehicle_state({"basicVehicleStatus": {"usageMode": "1"}}) == VEHICLE_STATE_PARKED
+    assert get_vehicle_state(None) == VEHICLE_STATE_PARKED
+    assert get_vehicle_state({}) == VEHICLE_STATE_PARKED
+
+
+def test_charging_while_asleep_is_active():
+    data = {
+        "basicVehicleStatus": {"usageMode": "0"},
+        "additionalVehicleStatus": {"electricVehicleStatus": {"chargerState": "1"}},
+    }
+    assert get_vehicle_state(data) == VEHICLE_STATE_ACTIVE
+
+
+def test_schedule_uses_state_interval():
+    scheduler = make_scheduler()
+    asleep = {"basicVehicleStatus": {"usageMode": "0"}}
+    charging = {"additionalVehicleStatus": {"electricVehicleStatus": {"chargerState": "2"}}}
+
+    assert scheduler.schedule("VIN1", asleep, NOW) == NOW + timedelta(minutes=30)
+    assert scheduler.schedule("VIN2", charging, NOW) == NOW + timedelta(minutes=1)
+    assert scheduler.schedule("VIN3", {}, NOW) == NOW + timedelta(minutes=5)
+    assert scheduler.states["VIN1"] == VEHICLE_STATE_ASLEEP
+
+
+def test_is_due_and_force():
+    scheduler = make_scheduler()
+    assert scheduler.is_due("VIN1", NOW)
+
+    scheduler.schedule("VIN1", {"basicVehicleStatus": {"usageMode": "0"}}, NOW)
+    assert not scheduler.is_due("VIN1", NOW + timedelta(minutes=29))
+    assert scheduler.is_due("VIN1", NOW + timedelta(minutes=30))
+
+    scheduler.force("VIN1")
+    assert scheduler.is_due("VIN1", NOW)
+
+    scheduler.schedule("VIN1", {}, NOW)
+    scheduler.schedule("VIN2", {}, NOW)
+    scheduler.force()
+    assert scheduler.is_due("VIN1", NOW)
+    assert scheduler.is_due("VIN2", NOW)
+
+
+def test_intervals_are_clamped_to_base():
+    scheduler = ZeekrPollScheduler(
+        base_interval=timedelta(minutes=5),
+        active_interval=timedelta(minutes=10),
+        sleep_interval=timedelta(minutes=1),
+    )
+    assert scheduler.active_interval == timedelta(minutes=5)
+    assert scheduler.sleep_interval == timedelta(minutes=5)
+
+
+def test_time_until_next_poll():
+    scheduler = make_scheduler()
+    assert scheduler.time_until_next_poll(NOW) == timedelta(minutes=5)
+
+    scheduler.schedule("VIN1", {"basicVehicleStatus": {"usageMode": "0"}}, NOW)
+    scheduler.schedule("VIN2", {}, NOW)
+    assert scheduler.time_until_next_poll(NOW) == timedelta(minutes=5)
+
+    # Overdue vehicles never make the coordinator spin
+    assert scheduler.time_until_next_poll(NOW + timedelta(hours=1)) == MIN_TICK
+
+
+def test_set_intervals_moves_scheduled_polls():
+    scheduler = make_scheduler()
+    scheduler.schedule("VIN1", {}, NOW)
+    scheduler.schedule("VIN2", {}, NOW)
+    scheduler.force("VIN2")
+
+    scheduler.set_intervals(timedelta(minutes=10), timedelta(minutes=1), timedelta(minutes=30))
+    assert scheduler.next_poll("VIN1") == NOW + timedelta(minutes=10)
+    # A forced poll stays due
+    assert scheduler.is_due("VIN2", NOW)
+
+
+def test_min_interval_slows_down_polls():
+    scheduler = make_scheduler()
+    charging = {"additionalVehicleStatus": {"electricVehicleStatus": {"chargerState": "2"}}}
+
+    scheduler.min_interval = timedelta(minutes=10)
+    assert scheduler.schedule("VIN1", charging, NOW) == NOW + timedelta(minutes=10)
+    assert scheduler.schedule("VIN2", {"basicVehicleStatus": {"usageMode": "0"}}, NOW) == (
+        NOW + timedelta(minutes=30)
+    )
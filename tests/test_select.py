@@ -0,0 +1,104 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.zeekr_ev.select import (
+    OPTION_LEVEL_2,
+    OPTION_LEVEL_3,
+    OPTION_OFF,
+    ZeekrSeatSelect,
+)
+from tests.conftest import FakeCoordinator
+
+
+def climate_status(**values):
+    return {"VIN1": {"additionalVehicleStatus": {"climateStatus": values}}}
+
+
+def make_vent(coordinator):
+    return ZeekrSeatSelect(
+        coordinator,
+        "VIN1",
+        "seat_vent_driver",
+        "Driver Seat Vent",
+        "SV.11",
+        "vent",
+        status_keys=["drvVentSts", "drvVentDetail"],
+    )
+
+
+def make_heat(coordinator):
+    return ZeekrSeatSelect(
+        coordinator,
+        "VIN1",
+        "seat_heat_driver",
+        "Driver Seat Heat",
+        "SH.11",
+        "heat",
+        status_keys=["drvHeatSts"],
+    )
+
+
+def test_current_option():
+    coordinator = FakeCoordinator(climate_status(drvHeatSts=3, drvVentSts=1, drvVentDetail=2))
+    assert make_heat(coordinator).current_option == OPTION_LEVEL_3
+    assert make_vent(coordinator).current_option == OPTION_LEVEL_2
+
+    # Vent detail only counts while the vent is on
+    coordinator = FakeCoordinator(climate_status(drvVentSts=2, drvVentDetail=2))
+    assert make_vent(coordinator).current_option == OPTION_OFF
+    assert make_heat(FakeCoordinator({"VIN1": {}})).current_option == OPTION_OFF
+
+
+@pytest.mark.asyncio
+async def test_select_level_shown_until_confirmed():
+    coordinator = FakeCoordinator(climate_status(drvVentSts=2, drvVentDetail=0))
+    vehicle = MagicMock()
+    coordinator.vehicles = {"VIN1": vehicle}
+    vent = make_vent(coordinator)
+
+    await vent.async_select_option(OPTION_LEVEL_2)
+
+    vehicle.do_remote_control.assert_called_once_with(
+        "start",
+        "ZAF",
+        {
+            "serviceParameters": [
+                {"key": "SV.11", "value": "true"},
+                {"key": "SV.11.level", "value": "2"},
+                {"key": "SV.11.duration", "value": "15"},
+            ]
+        },
+    )
+    assert vent.current_option == OPTION_LEVEL_2
+
+    # Polled until the vehicle reports the level
+    expect = coordinator.async_request_vehicle_refresh.call_args.kwargs["expect"]
+    assert expect(climate_status(drvVentSts=1, drvVentDetail=2)["VIN1"])
+    assert not expect(climate_status(drvVentSts=2, drvVentDetail=0)["VIN1"])
+
+
+@pytest.mark.asyncio
+async def test_select_off():
+    coordinator = FakeCoordinator(climate_status(drvHeatSts=2))
+    vehicle = MagicMock()
+    coordinator.vehicles = {"VIN1": vehicle}
+    heat = make_heat(coordinator)
+
+    await heat.async_select_option(OPTION_OFF)
+
+    vehicle.do_remote_control.assert_called_once_with(
+        "start", "ZAF", {"serviceParameters": [{"key": "SH.11", "value": "false"}]}
+    )
+    assert heat.current_option == OPTION_OFF
+
+
+@pytest.mark.asyncio
+async def test_select_without_vehicle_does_nothing():
+    coordinator = FakeCoordinator(climate_status(drvHeatSts=2))
+    heat = make_heat(coordinator)
+
+    await heat.async_select_option(OPTION_OFF)
+
+    coordinator.async_request_vehicle_refresh.assert_not_called()
+    assert heat.current_option == OPTION_LEVEL_2
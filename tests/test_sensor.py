@@ -1,19 +1,27 @@
+from unittest.mock import patch
+
 from custom_components.zeekr_ev.sensor import (
+    ZeekrAPIBudgetSensor,
+    ZeekrAPILatencySensor,
+    ZeekrAPIStatSensor,
+    ZeekrAPIUsageSensor,
+    ZeekrLastPollSensor,
     ZeekrSensor,
     ZeekrAPIStatusSensor,
+    ZeekrAPITransportSensor,
     ZeekrVehicleStatusSensor,
     ZeekrEngineStatusSensor,
     ZeekrChargingTimeFormattedSensor,
+    ZeekrTireSensor,
 )
-
-
-class DummyCoordinator:
-    def __init__(self, data):
-        self.data = data
+from custom_components.zeekr_ev.fields import FIELDS
+from custom_components.zeekr_ev.profiling import ZeekrPollProfiler, record_api_call
+from custom_components.zeekr_ev.request_stats import get_stats_service
+from tests.conftest import FakeCoordinator
 
 
 def test_native_value_none_when_no_data():
-    coordinator = DummyCoordinator({})
+    coordinator = FakeCoordinator({})
     s = ZeekrSensor(coordinator, "VIN1", "battery_level", "Battery", lambda d: 1, "%")
     assert s.native_value is None
 
@@ -24,7 +32,7 @@ def test_native_value_returns_value():
             "additionalVehicleStatus": {"electricVehicleStatus": {"chargeLevel": 42}}
         }
     }
-    coordinator = DummyCoordinator(data)
+    coordinator = FakeCoordinator(data)
     s = ZeekrSensor(
         coordinator,
         "VIN1",
@@ -42,7 +50,7 @@ def test_charging_voltage_sensor():
             "chargingStatus": {"chargeVoltage": "222.0"}
         }
     }
-    coordinator = DummyCoordinator(data)
+    coordinator = FakeCoordinator(data)
     s = ZeekrSensor(
         coordinator,
         "VIN1",
@@ -60,7 +68,7 @@ def test_charging_current_sensor():
             "chargingStatus": {"chargeCurrent": "9.4"}
         }
     }
-    coordinator = DummyCoordinator(data)
+    coordinator = FakeCoordinator(data)
     s = ZeekrSensor(
         coordinator,
         "VIN1",
@@ -78,7 +86,7 @@ def test_charge_power_sensor():
             "chargingStatus": {"chargePower": "2.1"}
         }
     }
-    coordinator = DummyCoordinator(data)
+    coordinator = FakeCoordinator(data)
     s = ZeekrSensor(
         coordinator,
         "VIN1",
@@ -96,7 +104,7 @@ def test_charger_state_sensor():
             "chargingStatus": {"chargerState": "2"}
         }
     }
-    coordinator = DummyCoordinator(data)
+    coordinator = FakeCoordinator(data)
     s = ZeekrSensor(
         coordinator,
         "VIN1",
@@ -120,7 +128,7 @@ def test_tire_temp_sensors():
             }
         }
     }
-    coordinator = DummyCoordinator(data)
+    coordinator = FakeCoordinator(data)
 
     for tire, val in [("Driver", 20), ("Passenger", 21), ("DriverRear", 22), ("PassengerRear", 23)]:
         s = ZeekrSensor(
@@ -136,6 +144,26 @@ def test_tire_temp_sensors():
         assert s.native_value == val
 
 
+def test_tire_sensor_name_follows_drive_side():
+    data = {"VIN1": {"additionalVehicleStatus": {"maintenanceStatus": {"tyreStatusDriverRear": 250}}}}
+    coordinator = FakeCoordinator(data)
+    coordinator.drive_side = "lhd"
+    s = ZeekrTireSensor(
+        coordinator,
+        "VIN1",
+        "DriverRear",
+        "tire_pressure_driverrear",
+        "Tire Pressure",
+        FIELDS["tire_pressure_driverrear"],
+        "kPa",
+    )
+    assert s.name == "Tire Pressure DriverRear"
+    assert s.native_value == 250
+
+    coordinator.drive_side = "rhd"
+    assert s.name == "Tire Pressure PassengerRear"
+
+
 def test_window_sensors():
     data = {
         "VIN1": {
@@ -153,7 +181,7 @@ def test_window_sensors():
             }
         }
     }
-    coordinator = DummyCoordinator(data)
+    coordinator = FakeCoordinator(data)
 
     # Status
     for win, status in [("Driver", "2"), ("Passenger", "2"), ("DriverRear", "2"), ("PassengerRear", "2")]:
@@ -196,6 +224,9 @@ def test_vehicle_status_sensor():
         def __init__(self, data):
             self.data = data
 
+        def get_field_value(self, vin, field):
+            return FIELDS[field].extract(self.data.get(vin))
+
     coordinator = MockCoordinator(data)
     sensor = ZeekrVehicleStatusSensor(coordinator, "VIN1")
     assert sensor.native_value == "Ready to Go"
@@ -213,6 +244,9 @@ def test_vehicle_status_sensor_unknown_value():
         def __init__(self, data):
             self.data = data
 
+        def get_field_value(self, vin, field):
+            return FIELDS[field].extract(self.data.get(vin))
+
     coordinator = MockCoordinator(data)
     sensor = ZeekrVehicleStatusSensor(coordinator, "VIN1")
     assert sensor.native_value == "99"
@@ -224,6 +258,9 @@ def test_vehicle_status_sensor_no_data():
         def __init__(self, data):
             self.data = data
 
+        def get_field_value(self, vin, field):
+            return FIELDS[field].extract(self.data.get(vin))
+
     coordinator = MockCoordinator({})
     sensor = ZeekrVehicleStatusSensor(coordinator, "VIN1")
     assert sensor.native_value is None
@@ -241,6 +278,9 @@ def test_engine_status_sensor():
         def __init__(self, data):
             self.data = data
 
+        def get_field_value(self, vin, field):
+            return FIELDS[field].extract(self.data.get(vin))
+
     coordinator = MockCoordinator(data)
     sensor = ZeekrEngineStatusSensor(coordinator, "VIN1")
     assert sensor.native_value == "Driving"
@@ -258,6 +298,9 @@ def test_engine_status_sensor_unknown_value():
         def __init__(self, data):
             self.data = data
 
+        def get_field_value(self, vin, field):
+            return FIELDS[field].extract(self.data.get(vin))
+
     coordinator = MockCoordinator(data)
     sensor = ZeekrEngineStatusSensor(coordinator, "VIN1")
     assert sensor.native_value == "unknown-status"
@@ -277,6 +320,9 @@ def test_charging_time_formatted_sensor():
         def __init__(self, data):
             self.data = data
 
+        def get_field_value(self, vin, field):
+            return FIELDS[field].extract(self.data.get(vin))
+
     coordinator = MockCoordinator(data)
     sensor = ZeekrChargingTimeFormattedSensor(coordinator, "VIN1")
     # 173 minutes = 2h 53m
@@ -297,6 +343,9 @@ def test_charging_time_formatted_sensor_under_hour():
         def __init__(self, data):
             self.data = data
 
+        def get_field_value(self, vin, field):
+            return FIELDS[field].extract(self.data.get(vin))
+
     coordinator = MockCoordinator(data)
     sensor = ZeekrChargingTimeFormattedSensor(coordinator, "VIN1")
     assert sensor.native_value == "45m"
@@ -316,6 +365,9 @@ def test_charging_time_formatted_sensor_not_charging():
         def __init__(self, data):
             self.data = data
 
+        def get_field_value(self, vin, field):
+            return FIELDS[field].extract(self.data.get(vin))
+
     coordinator = MockCoordinator(data)
     sensor = ZeekrChargingTimeFormattedSensor(coordinator, "VIN1")
     assert sensor.native_value == "Not charging"
@@ -327,6 +379,9 @@ def test_charging_time_formatted_sensor_no_data():
         def __init__(self, data):
             self.data = data
 
+        def get_field_value(self, vin, field):
+            return FIELDS[field].extract(self.data.get(vin))
+
     coordinator = MockCoordinator({})
     sensor = ZeekrChargingTimeFormattedSensor(coordinator, "VIN1")
     assert sensor.native_value is None
@@ -364,3 +419,140 @@ def test_api_status_sensor_disconnected():
     coordinator = MockCoordinator()
     sensor = ZeekrAPIStatusSensor(coordinator, "entry_1")
     assert sensor.native_value == "Disconnected"
+
+
+def test_api_latency_sensor(hass):
+    class MockCoordinator:
+        def __init__(self):
+            with patch("custom_components.zeekr_ev.request_stats.ZeekrStatsStore"):
+                self.request_stats = get_stats_service(hass).get_stats("entry_1")
+
+    coordinator = MockCoordinator()
+    sensor = ZeekrAPILatencySensor(coordinator, "entry_1")
+    median = ZeekrAPILatencySensor(coordinator, "entry_1", 50)
+    assert sensor.native_value is None
+    assert median.unique_id == "entry_1_api_latency_p50"
+
+    with patch("custom_components.zeekr_ev.request_stats.async_call_later"):
+        coordinator.request_stats.record_call("status", 0.5)
+        coordinator.request_stats.record_call("charge_plan", 1.25)
+    assert sensor.native_value == 1250.0
+    assert median.native_value == 500.0
+    # Per endpoint figures are left to the diagnostics
+    assert sensor.extra_state_attributes is None
+
+
+def test_api_usage_sensor(hass):
+    class MockCoordinator:
+        def __init__(self):
+            with patch("custom_components.zeekr_ev.request_stats.ZeekrStatsStore"):
+                self.request_stats = get_stats_service(hass).get_stats("entry_1")
+
+    coordinator = MockCoordinator()
+    sensor = ZeekrAPIUsageSensor(
+        coordinator,
+        "entry_1",
+        "api_requests_last_24_hours",
+        "API Requests Last 24 Hours",
+        lambda totals: totals["requests"] + totals["invokes"],
+    )
+    assert sensor.native_value == 0
+
+    coordinator.request_stats.history.inc_requests()
+    coordinator.request_stats.history.inc_invokes()
+    coordinator.request_stats.history.record_call("status", False, 100)
+    assert sensor.native_value == 2
+    # The hourly buckets are left to the diagnostics
+    assert sensor.extra_state_attributes is None
+
+
+def test_api_stat_sensor_all_accounts(hass):
+    class MockCoordinator:
+        def __init__(self, entry_id):
+            self.hass = hass
+            with patch("custom_components.zeekr_ev.request_stats.ZeekrStatsStore"):
+                self.request_stats = get_stats_service(hass).get_stats(entry_id)
+            self.request_stats.loaded = True
+
+    first = MockCoordinator("entry_1")
+    second = MockCoordinator("entry_2")
+    first.request_stats.api_requests_total = 5
+    second.request_stats.api_requests_total = 2
+    sensor = ZeekrAPIStatSensor(
+        first, "entry_1", "api_requests_total", "API Requests Total",
+        lambda stats: stats.api_requests_total,
+    )
+    assert sensor.native_value == 5
+    assert sensor.extra_state_attributes == {"all_accounts": 7}
+
+    errors = ZeekrAPIStatSensor(
+        first, "entry_1", "api_errors", "API Errors", lambda stats: stats.all_endpoints.errors
+    )
+    assert errors.extra_state_attributes is None
+
+
+def test_last_poll_sensor():
+    class MockCoordinator:
+        poll_profiler = ZeekrPollProfiler()
+
+    coordinator = MockCoordinator()
+    sensor = ZeekrLastPollSensor(coordinator, "entry_1")
+    assert sensor.native_value is None
+    assert sensor.extra_state_attributes is None
+
+    with coordinator.poll_profiler.cycle() as profile:
+        record_api_call(0.1, 0.5, False)
+        profile.add_phase("status", 0.5, "VIN1")
+    profile.duration = 0.75
+    assert sensor.native_value == 750.0
+    attrs = sensor.extra_state_attributes
+    assert attrs["calls"] == 1
+    assert attrs["queue_wait_ms"] == 100.0
+    assert "vehicles" not in attrs
+
+
+def test_api_sensors_share_api_device():
+    class MockCoordinator:
+        client = None
+
+    coordinator = MockCoordinator()
+    sensors = [
+        ZeekrAPIStatusSensor(coordinator, "entry_1"),
+        ZeekrAPIStatSensor(coordinator, "entry_1", "api_requests_today", "API Requests Today", None),
+        ZeekrAPIBudgetSensor(coordinator, "entry_1"),
+        ZeekrAPILatencySensor(coordinator, "entry_1"),
+        ZeekrLastPollSensor(coordinator, "entry_1"),
+        ZeekrAPIUsageSensor(coordinator, "entry_1", "api_requests_last_24_hours", "Usage", None),
+        ZeekrAPITransportSensor(coordinator, "entry_1", "api_queue_depth", "Queue", None, None),
+    ]
+    assert [sensor.unique_id for sensor in sensors] == [
+        "entry_1_api_status",
+        "entry_1_api_requests_today",
+        "entry_1_api_projected_requests_today",
+        "entry_1_api_latency_p95",
+        "entry_1_last_poll_duration",
+        "entry_1_api_requests_last_24_hours",
+        "entry_1_api_queue_depth",
+    ]
+    for sensor in sensors:
+        assert sensor.device_info["identifiers"] == {("zeekr_ev", "entry_1")}
+        assert sensor.device_info["name"] == "Zeekr API"
+
+
+def test_restored_values_are_marked():
+    coordinator = FakeCoordinator({"VIN1": {"chargingStatus": {"chargeVoltage": "222.0"}}})
+    coordinator.restored.add("VIN1")
+    sensor = ZeekrSensor(
+        coordinator,
+        "VIN1",
+        "charge_voltage",
+        "Charge Voltage",
+        lambda d: d.get("chargingStatus", {}).get("chargeVoltage"),
+        "V",
+    )
+    assert sensor.native_value == "222.0"
+    assert sensor.extra_state_attributes == {"restored": True}
+
+    # Until the first poll after the restart
+    coordinator.restored.clear()
+    assert sensor.extra_state_attributes is None
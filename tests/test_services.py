@@ -0,0 +1,80 @@
+from datetime import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.core import ServiceCall
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.util import dt as dt_util
+
+from custom_components.zeekr_ev.const import DOMAIN
+from custom_components.zeekr_ev.coordinator import ZeekrCoordinator
+from custom_components.zeekr_ev.endpoints import ENDPOINT_CHARGE_PLAN
+from custom_components.zeekr_ev.services import (
+    SERVICE_SET_CHARGE_PLAN,
+    SERVICE_SET_TRAVEL_PLAN,
+    SET_CHARGE_PLAN_SCHEMA,
+    SET_TRAVEL_PLAN_SCHEMA,
+    async_setup_services,
+    get_charge_plan_changes,
+    get_travel_plan_changes,
+)
+
+
+def test_charge_plan_changes():
+    assert get_charge_plan_changes(
+        {"vin": "VIN1", "enabled": True, "start_time": time(23, 0), "bc_temp_active": True}
+    ) == {"command": "start", "startTime": "23:00", "bcTempActive": True}
+
+
+def test_travel_plan_changes():
+    departure = dt_util.parse_datetime("2024-01-01T07:00:00+00:00")
+    assert get_travel_plan_changes(
+        {"vin": "VIN1", "departure_time": departure, "ac": False, "steering_wheel_heating": True}
+    ) == {"scheduledTime": "1704092400000", "ac": "false", "bw": "1"}
+
+
+@pytest.fixture
+def coordinator(hass):
+    coordinator = MagicMock(spec=ZeekrCoordinator)
+    coordinator.plans = MagicMock()
+    coordinator.plans.async_apply = AsyncMock()
+    coordinator.get_vehicle_by_vin.side_effect = lambda vin: MagicMock() if vin == "VIN1" else None
+    hass.data[DOMAIN] = {"_temp_client": MagicMock(), "entry1": coordinator}
+    return coordinator
+
+
+async def call_service(hass, service, schema, data):
+    hass.services = MagicMock()
+    async_setup_services(hass)
+    handlers = {c[0][1]: c[0][2] for c in hass.services.async_register.call_args_list}
+    await handlers[service](ServiceCall(DOMAIN, service, schema(data)))
+
+
+@pytest.mark.asyncio
+async def test_set_charge_plan_writes_once(hass, coordinator):
+    await call_service(
+        hass,
+        SERVICE_SET_CHARGE_PLAN,
+        SET_CHARGE_PLAN_SCHEMA,
+        {"vin": "VIN1", "start_time": "22:30", "end_time": "06:15", "enabled": True},
+    )
+    coordinator.plans.async_apply.assert_awaited_once_with(
+        "VIN1",
+        ENDPOINT_CHARGE_PLAN,
+        {"command": "start", "startTime": "22:30", "endTime": "06:15"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_set_travel_plan_unknown_vin(hass, coordinator):
+    with pytest.raises(ServiceValidationError):
+        await call_service(
+            hass, SERVICE_SET_TRAVEL_PLAN, SET_TRAVEL_PLAN_SCHEMA, {"vin": "VIN9", "ac": True}
+        )
+    coordinator.plans.async_apply.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_set_travel_plan_without_changes(hass, coordinator):
+    await call_service(hass, SERVICE_SET_TRAVEL_PLAN, SET_TRAVEL_PLAN_SCHEMA, {"vin": "VIN1"})
+    coordinator.plans.async_apply.assert_not_awaited()
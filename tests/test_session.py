@@ -0,0 +1,72 @@
+import base64
+from datetime import datetime, timedelta, timezone
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.zeekr_ev.session import ZeekrSessionStore, get_token_expiry
+
+
+def make_token(exp):
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+    return f"Bearer header.{payload}.signature"
+
+
+def make_session_store(stored=None):
+    with patch("custom_components.zeekr_ev.session.Store") as store_cls:
+        store = store_cls.return_value
+        store.async_load = AsyncMock(return_value=stored)
+        session_store = ZeekrSessionStore(MagicMock(), "entry1")
+    assert store_cls.call_args.args[2] == "zeekr_ev_session_entry1"
+    assert store_cls.call_args.kwargs["private"] is True
+    return session_store, store
+
+
+def test_get_token_expiry():
+    assert get_token_expiry(make_token(1700000000)) == datetime.fromtimestamp(1700000000, tz=timezone.utc)
+    assert get_token_expiry("opaque-token") is None
+    assert get_token_expiry(None) is None
+    assert get_token_expiry("a.bm90IGpzb24.c") is None
+
+
+@pytest.mark.asyncio
+async def test_load_session():
+    future = (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
+    past = (datetime.now(timezone.utc) - timedelta(days=1)).isoformat()
+    session = {"username": "user", "bearer_token": "token"}
+
+    session_store, _ = make_session_store(
+        {"username": "user", "expires_at": future, "session": session}
+    )
+    assert await session_store.async_load("user") == session
+    assert await session_store.async_load("other") is None
+
+    session_store, _ = make_session_store(
+        {"username": "user", "expires_at": past, "session": session}
+    )
+    assert await session_store.async_load("user") is None
+
+    # Tokens without a readable expiry are tried until the API rejects them
+    session_store, _ = make_session_store(
+        {"username": "user", "expires_at": None, "session": session}
+    )
+    assert await session_store.async_load("user") == session
+
+    session_store, _ = make_session_store(None)
+    assert await session_store.async_load("user") is None
+
+
+def test_schedule_save_skips_password_and_unchanged_tokens():
+    session_store, store = make_session_store()
+    token = make_token(1700000000)
+    session = {"username": "user", "password": "secret", "bearer_token": token}
+
+    session_store.async_schedule_save(session)
+    session_store.async_schedule_save(dict(session))
+    session_store.async_schedule_save({"username": "user", "bearer_token": None})
+    assert store.async_delay_save.call_count == 1
+
+    data = store.async_delay_save.call_args.args[0]()
+    assert data["session"] == {"username": "user", "bearer_token": token}
+    assert data["expires_at"] == datetime.fromtimestamp(1700000000, tz=timezone.utc).isoformat()
@@ -0,0 +1,45 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.zeekr_ev.snapshot import SAVE_DELAY, ZeekrSnapshotStore
+
+
+def make_snapshot_store(stored=None):
+    with patch("custom_components.zeekr_ev.snapshot.Store") as store_cls:
+        store = store_cls.return_value
+        store.async_load = AsyncMock(return_value=stored)
+        snapshot = ZeekrSnapshotStore(MagicMock(), "entry1")
+    assert store_cls.call_args.args[2] == "zeekr_ev_snapshot_entry1"
+    assert store_cls.call_args.kwargs["private"] is True
+    return snapshot, store
+
+
+@pytest.mark.asyncio
+async def test_load_returns_vehicles_and_data():
+    stored = {
+        "vehicles": {"VIN1": {"plateNo": "AB-123"}},
+        "data": {"VIN1": {"basicVehicleStatus": {}}},
+    }
+    snapshot, _ = make_snapshot_store(stored)
+    assert await snapshot.async_load() == (stored["vehicles"], stored["data"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "stored",
+    [None, [], {"vehicles": {}, "data": {}}, {"vehicles": None, "data": {"VIN1": {}}}],
+)
+async def test_load_ignores_missing_or_bad_data(stored):
+    snapshot, _ = make_snapshot_store(stored)
+    assert await snapshot.async_load() is None
+
+
+def test_schedule_save_writes_latest_data():
+    snapshot, store = make_snapshot_store()
+    snapshot.async_schedule_save({"VIN1": {}}, {"VIN1": {"a": 1}})
+    snapshot.async_schedule_save({"VIN1": {}}, {"VIN1": {"a": 2}})
+    assert store.async_delay_save.call_count == 2
+    data_func, delay = store.async_delay_save.call_args.args
+    assert delay == SAVE_DELAY
+    assert data_func() == {"vehicles": {"VIN1": {}}, "data": {"VIN1": {"a": 2}}}
@@ -1,8 +1,9 @@
-from unittest.mock import MagicMock, AsyncMock, patch
+from unittest.mock import ANY, MagicMock
 import asyncio
 import pytest
 from custom_components.zeekr_ev.switch import ZeekrSwitch, async_setup_entry
 from custom_components.zeekr_ev.const import DOMAIN
+from tests.conftest import FakeCoordinator
 
 
 class MockVehicle:
@@ -13,21 +14,8 @@ class MockVehicle:
         return True
 
 
-class MockCoordinator:
-    def __init__(self, data):
-        self.data = data
-        self.vehicles = {}
-        self.async_inc_invoke = AsyncMock()
-        self.steering_wheel_duration = 15
-
-    def get_vehicle_by_vin(self, vin):
-        return self.vehicles.get(vin)
-
-    def inc_invoke(self):
-        pass
-
-    async def async_request_refresh(self):
-        pass
+class MockCoordinator(FakeCoordinator):
+    steering_wheel_duration = 15
 
 
 class DummyConfig:
@@ -77,14 +65,12 @@ async def test_switch_optimistic_update():
 
     climate_status = coordinator.data[vin]["additionalVehicleStatus"]["climateStatus"]
     assert climate_status["defrost"] == "1"
-    switch.async_write_ha_state.assert_called()
 
     # Test Turn Off
     await switch.async_turn_off()
 
     climate_status = coordinator.data[vin]["additionalVehicleStatus"]["climateStatus"]
     assert climate_status["defrost"] == "0"
-    switch.async_write_ha_state.assert_called()
 
 
 @pytest.mark.asyncio
@@ -159,10 +145,17 @@ async def test_charging_switch():
     coordinator.data[vin]["additionalVehicleStatus"]["electricVehicleStatus"]["chargerState"] = "26"
     assert switch.is_on is False
 
-    # Test Turn On
-    with patch("asyncio.sleep", new_callable=AsyncMock):
-        vehicle_mock.get_charging_status = MagicMock(return_value={"chargerState": "2"})
-        await switch.async_turn_on()
+    # Test Turn On: returns once accepted, confirmation is polled in the background
+    await switch.async_turn_on()
+    # Confirmed through the status, whose chargerState is shown optimistically
+    coordinator.async_request_vehicle_refresh.assert_called_once_with(
+        vin, delay=0, expect=ANY
+    )
+    expect = coordinator.async_request_vehicle_refresh.call_args.kwargs["expect"]
+    status = {"additionalVehicleStatus": {"electricVehicleStatus": {"chargerState": "2"}}}
+    assert expect(status)
+    status["additionalVehicleStatus"]["electricVehicleStatus"]["chargerState"] = "25"
+    assert not expect(status)
 
     vehicle_mock.do_remote_control.assert_called_with(
         "start",
@@ -179,7 +172,6 @@ async def test_charging_switch():
     # Optimistic update
     assert coordinator.data[vin]["additionalVehicleStatus"][
         "electricVehicleStatus"]["chargerState"] == "2"
-    switch.async_write_ha_state.assert_called()
 
     # Test Turn Off (Stop Charging)
     await switch.async_turn_off()
@@ -199,7 +191,6 @@ async def test_charging_switch():
     # Optimistic update
     assert coordinator.data[vin]["additionalVehicleStatus"][
         "electricVehicleStatus"]["chargerState"] == "25"
-    switch.async_write_ha_state.assert_called()
 
 
 @pytest.mark.asyncio
@@ -263,7 +254,6 @@ async def test_steering_wheel_switch():
     )
     # Optimistic update
     assert coordinator.data[vin]["additionalVehicleStatus"]["climateStatus"]["steerWhlHeatingSts"] == "1"
-    switch.async_write_ha_state.assert_called()
 
     # Test Turn Off
     await switch.async_turn_off()
@@ -282,7 +272,6 @@ async def test_steering_wheel_switch():
     )
     # Optimistic update
     assert coordinator.data[vin]["additionalVehicleStatus"]["climateStatus"]["steerWhlHeatingSts"] == "2"
-    switch.async_write_ha_state.assert_called()
 
 
 @pytest.mark.asyncio
@@ -339,7 +328,6 @@ async def test_sentry_mode_switch():
         )
         # Optimistic update
         assert coordinator.data[vin]["additionalVehicleStatus"]["remoteControlState"]["vstdModeState"] == "1"
-        switch.async_write_ha_state.assert_called()
 
         # Test Turn Off
         await switch.async_turn_off()
@@ -357,7 +345,6 @@ async def test_sentry_mode_switch():
         )
         # Optimistic update
         assert coordinator.data[vin]["additionalVehicleStatus"]["remoteControlState"]["vstdModeState"] == "0"
-        switch.async_write_ha_state.assert_called()
     finally:
         # Cleanup delayed refresh tasks scheduled during test
         for task in switch.hass._tasks:
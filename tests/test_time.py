@@ -0,0 +1,54 @@
+from datetime import time
+
+import pytest
+
+from custom_components.zeekr_ev.time import ZeekrChargeScheduleTime
+
+
+pytestmark = pytest.mark.usefixtures("call_later")
+
+
+def make_times(coordinator):
+    return (
+        ZeekrChargeScheduleTime(coordinator, "VIN1", "charge_start_time", "Charge Start Time", "startTime"),
+        ZeekrChargeScheduleTime(coordinator, "VIN1", "charge_end_time", "Charge End Time", "endTime"),
+    )
+
+
+def test_native_value_from_charge_plan(plan_coordinator):
+    start, end = make_times(plan_coordinator)
+    assert start.native_value == time(1, 0)
+    assert end.native_value == time(6, 0)
+
+    plan_coordinator.data["VIN1"]["chargePlan"]["startTime"] = "bad"
+    assert start.native_value is None
+
+
+@pytest.mark.asyncio
+async def test_start_and_end_edits_share_one_write(plan_coordinator):
+    start, end = make_times(plan_coordinator)
+    vehicle = plan_coordinator.get_vehicle_by_vin.return_value
+
+    await start.async_set_value(time(2, 30))
+    await end.async_set_value(time(7, 15))
+
+    # Shown before the plan is written
+    assert start.native_value == time(2, 30)
+    assert end.native_value == time(7, 15)
+    plan_coordinator.async_call_api.assert_not_awaited()
+
+    await plan_coordinator.write_debouncer.async_flush()
+    plan_coordinator.async_call_api.assert_awaited_once_with(
+        vehicle.set_charge_plan, "02:30", "07:15", "stop", False, False
+    )
+
+
+@pytest.mark.asyncio
+async def test_no_write_without_vehicle(plan_coordinator):
+    (start, _) = make_times(plan_coordinator)
+    plan_coordinator.get_vehicle_by_vin.return_value = None
+
+    await start.async_set_value(time(2, 30))
+
+    assert plan_coordinator.write_debouncer.get_pending("VIN1", "charge_plan") == {}
+    assert start.native_value == time(1, 0)
@@ -0,0 +1,317 @@
+import asyncio
+import json
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import pytest
+import requests
+
+from custom_components.zeekr_ev.transport import (
+    ZeekrAiohttpTransport,
+    ZeekrCallTiming,
+    ZeekrExecutorTransport,
+    ZeekrThreadPoolTransport,
+    create_transport,
+)
+
+
+def test_create_transport_defaults_to_thread_pool(hass, mock_config_entry):
+    transport = create_transport(hass, mock_config_entry)
+    assert isinstance(transport, ZeekrThreadPoolTransport)
+    assert transport.name == "thread_pool"
+    assert transport.max_workers == 4
+
+
+def test_create_transport_zero_workers_uses_executor(hass, mock_config_entry):
+    mock_config_entry.data = {**mock_config_entry.data, "api_workers": 0}
+    transport = create_transport(hass, mock_config_entry)
+    assert isinstance(transport, ZeekrExecutorTransport)
+    assert transport.name == "executor"
+
+
+@pytest.mark.asyncio
+async def test_executor_transport_runs_call(hass):
+    transport = ZeekrExecutorTransport(hass)
+    assert await transport.async_call(lambda a, b: a + b, 1, 2) == 3
+    assert transport.total_calls == 1
+    assert transport.queue_depth == 0
+    await transport.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_thread_pool_transport_runs_on_own_threads():
+    transport = ZeekrThreadPoolTransport(2)
+    try:
+        name = await transport.async_call(lambda: threading.current_thread().name)
+        assert name.startswith("zeekr_ev")
+        assert transport.total_calls == 1
+        assert transport.active_calls == 0
+        assert transport.queue_depth == 0
+        figures = transport.as_dict()
+        assert figures["transport"] == "thread_pool"
+        assert figures["max_workers"] == 2
+    finally:
+        await transport.async_shutdown()
+        transport._executor.shutdown(wait=True)
+
+
+@pytest.mark.asyncio
+async def test_thread_pool_transport_propagates_errors():
+    transport = ZeekrThreadPoolTransport(1)
+
+    def boom():
+        raise ValueError("API Error")
+
+    try:
+        with pytest.raises(ValueError):
+            await transport.async_call(boom)
+        assert transport.active_calls == 0
+    finally:
+        await transport.async_shutdown()
+        transport._executor.shutdown(wait=True)
+
+
+@pytest.mark.asyncio
+async def test_transport_reports_call_timing():
+    transport = ZeekrThreadPoolTransport(1)
+
+    def boom():
+        raise ValueError("API Error")
+
+    try:
+        timing = ZeekrCallTiming()
+        await transport.async_call(lambda: {"a": 1}, timing=timing)
+        assert timing.wait >= 0
+        assert timing.duration >= 0
+        assert timing.size == len('{"a": 1}')
+
+        # Also filled in when the call fails
+        timing = ZeekrCallTiming()
+        with pytest.raises(ValueError):
+            await transport.async_call(boom, timing=timing)
+        assert timing.duration is not None
+    finally:
+        await transport.async_shutdown()
+        transport._executor.shutdown(wait=True)
+
+
+def test_create_transport_aiohttp_option(hass, mock_config_entry):
+    mock_config_entry.data = {**mock_config_entry.data, "transport": "aiohttp"}
+    session = MagicMock()
+    with patch(
+        "custom_components.zeekr_ev.transport.async_get_clientsession", return_value=session
+    ), patch("custom_components.zeekr_ev.transport.get_api_module"):
+        transport = create_transport(hass, mock_config_entry, MagicMock())
+    assert isinstance(transport, ZeekrAiohttpTransport)
+    assert transport._session is session
+    # Calls it can't send itself run on the usual worker threads
+    assert isinstance(transport.fallback, ZeekrThreadPoolTransport)
+    assert transport.as_dict()["fallback"]["transport"] == "thread_pool"
+
+
+class ZeekrException(Exception):
+    pass
+
+
+class AuthException(ZeekrException):
+    pass
+
+
+def sign_request(request, secret):
+    """Sign like zeekr_app_sig, over what the server must receive unchanged."""
+    body = request.body or ""
+    request.headers["X-SIGNATURE"] = f"{secret}|{request.method}|{request.path_url}|{body}"
+    return request
+
+
+API_MODULES = {
+    "const": SimpleNamespace(
+        VEHICLESTATUS_URL="status/latest",
+        CHARGING_PLAN_URL="charge/getChargingPlan",
+        REMOTECONTROL_URL="remoteControl/control",
+        CHARGE_CONTROL_URL="charge/control",
+    ),
+    "zeekr_app_sig": SimpleNamespace(sign_request=sign_request),
+    "exceptions": SimpleNamespace(ZeekrException=ZeekrException, AuthException=AuthException),
+}
+
+
+class FakeApiClient:
+    """The parts of ZeekrClient the aiohttp transport signs requests with."""
+
+    def __init__(self, server_url):
+        self.session = requests.Session()
+        self.logged_in = True
+        self.bearer_token = "Bearer old"
+        self.logged_in_headers = {"authorization": "Bearer old", "X-APP-ID": "app"}
+        self.region_login_server = server_url
+        self.prod_secret = "secret"
+        self.timeout = (5, 5)
+        self.logins = 0
+
+    def _get_encrypted_vin(self, vin):
+        return f"encrypted-{vin}"
+
+    def login(self, relogin=False):
+        self.logins += 1
+        self.bearer_token = "Bearer new"
+        self.logged_in_headers["authorization"] = self.bearer_token
+
+    def get_vehicle_list(self):
+        return ["VIN1"]
+
+
+class FakeApiVehicle:
+    """A Vehicle whose requests must all be sent by the transport."""
+
+    def __init__(self, vin):
+        self.vin = vin
+
+    def get_status(self):
+        raise AssertionError("run blocking")
+
+    def get_charge_plan(self):
+        raise AssertionError("run blocking")
+
+    def do_remote_control(self, command, service_id, setting):
+        raise AssertionError("run blocking")
+
+
+class FakeZeekrServer:
+    """Local HTTP server answering like the Zeekr API gateway."""
+
+    def __init__(self):
+        self.requests = []
+        self.peers = set()
+        # Tokens the server rejects as expired
+        self.expired = set()
+        self.status = {"success": True, "data": {"basicVehicleStatus": {"usageMode": "1"}}}
+        self.charge_plan = {"success": False, "msg": "No plan"}
+        app = web.Application()
+        app.router.add_get("/status/latest", self._handle)
+        app.router.add_get("/charge/getChargingPlan", self._handle)
+        app.router.add_post("/remoteControl/control", self._handle)
+        app.router.add_post("/charge/control", self._handle)
+        self.server = TestServer(app)
+
+    async def _handle(self, request):
+        body = await request.text()
+        self.requests.append((request.method, request.path_qs, request.headers.copy(), body))
+        self.peers.add(request.transport.get_extra_info("peername"))
+        expected = f"secret|{request.method}|{request.path_qs}|{body}"
+        if request.headers.get("X-SIGNATURE") != expected:
+            return web.json_response({"success": False, "msg": "Bad signature"})
+        if request.headers.get("authorization") in self.expired:
+            return web.json_response({"success": False, "msg": "Token expired"})
+        if request.path == "/status/latest":
+            return web.json_response(self.status)
+        if request.path == "/charge/getChargingPlan":
+            return web.json_response(self.charge_plan)
+        return web.json_response({"success": True})
+
+
+@pytest.fixture
+async def zeekr_server(socket_enabled):
+    """Serve the fake API on localhost; tests otherwise may not open sockets."""
+    server = FakeZeekrServer()
+    await server.server.start_server()
+    yield server
+    await server.server.close()
+
+
+@pytest.fixture
+async def aiohttp_transport(zeekr_server):
+    client = FakeApiClient(f"{zeekr_server.server.make_url('/')}")
+    fallback = ZeekrThreadPoolTransport(1)
+    with patch(
+        "custom_components.zeekr_ev.transport.get_api_module",
+        side_effect=lambda client, name: API_MODULES[name],
+    ):
+        async with aiohttp.ClientSession() as session:
+            transport = ZeekrAiohttpTransport(client, session, fallback)
+            yield transport
+            await transport.async_shutdown()
+    fallback._executor.shutdown(wait=True)
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_transport_sends_signed_reads(aiohttp_transport, zeekr_server):
+    vehicle = FakeApiVehicle("VIN1")
+    timing = ZeekrCallTiming()
+
+    data = await aiohttp_transport.async_call(vehicle.get_status, timing=timing)
+    assert data == {"basicVehicleStatus": {"usageMode": "1"}}
+    method, path, headers, body = zeekr_server.requests[0]
+    assert (method, path, body) == ("GET", "/status/latest?latest=false&target=new", "")
+    assert headers["X-VIN"] == "encrypted-VIN1"
+    assert headers["authorization"] == "Bearer old"
+    assert headers["X-APP-ID"] == "app"
+    # Sent without a worker thread
+    assert timing.wait == 0.0
+    assert timing.duration > 0
+    assert timing.size == len(json.dumps(zeekr_server.status))
+
+    # A failed read the client tolerates gives no data; others raise
+    assert await aiohttp_transport.async_call(vehicle.get_charge_plan) == {}
+    zeekr_server.status = {"success": False}
+    with pytest.raises(ZeekrException):
+        await aiohttp_transport.async_call(vehicle.get_status)
+
+    # Every request went over the same kept-alive connection
+    assert len(zeekr_server.peers) == 1
+    assert aiohttp_transport.requests == 3
+    assert aiohttp_transport.total_calls == 3
+    assert aiohttp_transport.active_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_transport_sends_commands(aiohttp_transport, zeekr_server):
+    vehicle = FakeApiVehicle("VIN1")
+
+    assert await aiohttp_transport.async_call(
+        vehicle.do_remote_control, "start", "ZAF", {"serviceParameters": []}
+    )
+    assert await aiohttp_transport.async_call(
+        vehicle.do_remote_control, "start", "RCS", {"serviceParameters": []}
+    )
+    (first, second) = zeekr_server.requests
+    assert first[:2] == ("POST", "/remoteControl/control")
+    assert first[3] == '{"command":"start","serviceId":"ZAF","setting":{"serviceParameters":[]}}'
+    # Charging commands go to the charge endpoint
+    assert second[:2] == ("POST", "/charge/control")
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_transport_logs_in_again_when_token_expired(
+    aiohttp_transport, zeekr_server
+):
+    client = aiohttp_transport.client
+    zeekr_server.expired.add("Bearer old")
+
+    # Both requests are rejected, but only one of them logs in again
+    results = await asyncio.gather(
+        aiohttp_transport.async_call(FakeApiVehicle("VIN1").get_status),
+        aiohttp_transport.async_call(FakeApiVehicle("VIN2").get_status),
+    )
+    assert results == [zeekr_server.status["data"]] * 2
+    assert client.logins == 1
+    assert aiohttp_transport.token_refreshes == 1
+    assert zeekr_server.requests[-1][2]["authorization"] == "Bearer new"
+
+    # Still rejected after logging in again
+    zeekr_server.expired.add("Bearer new")
+    with pytest.raises(AuthException):
+        await aiohttp_transport.async_call(FakeApiVehicle("VIN1").get_status)
+    assert client.logins == 2
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_transport_runs_other_calls_blocking(aiohttp_transport, zeekr_server):
+    client = aiohttp_transport.client
+    assert await aiohttp_transport.async_call(client.get_vehicle_list) == ["VIN1"]
+    assert not zeekr_server.requests
+    assert aiohttp_transport.total_calls == 1